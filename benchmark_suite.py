@@ -0,0 +1,133 @@
+import argparse
+import random
+import time
+import tracemalloc
+
+from sorted_containers import CONTAINERS
+from workloads import random_keys, sorted_keys, zipf_keys
+
+# (structure, workload) pairs that degrade to O(n^2) and are skipped above this size
+QUADRATIC = {("bst", "sorted"), ("hash", "mixed")}
+QUADRATIC_LIMIT = 20000
+
+
+def as_keys(numbers):
+    """Zero-padded strings, so every structure (including the hash table) sees the same keys."""
+    return [f"{k:08d}" for k in numbers]
+
+
+def build_ops(workload, n, seed=0):
+    """
+    Return (keys to insert, operations to time) for a workload.
+
+    Each operation is (method name, key). The build phase is timed too, as
+    the "insert" phase of the report.
+    """
+    rng = random.Random(seed)
+    if workload == "random":
+        keys = as_keys(random_keys(n, seed))
+        ops = [("contains", k) for k in as_keys(random_keys(n, seed + 1))]
+    elif workload == "sorted":
+        keys = as_keys(sorted_keys(n))
+        ops = [("contains", k) for k in keys]
+    elif workload == "zipfian":
+        keys = as_keys(random_keys(n, seed))
+        ops = [("contains", k) for k in as_keys(zipf_keys(n, n, seed=seed))]
+    elif workload == "mixed":
+        # Half the keys are loaded up front; the rest arrive during the run
+        universe = as_keys(random_keys(n, seed))
+        keys = universe[: n // 2]
+        ops = []
+        for _ in range(n):
+            r = rng.random()
+            key = rng.choice(universe)
+            if r < 0.7:
+                ops.append(("contains", key))
+            elif r < 0.8:
+                ops.append(("successor", key))
+            elif r < 0.9:
+                ops.append(("insert", key))
+            else:
+                ops.append(("delete", key))
+    else:
+        raise ValueError(f"Unknown workload {workload!r}")
+    return keys, ops
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def run_phase(container, ops):
+    """
+    Run (method, key) operations and return per-operation latencies in nanoseconds.
+    """
+    latencies = []
+    clock = time.perf_counter_ns
+    for method, key in ops:
+        fn = getattr(container, method)
+        start = clock()
+        fn(key)
+        latencies.append(clock() - start)
+    return latencies
+
+
+def summarize(latencies):
+    latencies.sort()
+    total = sum(latencies) or 1
+    return {
+        "ops_per_sec": len(latencies) / (total / 1e9),
+        "p50_us": percentile(latencies, 0.50) / 1000,
+        "p99_us": percentile(latencies, 0.99) / 1000,
+        "p999_us": percentile(latencies, 0.999) / 1000,
+    }
+
+
+def measure_memory(name, keys):
+    """Peak bytes allocated while building the structure from `keys`."""
+    tracemalloc.start()
+    container = CONTAINERS[name](len(keys))
+    for key in keys:
+        container.insert(key)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def benchmark(name, workload, n, memory=True):
+    keys, ops = build_ops(workload, n)
+    container = CONTAINERS[name](n)
+    build = summarize(run_phase(container, [("insert", k) for k in keys]))
+    query = summarize(run_phase(container, ops))
+    result = {"build": build, "query": query}
+    if memory:
+        result["memory_mb"] = measure_memory(name, keys) / 2 ** 20
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the ordered structures through one interface.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="numbers of keys (up to 10**7)")
+    parser.add_argument("--structures", nargs="+", default=list(CONTAINERS), choices=list(CONTAINERS))
+    parser.add_argument("--workloads", nargs="+", default=["random", "sorted", "zipfian", "mixed"],
+                        choices=["random", "sorted", "zipfian", "mixed"])
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    args = parser.parse_args()
+
+    header = (f"{'n':>9} {'workload':<8} {'structure':<9} {'build op/s':>11} {'query op/s':>11}"
+              f" {'p50 us':>8} {'p99 us':>8} {'p99.9 us':>9} {'mem MB':>8}")
+    print(header)
+    print("-" * len(header))
+    for n in args.sizes:
+        for workload in args.workloads:
+            for name in args.structures:
+                if (name, workload) in QUADRATIC and n > QUADRATIC_LIMIT:
+                    print(f"{n:>9} {workload:<8} {name:<9} skipped (O(n^2) at this size)")
+                    continue
+                result = benchmark(name, workload, n, memory=not args.no_memory)
+                build, query = result["build"], result["query"]
+                memory = f"{result['memory_mb']:>8.1f}" if "memory_mb" in result else f"{'-':>8}"
+                print(f"{n:>9} {workload:<8} {name:<9} {build['ops_per_sec']:>11.0f}"
+                      f" {query['ops_per_sec']:>11.0f} {query['p50_us']:>8.2f}"
+                      f" {query['p99_us']:>8.2f} {query['p999_us']:>9.2f} {memory}")
@@ -5,23 +5,167 @@ class BinomialHeapNode:
         self.parent = None
         self.child = None  # Leftmost child
         self.sibling = None  # Right sibling
+        self.handle = None  # Handle of the entry whose key this node currently holds
+
+class _MinusInfinity:
+    """
+    A key that compares below every other key, so delete() also works for
+    keys that cannot be compared with a float, such as tuples.
+    """
+    def __lt__(self, other):
+        return other is not self
+
+    def __le__(self, other):
+        return True
+
+    def __gt__(self, other):
+        return False
+
+    def __ge__(self, other):
+        return other is self
+
+    def __repr__(self):
+        return "-inf"
+
+MINUS_INFINITY = _MinusInfinity()
+
+class BinomialHeapHandle:
+    """
+    Stable reference to one heap entry.
+
+    decrease_key moves keys between nodes rather than moving nodes, so a node
+    reference can end up holding a different entry. A handle moves with its
+    key and always points at the node that currently holds it.
+    """
+    def __init__(self, node, item_id=None):
+        self.node = node  # Node holding this entry, or None once it has been extracted
+        self.item_id = item_id  # User-supplied id, or None
+
+    @property
+    def key(self):
+        return self.node.key if self.node is not None else None
 
 class BinomialHeap:
-    def __init__(self):
-        self.head = None
+    def __init__(self, index_keys=False, lazy=False, verbose=True):
+        """
+        Initialize an empty binomial heap.
+
+        Args:
+          index_keys (bool): Also index entries inserted without an item_id by
+            their key, so find_node(key) is O(1) instead of a full traversal.
+          lazy (bool): Fibonacci-style merging. insert and union splice root
+            lists in O(1) and trees of equal degree are only linked by the
+            next extract_min, making inserts amortized O(1).
+          verbose (bool): Print the heap after every operation.
+        """
+        self.head = None  # Also invalidates the cached minimum (see the head property)
+        self.index = {}  # item_id (or key, with index_keys) -> BinomialHeapHandle
+        self.index_keys = index_keys
+        self.lazy = lazy
+        self.verbose = verbose
+
+    @property
+    def head(self):
+        return self._head
+
+    @head.setter
+    def head(self, node):
+        # Code outside the heap rewires the root list through this setter
+        # (e.g. `bh.head = bh.union(bh2).head`), so the cached minimum can no
+        # longer be trusted and is recomputed on the next minimum().
+        self._head = node
+        self._tail = None  # Last root, when known; only maintained in lazy mode
+        self._min = None
+        self._min_valid = False
+
+    def _take(self, heap):
+        """Adopt heap's root list together with its cached minimum."""
+        self._head = heap._head
+        self._tail = heap._tail
+        self._min = heap._min
+        self._min_valid = heap._min_valid
+
+    def _last_root(self):
+        """Return the last root in the root list, walking it only if it is not known."""
+        if self._tail is None:
+            x = self._head
+            while x is not None and x.sibling is not None:
+                x = x.sibling
+            self._tail = x
+        return self._tail
+
+    def _set_min(self, node):
+        """Cache `node` as the minimum, moving up to the root it was linked under."""
+        # A root can only be linked below another root with an equal key, so
+        # the root at the top of its tree holds the same minimum key
+        while node is not None and node.parent is not None:
+            node = node.parent
+        self._min = node
+        self._min_valid = True
+
+    @classmethod
+    def from_iterable(cls, keys, **kwargs):
+        """
+        Build a heap from an iterable of keys in O(n).
+
+        The keys are linked the way a binary counter is incremented: adding a
+        tree to an occupied degree slot links the two and carries the result
+        to the next slot, so there are fewer than n links in total and nothing
+        is printed per key.
+
+        Args:
+          keys: An iterable of keys.
+          **kwargs: Passed on to BinomialHeap().
+
+        Returns:
+          BinomialHeap: The new heap.
+        """
+        heap = cls(**kwargs)
+        head = None
+        for key in keys:
+            node = BinomialHeapNode(key)
+            handle = BinomialHeapHandle(node)
+            node.handle = handle
+            if heap.index_keys:
+                heap.index[key] = handle
+            node.sibling = head
+            head = node
+        heap._head = head
+        heap._consolidate()
+        return heap
 
     def make_heap(self):
-        return BinomialHeap()
+        return BinomialHeap(index_keys=self.index_keys, lazy=self.lazy, verbose=self.verbose)
+
+    def _index_id(self, handle):
+        """Return the id `handle` is indexed under, or None if it is not indexed."""
+        if handle.item_id is not None:
+            return handle.item_id
+        if self.index_keys:
+            return handle.node.key
+        return None
+
+    def _unindex(self, handle):
+        index_id = self._index_id(handle)
+        if index_id is not None and self.index.get(index_id) is handle:
+            del self.index[index_id]
+
+    def get(self, item_id):
+        """
+        Return the handle indexed under `item_id` (a key, with index_keys), or None.
+        """
+        return self.index.get(item_id)
 
-    def insert(self, key):
+    def insert(self, key, item_id=None):
         """
         Inserts a new key into the binomial heap.
 
         Args:
           key: The key to be inserted into the heap.
+          item_id: Optional hashable id to index the entry under, for get().
 
         Returns:
-          None
+          BinomialHeapHandle: A handle that stays valid until the entry is extracted.
 
         Side Effects:
           Modifies the heap by adding a new node with the given key.
@@ -29,19 +173,38 @@ class BinomialHeap:
         """
         # Create a new node with the given key
         node = BinomialHeapNode(key)
-        
-        # Create a temporary heap containing only this new node
-        temp_heap = self.make_heap()
-        temp_heap.head = node
-        
-        # Merge (union) the temporary heap with the current heap
-        self.head = self.union(temp_heap).head
-        
-        # Print the inserted key
-        print(f"Inserted {key}")
-        
-        # Print the current state of the heap for verification
-        self.print_heap()
+        handle = BinomialHeapHandle(node, item_id)
+        node.handle = handle
+        index_id = self._index_id(handle)
+        if index_id is not None:
+            self.index[index_id] = handle
+
+        if self.lazy:
+            # Push the node onto the front of the root list; linking waits
+            # for the next extract_min
+            node.sibling = self._head
+            if self._head is None:
+                self._tail = node
+            self._head = node
+            if self._min_valid and (self._min is None or key < self._min.key):
+                self._min = node
+        else:
+            # Create a temporary heap containing only this new node
+            temp_heap = self.make_heap()
+            temp_heap.head = node
+            temp_heap._set_min(node)
+
+            # Merge (union) the temporary heap with the current heap
+            self._take(self.union(temp_heap))
+
+        if self.verbose:
+            # Print the inserted key
+            print(f"Inserted {key}")
+
+            # Print the current state of the heap for verification
+            self.print_heap()
+
+        return handle
 
     def union(self, h2):
         """
@@ -49,6 +212,7 @@ class BinomialHeap:
 
         This method merges the current binomial heap with another binomial heap (h2)
         and returns a new binomial heap that contains all elements from both heaps.
+        In lazy mode the two root lists are simply concatenated in O(1).
 
         Args:
           h2 (BinomialHeap): The binomial heap to be merged with the current heap.
@@ -59,11 +223,35 @@ class BinomialHeap:
         # Create a new binomial heap to store the result
         new_heap = self.make_heap()
 
+        # The new minimum is the smaller of the two minimums; read them before
+        # linking changes which nodes are roots
+        min_node = self.minimum()
+        h2_min = h2.minimum()
+        if min_node is None or (h2_min is not None and h2_min.key < min_node.key):
+            min_node = h2_min
+
+        if self.lazy:
+            if self._head is None:
+                new_heap._take(h2)
+            elif h2._head is None:
+                new_heap._take(self)
+            else:
+                self._last_root().sibling = h2._head
+                new_heap._head = self._head
+                new_heap._tail = h2._tail
+            new_heap._set_min(min_node)
+            return new_heap
+
+        # The degree-ordered merge below needs h2's trees to have distinct degrees
+        if h2.lazy:
+            h2._consolidate()
+
         # Merge the root lists of the two heaps (sorted by degree)
         new_heap.head = self._merge(self.head, h2.head)
 
         # If the resulting heap is empty, return it
         if new_heap.head is None:
+            new_heap._set_min(None)
             return new_heap
 
         # Initialize pointers for the merge process
@@ -97,9 +285,26 @@ class BinomialHeap:
             # Move to the next sibling
             next_node = curr.sibling
 
+        new_heap._set_min(min_node)
+
         # Return the resulting merged heap
         return new_heap
 
+    def meld(self, h2):
+        """
+        Union h2 into this heap in place.
+
+        Unlike `self.head = self.union(h2).head`, this also takes over h2's
+        handle index. h2 is left empty.
+
+        Args:
+          h2 (BinomialHeap): The heap to absorb.
+        """
+        self._take(self.union(h2))
+        self.index.update(h2.index)
+        h2.head = None
+        h2.index = {}
+
     def _merge(self, h1, h2):
         """
         Merges two binomial trees h1 and h2 into a single binomial tree.
@@ -173,32 +378,147 @@ class BinomialHeap:
         # Increment the degree of z, as it now has one more child.
         z.degree += 1
 
+    def _consolidate(self):
+        """
+        Link roots of equal degree until all degrees are distinct, leaving the
+        root list ordered by degree like an eagerly merged heap.
+        """
+        by_degree = {}  # degree -> the one root of that degree seen so far
+        x = self._head
+        while x is not None:
+            next_x = x.sibling
+            x.sibling = None
+            # Carry like a binary counter until x's degree slot is free
+            while x.degree in by_degree:
+                y = by_degree.pop(x.degree)
+                if y.key < x.key:
+                    x, y = y, x
+                self._link(y, x)
+            by_degree[x.degree] = x
+            x = next_x
+
+        # Rebuild the root list in increasing degree order
+        head = tail = min_node = None
+        for degree in sorted(by_degree):
+            root = by_degree[degree]
+            if tail is None:
+                head = root
+            else:
+                tail.sibling = root
+            tail = root
+            if min_node is None or root.key < min_node.key:
+                min_node = root
+        self._head = head
+        self._tail = tail
+        self._set_min(min_node)
+
     def minimum(self):
         """
         Find and return the node with the minimum key in the binomial heap.
 
-        This method traverses the root list of the binomial heap and finds the node
-        with the smallest key.
+        The minimum root is cached and kept up to date by insert, union,
+        decrease_key and extract_min, so this is O(1). The root list is only
+        scanned after the head was reassigned from outside the heap.
 
         Returns:
           Node: The node with the minimum key in the binomial heap. If the heap is empty,
               returns None.
         """
-        # Initialize y to None. This will hold the node with the minimum key.
-        y = None
+        if not self._min_valid:
+            self._set_min(self._scan_min())
+        return self._min
 
-        # Start traversing the root list from the head of the heap.
-        x = self.head
+    def validate(self):
+        """
+        Check the heap order, the binomial tree shapes and the bookkeeping.
+
+        Every tree must be a binomial tree: a root of degree k has exactly k
+        children of degrees k-1, ..., 0 from left to right, each pointing back
+        to it and none with a smaller key. Without lazy merging the root
+        degrees must strictly increase. The cached minimum and last root, the
+        node handles and the index must all agree with the trees.
 
-        # Set min_key to a very large value initially to find the smallest key.
-        min_key = float('inf')
+        Returns:
+          int: The number of entries in the heap.
+
+        Raises:
+          AssertionError: Describing the first violation found.
+        """
+        size = 0
+        roots = []
+        nodes = set()  # ids of every node in the heap
+        x = self._head
+        while x is not None:
+            if x.parent is not None:
+                raise AssertionError(f"root {x.key} has a parent")
+            if roots and not self.lazy and x.degree <= roots[-1].degree:
+                raise AssertionError(f"root degrees {roots[-1].degree}, {x.degree} do not increase")
+            roots.append(x)
+            size += self._validate_tree(x, nodes)
+            x = x.sibling
+
+        if self._tail is not None and (not roots or self._tail is not roots[-1]):
+            raise AssertionError("the cached last root is not the last root")
+        if self._min_valid:
+            if (self._min is None) != (not roots):
+                raise AssertionError("the cached minimum disagrees with the heap being empty")
+            if roots and (self._min.parent is not None or any(r.key < self._min.key for r in roots)):
+                raise AssertionError(f"the cached minimum {self._min.key} is not a minimum root")
+        for index_id, handle in self.index.items():
+            if handle.node is None or id(handle.node) not in nodes:
+                raise AssertionError(f"index entry {index_id!r} points at an entry not in the heap")
+            if self._index_id(handle) != index_id:
+                raise AssertionError(f"index entry {index_id!r} holds the handle of {self._index_id(handle)!r}")
+        return size
+
+    def _validate_tree(self, root, nodes):
+        """Check the binomial tree under `root`, add its node ids to `nodes` and return its size."""
+        size = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            nodes.add(id(node))
+            size += 1
+            if node.handle is not None and node.handle.node is not node:
+                raise AssertionError(f"handle of node {node.key} points elsewhere")
+            expected = node.degree - 1
+            child = node.child
+            while child is not None:
+                if child.parent is not node:
+                    raise AssertionError(f"child {child.key} of {node.key} has a wrong parent")
+                if child.key < node.key:
+                    raise AssertionError(f"child {child.key} is smaller than its parent {node.key}")
+                if child.degree != expected:
+                    raise AssertionError(
+                        f"child of {node.key} has degree {child.degree}, expected {expected}")
+                expected -= 1
+                stack.append(child)
+                child = child.sibling
+            if expected != -1:
+                raise AssertionError(
+                    f"node {node.key} has degree {node.degree} but {node.degree - 1 - expected} children")
+        if size != 1 << root.degree:
+            raise AssertionError(f"tree of degree {root.degree} has {size} nodes")
+        return size
+
+    def _scan_min(self):
+        """
+        Find the root with the minimum key by traversing the whole root list.
+
+        Returns:
+          Node: The root with the minimum key, or None if the heap is empty.
+        """
+        # Initialize y to the first root. This will hold the node with the minimum key.
+        y = self.head
+
+        # Start traversing the rest of the root list.
+        x = y.sibling if y else None
 
         # Traverse the root list of binomial trees.
         while x:
             # If the current node's key is smaller than the current minimum,
-            # update min_key and y (the node with the smallest key).
-            if x.key < min_key:
-                min_key = x.key
+            # update y (the node with the smallest key).
+            if x.key < y.key:
                 y = x
 
             # Move to the next sibling (next root in the root list).
@@ -211,9 +531,10 @@ class BinomialHeap:
         """
         Extracts the minimum key from the binomial heap and returns it.
 
-        This method finds the root with the minimum key in the binomial heap,
-        removes it from the root list, reverses its children, and then merges
-        the resulting heap back into the original heap.
+        This method takes the cached minimum root, removes it from the root
+        list, reverses its children, and then merges the resulting heap back
+        into the original heap. In lazy mode the children join the root list
+        and all roots are consolidated in a single pass instead.
 
         Returns:
           The minimum key in the binomial heap, or None if the heap is empty.
@@ -222,20 +543,13 @@ class BinomialHeap:
         if self.head is None:
             return None
 
-        # Initialize variables to find the root with the minimum key
+        # The minimum root is cached; only its predecessor in the root list
+        # has to be found, which needs no key comparisons
+        min_node = self.minimum()
         min_prev = None  # Pointer to the node before the minimum node
-        min_node = self.head  # Start by assuming the head is the minimum node
-        prev_x = None  # Previous node during traversal
-        x = self.head  # Pointer to traverse the root list
-
-        # Traverse the root list to find the node with the smallest key
-        while x:
-            if x.key < min_node.key:
-                # Update the minimum node and its predecessor
-                min_node = x
-                min_prev = prev_x
-            # Move to the next node
-            prev_x = x
+        x = self.head
+        while x is not min_node:
+            min_prev = x
             x = x.sibling
 
         # Remove min_node from the root list
@@ -246,6 +560,19 @@ class BinomialHeap:
             # If min_node is the head, update the head pointer
             self.head = min_node.sibling
 
+        if self.lazy:
+            # Put the children on the root list and link everything in one pass
+            child = min_node.child
+            while child:
+                child.parent = None
+                last_child = child
+                child = child.sibling
+            if min_node.child is not None:
+                last_child.sibling = self._head
+                self._head = min_node.child
+            self._consolidate()
+            return self._finish_extract(min_node)
+
         # Reverse the child list of min_node to prepare for merging back
         child = min_node.child  # Start with the first child of min_node
         new_head = None  # New head for the reversed child list
@@ -261,12 +588,60 @@ class BinomialHeap:
         new_heap = self.make_heap()
         new_heap.head = new_head
 
-        # Merge the new heap with the current heap
-        self.head = self.union(new_heap).head
+        # Merge the new heap with the current heap. The old minimum is gone,
+        # so both halves have to find theirs by scanning their root lists.
+        self._min_valid = False
+        self._take(self.union(new_heap))
+        return self._finish_extract(min_node)
+
+    def _pop_min(self):
+        """extract_min without printing."""
+        verbose, self.verbose = self.verbose, False
+        try:
+            return self.extract_min()
+        finally:
+            self.verbose = verbose
+
+    def extract_k_min(self, k):
+        """
+        Generator that extracts up to k minimum keys in ascending order.
+
+        Keys are extracted one at a time as the generator is consumed, and the
+        heap is not printed between pops.
+
+        Args:
+          k (int): The maximum number of keys to extract.
+
+        Yields:
+          The extracted keys, smallest first.
+        """
+        for _ in range(k):
+            if self._head is None:
+                return
+            yield self._pop_min()
+
+    def drain(self):
+        """
+        Generator that extracts every key in ascending order, emptying the heap.
+
+        Yields:
+          The extracted keys, smallest first.
+        """
+        while self._head is not None:
+            yield self._pop_min()
+
+    def _finish_extract(self, min_node):
+        """Retire the extracted node's handle, print, and return its key."""
+        # The extracted entry's handle no longer points into the heap
+        handle = min_node.handle
+        if handle is not None:
+            self._unindex(handle)
+            handle.node = None
 
         # Print and return the minimum key
-        print(f"Extracted minimum key {min_node.key}")
-        self.print_heap()
+        if self.verbose:
+            print(f"Extracted minimum key {min_node.key}")
+            self.print_heap()
         return min_node.key
 
     def decrease_key(self, x, k):
@@ -274,7 +649,7 @@ class BinomialHeap:
         Decreases the key of a given node in the binomial heap.
 
         Parameters:
-        x (Node): The node whose key is to be decreased.
+        x (Node or BinomialHeapHandle): The node or entry handle whose key is to be decreased.
         k (int): The new key value. It must be less than or equal to the current key of the node.
 
         Raises:
@@ -282,14 +657,28 @@ class BinomialHeap:
 
         This method updates the key of the given node to the new key value and then
         ensures the binomial heap property is maintained by moving the node up the
-        tree if necessary. The heap is printed after the key is decreased.
+        tree if necessary. Handles move along with their keys. The heap is printed
+        after the key is decreased.
         """
+        if isinstance(x, BinomialHeapHandle):
+            if x.node is None:
+                raise ValueError("Handle refers to an entry that is no longer in the heap")
+            x = x.node
+
         # Check if the new key is valid
         if k > x.key:
             raise ValueError("New key is greater than current key")
-        
+
+        # Entries indexed by their key have to be re-indexed under the new key
+        handle = x.handle
+        rekey = handle is not None and handle.item_id is None and self.index_keys
+        if rekey:
+            self._unindex(handle)
+
         # Update the key of the given node
         x.key = k
+        if rekey:
+            self.index[k] = handle
         
         # Start the bubble-up process to maintain heap property
         y = x  # Current node being evaluated
@@ -297,31 +686,53 @@ class BinomialHeap:
 
         # While the current node has a parent and violates the heap property
         while z and y.key < z.key:
-            # Swap the keys of the current node and its parent
+            # Swap the keys of the current node and its parent, and the
+            # handles that belong to those keys
             y.key, z.key = z.key, y.key
-            
+            y.handle, z.handle = z.handle, y.handle
+            if y.handle is not None:
+                y.handle.node = y
+            if z.handle is not None:
+                z.handle.node = z
+
             # Move up the tree to the parent
             y = z
             z = y.parent
 
+        # y now holds k; if it beats the cached minimum it must be a root
+        if self._min_valid and (self._min is None or y.key < self._min.key):
+            self._set_min(y)
+
         # Print the heap after decreasing the key
-        print(f"Decreased key to {k}")
-        self.print_heap()
+        if self.verbose:
+            print(f"Decreased key to {k}")
+            self.print_heap()
 
     def delete(self, x):
-        self.decrease_key(x, -float('inf'))
+        """
+        Delete the entry held by node or handle x in O(log n).
+        """
+        self.decrease_key(x, MINUS_INFINITY)
         self.extract_min()
 
     def find_node(self, key):
         """
         Find a node with the given key in the binomial heap.
 
+        With index_keys this is an O(1) dictionary lookup; otherwise every
+        tree is searched.
+
         Args:
           key: The key to search for in the binomial heap.
 
         Returns:
           The node with the specified key if found, otherwise None.
         """
+        if self.index_keys:
+            handle = self.index.get(key)
+            if handle is not None:
+                return handle.node
+
         # Initialize a stack to traverse the heap's root list and subtrees
         stack = [self.head]
         
@@ -0,0 +1,94 @@
+import argparse
+import random
+import time
+
+from binomial_heap import BinomialHeap
+from workloads import random_keys
+
+
+def peek_heavy(n, rounds, peeks, cached):
+    """
+    Alternate `peeks` minimum lookups with one extract_min and one insert.
+
+    With cached=False every peek scans the root list, which is what
+    minimum() did before the minimum root was cached.
+    :return: Elapsed seconds.
+    """
+    rng = random.Random(0)
+    heap = BinomialHeap(verbose=False)
+    for key in random_keys(n):
+        heap.insert(key)
+    peek = heap.minimum if cached else heap._scan_min
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _ in range(peeks):
+            peek()
+        heap.extract_min()
+        heap.insert(rng.randrange(n))
+    return time.perf_counter() - start
+
+
+def bursts(n_bursts, burst, extracts, lazy):
+    """
+    Insert `burst` keys, then extract `extracts` minimums, `n_bursts` times.
+    :return: (insert seconds, extract seconds)
+    """
+    rng = random.Random(0)
+    heap = BinomialHeap(lazy=lazy, verbose=False)
+    insert_time = extract_time = 0.0
+    for _ in range(n_bursts):
+        keys = [rng.random() for _ in range(burst)]
+        start = time.perf_counter()
+        for key in keys:
+            heap.insert(key)
+        insert_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(extracts):
+            heap.extract_min()
+        extract_time += time.perf_counter() - start
+    return insert_time, extract_time
+
+
+def build(n):
+    """
+    Build a heap of n keys with repeated insert and with from_iterable.
+    :return: (insert seconds, from_iterable seconds)
+    """
+    keys = random_keys(n)
+    start = time.perf_counter()
+    heap = BinomialHeap(verbose=False)
+    for key in keys:
+        heap.insert(key)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    BinomialHeap.from_iterable(keys, verbose=False)
+    return insert_time, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark BinomialHeap workloads.")
+    parser.add_argument("-n", type=int, default=100000, help="heap size")
+    parser.add_argument("--rounds", type=int, default=2000, help="mutations per run")
+    parser.add_argument("--peeks", type=int, default=50, help="minimum() calls per mutation")
+    parser.add_argument("--burst", type=int, default=5000, help="inserts per burst")
+    args = parser.parse_args()
+
+    print(f"Peek-heavy: n={args.n}, {args.peeks} peeks per extract_min + insert")
+    scan = peek_heavy(args.n, args.rounds, args.peeks, cached=False)
+    cached = peek_heavy(args.n, args.rounds, args.peeks, cached=True)
+    print(f"{'root-list scan':<16}{scan:>10.4f} s")
+    print(f"{'cached minimum':<16}{cached:>10.4f} s")
+
+    print(f"\nBursts: 20 x ({args.burst} inserts, {args.burst // 10} extract_min)")
+    print(f"{'mode':<16}{'insert s':>10}{'extract s':>10}")
+    for lazy in (False, True):
+        insert_time, extract_time = bursts(20, args.burst, args.burst // 10, lazy)
+        print(f"{'lazy' if lazy else 'eager':<16}{insert_time:>10.4f}{extract_time:>10.4f}")
+
+    insert_time, bulk_time = build(args.n)
+    print(f"\nBuild: n={args.n}")
+    print(f"{'insert loop':<16}{insert_time:>10.4f} s")
+    print(f"{'from_iterable':<16}{bulk_time:>10.4f} s")
@@ -1,13 +1,204 @@
+import random
+
+
 class Node:
     def __init__(self, key):
         self.key = key      # The value stored in the node
         self.left = None    # Left child
         self.right = None   # Right child
         self.parent = None  # Parent node
+        self.height = 1     # Subtree height (maintained by AVLPolicy)
+        self.priority = 0   # Heap priority (maintained by TreapPolicy)
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+class BalancingPolicy:
+    """
+    Hooks a BST calls around its structural operations.
+
+    The base policy does no rebalancing, which is the plain BST behaviour.
+    Subclasses restore their invariant with the tree's rotations.
+    """
+    name = "none"
+
+    def on_insert(self, tree, node):
+        """Called after `node` has been linked into the tree as a leaf."""
+
+    def on_access(self, tree, node):
+        """Called after a search ends at `node` (the match, or the last node visited)."""
+
+    def remove(self, tree, node):
+        """Unlink `node` from the tree."""
+        tree._remove(node)
+
+    def on_build(self, tree):
+        """Called after the tree has been bulk-built as a perfectly balanced tree."""
+
+    def validate_node(self, node):
+        """Raise AssertionError if `node` breaks the policy's invariant (used by BST.validate)."""
+
+
+class AVLPolicy(BalancingPolicy):
+    """Keeps the heights of sibling subtrees within one of each other."""
+    name = "avl"
+
+    def on_insert(self, tree, node):
+        self._rebalance(tree, node.parent)
+
+    def remove(self, tree, node):
+        self._rebalance(tree, tree._remove(node))
+
+    def _update(self, node):
+        node.height = max(_height(node.left), _height(node.right)) + 1
+
+    def _rotate_left(self, tree, x):
+        y = tree.left_rotate(x)
+        self._update(x)
+        self._update(y)
+        return y
+
+    def _rotate_right(self, tree, x):
+        y = tree.right_rotate(x)
+        self._update(x)
+        self._update(y)
+        return y
+
+    def validate_node(self, node):
+        if node.height != max(_height(node.left), _height(node.right)) + 1:
+            raise AssertionError(f"node {node.key} has a stale height {node.height}")
+        if abs(_height(node.left) - _height(node.right)) > 1:
+            raise AssertionError(f"node {node.key} is out of balance")
+
+    def _rebalance(self, tree, node):
+        # Walk up from the lowest changed node, fixing heights and rotating
+        # wherever the balance factor leaves [-1, 1].
+        while node is not None:
+            self._update(node)
+            balance = _height(node.left) - _height(node.right)
+            if balance > 1:
+                if _height(node.left.left) < _height(node.left.right):
+                    self._rotate_left(tree, node.left)
+                node = self._rotate_right(tree, node)
+            elif balance < -1:
+                if _height(node.right.right) < _height(node.right.left):
+                    self._rotate_right(tree, node.right)
+                node = self._rotate_left(tree, node)
+            node = node.parent
+
+
+class TreapPolicy(BalancingPolicy):
+    """Orders nodes by key and max-heaps them by a random priority."""
+    name = "treap"
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def on_build(self, tree):
+        # Hand out priorities in descending order level by level, which
+        # satisfies the heap order for any shape of tree.
+        levels = []
+        level = [tree.root] if tree.root is not None else []
+        while level:
+            levels.append(level)
+            level = [child for n in level for child in (n.left, n.right) if child is not None]
+        nodes = [node for level in levels for node in level]
+        priorities = sorted((self.rng.random() for _ in nodes), reverse=True)
+        for node, priority in zip(nodes, priorities):
+            node.priority = priority
+
+    def validate_node(self, node):
+        for child in (node.left, node.right):
+            if child is not None and child.priority > node.priority:
+                raise AssertionError(f"child {child.key} outranks its parent {node.key}")
+
+    def on_insert(self, tree, node):
+        node.priority = self.rng.random()
+        # Rotate the new node up until its parent has a higher priority
+        while node.parent is not None and node.parent.priority < node.priority:
+            if node == node.parent.left:
+                tree.right_rotate(node.parent)
+            else:
+                tree.left_rotate(node.parent)
+
+    def remove(self, tree, node):
+        # Rotate the node down past its higher-priority child until it has
+        # at most one child, then splice it out.
+        while node.left is not None and node.right is not None:
+            if node.left.priority > node.right.priority:
+                tree.right_rotate(node)
+            else:
+                tree.left_rotate(node)
+        tree._remove(node)
+
+
+class SplayPolicy(BalancingPolicy):
+    """Moves every inserted or accessed node to the root."""
+    name = "splay"
+
+    def on_insert(self, tree, node):
+        self._splay(tree, node)
+
+    def on_access(self, tree, node):
+        if node is not None:
+            self._splay(tree, node)
+
+    def remove(self, tree, node):
+        self._splay(tree, node)
+        tree._remove(node)
+
+    def _splay(self, tree, x):
+        while x.parent is not None:
+            p = x.parent
+            g = p.parent
+            if g is None:
+                # Zig
+                if x == p.left:
+                    tree.right_rotate(p)
+                else:
+                    tree.left_rotate(p)
+            elif (x == p.left) == (p == g.left):
+                # Zig-zig: rotate the grandparent first
+                if x == p.left:
+                    tree.right_rotate(g)
+                    tree.right_rotate(p)
+                else:
+                    tree.left_rotate(g)
+                    tree.left_rotate(p)
+            else:
+                # Zig-zag
+                if x == p.left:
+                    tree.right_rotate(p)
+                    tree.left_rotate(g)
+                else:
+                    tree.left_rotate(p)
+                    tree.right_rotate(g)
+
+
+BALANCING_POLICIES = {
+    policy.name: policy for policy in (BalancingPolicy, AVLPolicy, TreapPolicy, SplayPolicy)
+}
+
 
 class BST:
-    def __init__(self):
+    def __init__(self, balance=None, verbose=True):
+        """
+        Initialize a binary search tree.
+        :param balance: None for a plain BST, a policy name ("avl", "treap",
+                        "splay") or a BalancingPolicy instance.
+        :param verbose: Print the tree after every operation (default is True).
+        """
         self.root = None  # Root of the BST
+        if balance is None:
+            balance = BalancingPolicy()
+        elif isinstance(balance, str):
+            if balance not in BALANCING_POLICIES:
+                raise ValueError(f"Unknown balancing policy {balance!r}")
+            balance = BALANCING_POLICIES[balance]()
+        self.policy = balance
+        self.verbose = verbose
 
     def insert(self, key):
         new_node = Node(key)
@@ -32,37 +223,274 @@ class BST:
         else:
             y.right = new_node
 
+        self.policy.on_insert(self, new_node)
+
         # Print tree height and structure after insertion
-        print(f"Inserted {key}, Tree Height: {self.calculate_height(self.root)}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Inserted {key}, Tree Height: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
+
+    @classmethod
+    def from_sorted(cls, keys, balance=None, verbose=True):
+        """
+        Build a perfectly balanced tree from keys in ascending order in O(n).
+
+        Args:
+          keys: An iterable of keys in ascending order.
+          balance: The balancing policy, as for BST().
+          verbose: Print the tree after every operation.
+
+        Returns:
+          BST: The new tree.
+        """
+        tree = cls(balance=balance, verbose=verbose)
+        tree._build(list(keys))
+        return tree
+
+    def _build(self, keys):
+        """Replace the tree with a perfectly balanced tree over the sorted list `keys`."""
+        def build(lo, hi, parent):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = Node(keys[mid])
+            node.parent = parent
+            node.left = build(lo, mid, node)
+            node.right = build(mid + 1, hi, node)
+            node.height = max(_height(node.left), _height(node.right)) + 1
+            return node
+
+        # Recursion depth is only log2(n) because the tree is balanced
+        self.root = build(0, len(keys), None)
+        self.policy.on_build(self)
+
+    def insert_many(self, keys):
+        """
+        Insert a batch of keys.
+
+        The batch is sorted first. An empty tree is bulk-built balanced in O(n);
+        otherwise a plain BST inserts the sorted keys with one merge-style
+        descent, resuming each walk from where the previous key's walk
+        stopped instead of from the root. Balancing policies restructure the
+        tree on every insert, so they fall back to one insert per key.
+
+        Args:
+          keys: An iterable of keys, in any order.
+        """
+        keys = sorted(keys)
+        if not keys:
+            return
+        if self.root is None:
+            self._build(keys)
+        elif type(self.policy) is BalancingPolicy:
+            # Stack of (node, upper bound) along the current path. The subtree
+            # below a node only holds keys smaller than its bound (None = +inf).
+            path = [(self.root, None)]
+            for key in keys:
+                while path[-1][1] is not None and key >= path[-1][1]:
+                    path.pop()
+                x, upper = path.pop()
+                while x is not None:
+                    path.append((x, upper))
+                    y = x
+                    if key < x.key:
+                        upper = x.key
+                        x = x.left
+                    else:
+                        x = x.right
+                new_node = Node(key)
+                new_node.parent = y
+                if key < y.key:
+                    y.left = new_node
+                else:
+                    y.right = new_node
+                path.append((new_node, upper))
+        else:
+            verbose, self.verbose = self.verbose, False
+            try:
+                for key in keys:
+                    self.insert(key)
+            finally:
+                self.verbose = verbose
+
+        if self.verbose:
+            print(f"Inserted {len(keys)} keys, Tree Height: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
+
+    def delete_many(self, keys):
+        """
+        Delete a batch of keys. Keys that are not in the tree are ignored.
+
+        The batch is sorted first. A plain BST shares the descent between
+        neighbouring keys as contains_many does: the node that takes a deleted
+        node's place covers the same key range, so it replaces the deleted
+        node on the path and the next walk resumes from there. Balancing
+        policies rotate on every removal, which invalidates the path, so they
+        fall back to one search and removal per key.
+
+        Args:
+          keys: An iterable of keys, in any order.
+
+        Returns:
+          int: The number of keys deleted.
+        """
+        deleted = 0
+        if type(self.policy) is BalancingPolicy:
+            path = [(self.root, None)] if self.root is not None else []
+            for key in sorted(keys):
+                if not path:
+                    break  # The tree is empty
+                while path[-1][1] is not None and key >= path[-1][1]:
+                    path.pop()
+                x, upper = path.pop()
+                while x is not None:
+                    path.append((x, upper))
+                    if key == x.key:
+                        break
+                    if key < x.key:
+                        upper = x.key
+                        x = x.left
+                    else:
+                        x = x.right
+                if x is None:
+                    continue
+                path.pop()
+                if x.left is None:
+                    replacement = x.right
+                elif x.right is None:
+                    replacement = x.left
+                else:
+                    replacement = x.right
+                    while replacement.left is not None:
+                        replacement = replacement.left
+                self._remove(x)
+                deleted += 1
+                if replacement is not None:
+                    path.append((replacement, upper))
+        else:
+            for key in sorted(keys):
+                node = self._search(self.root, key)
+                if node is not None:
+                    self.policy.remove(self, node)
+                    deleted += 1
+
+        if self.verbose:
+            print(f"Deleted {deleted} keys, Tree Height: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
+        return deleted
+
+    def contains_many(self, keys):
+        """
+        Look up a batch of keys, sharing the descent between neighbouring keys.
+
+        The queries are answered in sorted order and each walk resumes from the
+        deepest node on the previous path whose subtree can still hold the key.
+        Lookups do not trigger the policy's on_access hook, so a splay tree is
+        left unchanged.
+
+        Args:
+          keys: An iterable of keys, in any order.
+
+        Returns:
+          list: One bool per key, in the order the keys were given.
+        """
+        keys = list(keys)
+        result = [False] * len(keys)
+        if self.root is None:
+            return result
+
+        path = [(self.root, None)]
+        for i in sorted(range(len(keys)), key=keys.__getitem__):
+            key = keys[i]
+            while path[-1][1] is not None and key >= path[-1][1]:
+                path.pop()
+            x, upper = path.pop()
+            while x is not None:
+                path.append((x, upper))
+                if key == x.key:
+                    result[i] = True
+                    break
+                if key < x.key:
+                    upper = x.key
+                    x = x.left
+                else:
+                    x = x.right
+        return result
 
     def search(self, key):
-        node = self._search(self.root, key)
-        found = "Found" if node else "Not found"
-        print(f"Search for {key}: {found}")
-        print(f"Tree Height after search: {self.calculate_height(self.root)}")
-        self.print_tree_structure()
-        print("-" * 40)
+        node = self.root
+        last = None  # Last node visited, where a splay tree splays a miss
+        while node is not None and key != node.key:
+            last = node
+            node = node.left if key < node.key else node.right
+        self.policy.on_access(self, node if node is not None else last)
+        if self.verbose:
+            found = "Found" if node else "Not found"
+            print(f"Search for {key}: {found}")
+            print(f"Tree Height after search: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
         return node
 
+    def validate(self):
+        """
+        Check the links, the key order and the balancing policy's invariant.
+
+        Every child must point back to its parent, the in-order walk must
+        never decrease (equal keys are allowed, as insert sends them right),
+        and every node must pass the policy's validate_node.
+
+        Returns:
+          int: The number of keys in the tree.
+
+        Raises:
+          AssertionError: Describing the first violation found.
+        """
+        if self.root is not None and self.root.parent is not None:
+            raise AssertionError(f"root {self.root.key} has a parent")
+        # Iterative, so degenerate trees cannot overflow the stack
+        count = 0
+        previous = None
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                for child in (node.left, node.right):
+                    if child is not None and child.parent is not node:
+                        raise AssertionError(f"child {child.key} of {node.key} has a wrong parent")
+                self.policy.validate_node(node)
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if previous is not None and node.key < previous.key:
+                raise AssertionError(f"key {node.key} comes after {previous.key} in order")
+            previous = node
+            count += 1
+            node = node.right
+        return count
+
     def _search(self, node, key):
-        if node is None or key == node.key:
-            return node
-        if key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
+        # Iterative so that degenerate (list-shaped) trees cannot overflow the stack
+        while node is not None and key != node.key:
+            if key < node.key:
+                node = node.left
+            else:
+                node = node.right
+        return node
 
     def minimum(self, node=None):
         if node is None:
             node = self.root
         while node.left is not None:
             node = node.left
-        print(f"Minimum key: {node.key}")
-        print(f"Tree Height after finding minimum: {self.calculate_height(self.root)}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Minimum key: {node.key}")
+            print(f"Tree Height after finding minimum: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
         return node
 
     def maximum(self, node=None):
@@ -70,10 +498,11 @@ class BST:
             node = self.root
         while node.right is not None:
             node = node.right
-        print(f"Maximum key: {node.key}")
-        print(f"Tree Height after finding maximum: {self.calculate_height(self.root)}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Maximum key: {node.key}")
+            print(f"Tree Height after finding maximum: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
         return node
 
     def successor(self, node):
@@ -85,11 +514,12 @@ class BST:
                 node = y
                 y = y.parent
             succ = y
-        succ_key = succ.key if succ else 'None'
-        print(f"Successor of {node.key}: {succ_key}")
-        print(f"Tree Height after finding successor: {self.calculate_height(self.root)}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            succ_key = succ.key if succ else 'None'
+            print(f"Successor of {node.key}: {succ_key}")
+            print(f"Tree Height after finding successor: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
         return succ
 
     def predecessor(self, node):
@@ -101,41 +531,62 @@ class BST:
                 node = y
                 y = y.parent
             pred = y
-        pred_key = pred.key if pred else 'None'
-        print(f"Predecessor of {node.key}: {pred_key}")
-        print(f"Tree Height after finding predecessor: {self.calculate_height(self.root)}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            pred_key = pred.key if pred else 'None'
+            print(f"Predecessor of {node.key}: {pred_key}")
+            print(f"Tree Height after finding predecessor: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
         return pred
 
     def delete(self, key):
         node = self._search(self.root, key)
         if node is None:
-            print(f"Key {key} not found.")
+            if self.verbose:
+                print(f"Key {key} not found.")
             return
 
+        self.policy.remove(self, node)
+
+        if self.verbose:
+            print(f"Deleted {key}, Tree Height: {self.calculate_height(self.root)}")
+            self.print_tree_structure()
+            print("-" * 40)
+
+    def _remove(self, node):
+        """
+        Unlink `node` without rebalancing.
+
+        Returns:
+          The lowest node whose subtree changed shape, or None if that is the root position.
+        """
         # Case 1: Node has no children
         if node.left is None and node.right is None:
+            lowest = node.parent
             self._transplant(node, None)
         # Case 2: Node has only one child
         elif node.left is None:
+            lowest = node.parent
             self._transplant(node, node.right)
         elif node.right is None:
+            lowest = node.parent
             self._transplant(node, node.left)
         # Case 3: Node has two children
         else:
-            succ = self.minimum(node.right)
+            succ = node.right
+            while succ.left is not None:
+                succ = succ.left
             if succ.parent != node:
+                lowest = succ.parent
                 self._transplant(succ, succ.right)
                 succ.right = node.right
                 succ.right.parent = succ
+            else:
+                lowest = succ
             self._transplant(node, succ)
             succ.left = node.left
             succ.left.parent = succ
-
-        print(f"Deleted {key}, Tree Height: {self.calculate_height(self.root)}")
-        self.print_tree_structure()
-        print("-" * 40)
+        return lowest
 
     def _transplant(self, u, v):
         if u.parent is None:
@@ -147,39 +598,92 @@ class BST:
         if v is not None:
             v.parent = u.parent
 
+    def left_rotate(self, x):
+        """
+        Performs a left rotation on node x and returns the node that took its place.
+        """
+        y = x.right
+        x.right = y.left
+        if y.left is not None:
+            y.left.parent = x
+        y.parent = x.parent
+        if x.parent is None:
+            self.root = y
+        elif x == x.parent.left:
+            x.parent.left = y
+        else:
+            x.parent.right = y
+        y.left = x
+        x.parent = y
+        return y
+
+    def right_rotate(self, x):
+        """
+        Performs a right rotation on node x and returns the node that took its place.
+        """
+        y = x.left
+        x.left = y.right
+        if y.right is not None:
+            y.right.parent = x
+        y.parent = x.parent
+        if x.parent is None:
+            self.root = y
+        elif x == x.parent.right:
+            x.parent.right = y
+        else:
+            x.parent.left = y
+        y.right = x
+        x.parent = y
+        return y
+
     def in_order_traversal(self, node):
-        if node is not None:
-            self.in_order_traversal(node.left)
+        # Explicit stack instead of recursion, so deep trees cannot overflow the stack
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
             print(node.key, end=" ")
-            self.in_order_traversal(node.right)
+            node = node.right
 
     def calculate_height(self, node):
-        if node is None:
-            return 0
-        else:
-            left_height = self.calculate_height(node.left)
-            right_height = self.calculate_height(node.right)
-            return max(left_height, right_height) + 1
+        # Level-by-level walk instead of recursion, so deep trees cannot overflow the stack
+        height = 0
+        level = [node] if node is not None else []
+        while level:
+            height += 1
+            level = [child for n in level for child in (n.left, n.right) if child is not None]
+        return height
 
     def print_tree_structure(self, node=None, level=0, indent="    "):
         if node is None:
             node = self.root
-        if node:
-            if level == 0:
-                print(node.key)
-            if node.left or node.right:
-                if node.left:
-                    print(indent * level + "├──L: ", end="")
-                    print(node.left.key)
-                    self.print_tree_structure(node.left, level + 1)
-                else:
-                    print(indent * level + "├──L: None")
+        if not node:
+            return
+        if level == 0:
+            print(node.key)
+        # Explicit stack instead of recursion, so deep trees cannot overflow the
+        # stack. A (node, level, True) entry prints the node's right branch,
+        # once everything under its left child has been printed.
+        stack = [(node, level, False)]
+        while stack:
+            node, level, right_side = stack.pop()
+            if right_side:
                 if node.right:
                     print(indent * level + "└──R: ", end="")
                     print(node.right.key)
-                    self.print_tree_structure(node.right, level + 1)
+                    stack.append((node.right, level + 1, False))
                 else:
                     print(indent * level + "└──R: None")
+            elif node.left or node.right:
+                stack.append((node, level, True))
+                if node.left:
+                    print(indent * level + "├──L: ", end="")
+                    print(node.left.key)
+                    stack.append((node.left, level + 1, False))
+                else:
+                    print(indent * level + "├──L: None")
 
 # Testing code
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+import argparse
+import time
+
+from bst import BST, BALANCING_POLICIES
+from workloads import random_keys, sorted_keys, zipf_keys
+
+
+def run(policy, keys, queries):
+    """
+    Build a tree from `keys`, then search every key in `queries`.
+    :return: (insert seconds, search seconds, final height)
+    """
+    tree = BST(balance=policy, verbose=False)
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in queries:
+        tree.search(key)
+    search_time = time.perf_counter() - start
+    return insert_time, search_time, tree.calculate_height(tree.root)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare BST balancing policies.")
+    parser.add_argument("-n", type=int, default=5000, help="number of keys")
+    parser.add_argument("-q", type=int, default=20000, help="number of searches")
+    args = parser.parse_args()
+
+    workloads = {
+        "random": (random_keys(args.n), random_keys(args.n, seed=1)[:args.q]),
+        "sorted": (sorted_keys(args.n), sorted_keys(args.n)[:args.q]),
+        "zipfian": (random_keys(args.n), zipf_keys(args.n, args.q)),
+    }
+
+    print(f"{'workload':<10}{'policy':<8}{'insert s':>10}{'search s':>10}{'height':>8}")
+    for name, (keys, queries) in workloads.items():
+        for policy in BALANCING_POLICIES:
+            insert_time, search_time, height = run(policy, keys, queries)
+            print(f"{name:<10}{policy:<8}{insert_time:>10.4f}{search_time:>10.4f}{height:>8}")
@@ -0,0 +1,449 @@
+from bisect import bisect_left, bisect_right
+
+_MISSING = object()  # Default for pop() that lets None be a real default
+
+
+class BTreeNode:
+    def __init__(self, keys=None, children=None, values=None):
+        self.keys = keys if keys is not None else []  # Sorted keys (separators in internal nodes)
+        self.children = children  # Child nodes, or None for a leaf
+        self.values = values if values is not None else []  # Leaves only, parallel to keys
+        self.next = None  # Next leaf in key order (leaves only)
+        self.prev = None  # Previous leaf in key order (leaves only)
+
+
+class BTreeCursor:
+    """
+    Position of one key in a leaf, returned where RedBlackTree returns a node.
+
+    A cursor is only valid until the tree is next modified.
+    """
+    def __init__(self, leaf, index):
+        self.leaf = leaf
+        self.index = index
+
+    @property
+    def key(self):
+        return self.leaf.keys[self.index]
+
+    @property
+    def value(self):
+        return self.leaf.values[self.index]
+
+
+class BTree:
+    """
+    B+ tree map with configurable fanout.
+
+    Keys live in sorted Python lists, so a lookup does one bisect per level
+    instead of one comparison and one pointer hop per key as in a binary
+    tree, and with the default fanout of 64 a million keys are only four
+    levels deep. Internal nodes hold separators only; all keys and values sit
+    in the leaves, which are linked in both directions so ordered scans and
+    successor steps walk the leaves directly.
+
+    Keys are unique: inserting a key that is present replaces its value, as
+    in skiplist.SkipList. search, minimum, maximum, successor and predecessor
+    return a BTreeCursor with a .key, mirroring RedBlackTree's node API.
+    """
+    def __init__(self, fanout=64):
+        """
+        Initialize an empty B+ tree.
+        :param fanout: Maximum number of children of an internal node (at least 3);
+                       nodes hold up to fanout - 1 keys and, except the root,
+                       at least half of that.
+        """
+        if fanout < 3:
+            raise ValueError("fanout must be at least 3")
+        self.fanout = fanout
+        self.max_keys = fanout - 1
+        self.min_keys = self.max_keys // 2
+        self.root = BTreeNode()
+        self.head = self.root  # Leftmost leaf
+        self.tail = self.root  # Rightmost leaf
+        self.size = 0
+        self.height = 1  # Number of levels, counting the leaves
+
+    def __len__(self):
+        return self.size
+
+    def _leaf(self, key):
+        """Descend to the leaf whose key range covers `key`."""
+        node = self.root
+        while node.children is not None:
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def search(self, key):
+        """
+        Find `key`.
+        :return: A BTreeCursor at the key, or None if it is not present.
+        """
+        leaf = self._leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return BTreeCursor(leaf, i)
+        return None
+
+    def __contains__(self, key):
+        leaf = self._leaf(key)
+        i = bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+    def get(self, key, default=None):
+        leaf = self._leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return default
+
+    def insert(self, key, value=None):
+        """
+        Insert `key` with `value`, or replace the value if the key is already present.
+        :return: True if the key was added, False if an existing value was replaced.
+        """
+        node = self.root
+        path = []  # (internal node, index of the child taken)
+        while node.children is not None:
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        i = bisect_left(node.keys, key)
+        if i < len(node.keys) and node.keys[i] == key:
+            node.values[i] = value
+            return False
+        node.keys.insert(i, key)
+        node.values.insert(i, value)
+        self.size += 1
+        if len(node.keys) > self.max_keys:
+            self._split(node, path)
+        return True
+
+    def _split(self, node, path):
+        """Split overfull nodes from `node` up along `path`, growing a new root if needed."""
+        while len(node.keys) > self.max_keys:
+            mid = len(node.keys) // 2
+            if node.children is None:
+                # Leaf: the right half moves to a new leaf and its first key is copied up
+                right = BTreeNode(node.keys[mid:], None, node.values[mid:])
+                del node.keys[mid:]
+                del node.values[mid:]
+                right.next = node.next
+                right.prev = node
+                if node.next is not None:
+                    node.next.prev = right
+                else:
+                    self.tail = right
+                node.next = right
+                separator = right.keys[0]
+            else:
+                # Internal: the middle key moves up
+                separator = node.keys[mid]
+                right = BTreeNode(node.keys[mid + 1:], node.children[mid + 1:])
+                del node.keys[mid:]
+                del node.children[mid + 1:]
+            if not path:
+                self.root = BTreeNode([separator], [node, right])
+                self.height += 1
+                return
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, right)
+            node = parent
+
+    def delete(self, key):
+        """
+        Remove `key`.
+        :return: True if the key was removed, False if it was not present.
+        """
+        return self._remove(key) is not _MISSING
+
+    def pop(self, key, default=_MISSING):
+        """
+        Remove `key` and return its value.
+        :raises KeyError: If the key is not present and no default is given.
+        """
+        value = self._remove(key)
+        if value is not _MISSING:
+            return value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def _remove(self, key):
+        """Remove `key` and return its value, or _MISSING if it is not present."""
+        node = self.root
+        path = []
+        while node.children is not None:
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        i = bisect_left(node.keys, key)
+        if i == len(node.keys) or node.keys[i] != key:
+            return _MISSING
+        del node.keys[i]
+        value = node.values.pop(i)
+        self.size -= 1
+        self._rebalance(node, path)
+        return value
+
+    def _rebalance(self, node, path):
+        """Fix underfull nodes from `node` up along `path` by borrowing from or merging with a sibling."""
+        min_keys = self.min_keys
+        while path and len(node.keys) < min_keys:
+            parent, i = path.pop()
+            left = parent.children[i - 1] if i > 0 else None
+            right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+            if node.children is None:
+                if left is not None and len(left.keys) > min_keys:
+                    node.keys.insert(0, left.keys.pop())
+                    node.values.insert(0, left.values.pop())
+                    parent.keys[i - 1] = node.keys[0]
+                    return
+                if right is not None and len(right.keys) > min_keys:
+                    node.keys.append(right.keys.pop(0))
+                    node.values.append(right.values.pop(0))
+                    parent.keys[i] = right.keys[0]
+                    return
+                if left is not None:
+                    node, right, i = left, node, i - 1
+                # Merge `right` into `node` and unlink it from the leaf chain
+                node.keys.extend(right.keys)
+                node.values.extend(right.values)
+                node.next = right.next
+                if right.next is not None:
+                    right.next.prev = node
+                else:
+                    self.tail = node
+            else:
+                if left is not None and len(left.keys) > min_keys:
+                    # Rotate through the parent: separator down, left's last key up
+                    node.keys.insert(0, parent.keys[i - 1])
+                    parent.keys[i - 1] = left.keys.pop()
+                    node.children.insert(0, left.children.pop())
+                    return
+                if right is not None and len(right.keys) > min_keys:
+                    node.keys.append(parent.keys[i])
+                    parent.keys[i] = right.keys.pop(0)
+                    node.children.append(right.children.pop(0))
+                    return
+                if left is not None:
+                    node, right, i = left, node, i - 1
+                # Merge `right` into `node`, pulling the separator between them down
+                node.keys.append(parent.keys[i])
+                node.keys.extend(right.keys)
+                node.children.extend(right.children)
+            del parent.keys[i]
+            del parent.children[i + 1]
+            node = parent
+        if self.root.children is not None and not self.root.keys:
+            self.root = self.root.children[0]
+            self.height -= 1
+
+    def minimum(self):
+        """Return a cursor at the smallest key, or None if the tree is empty."""
+        return BTreeCursor(self.head, 0) if self.size else None
+
+    def maximum(self):
+        """Return a cursor at the largest key, or None if the tree is empty."""
+        return BTreeCursor(self.tail, len(self.tail.keys) - 1) if self.size else None
+
+    def successor(self, x):
+        """
+        Return a cursor at the key after cursor `x`, or None if `x` is at the largest key.
+        """
+        if x.index + 1 < len(x.leaf.keys):
+            return BTreeCursor(x.leaf, x.index + 1)
+        if x.leaf.next is not None:
+            return BTreeCursor(x.leaf.next, 0)
+        return None
+
+    def predecessor(self, x):
+        """
+        Return a cursor at the key before cursor `x`, or None if `x` is at the smallest key.
+        """
+        if x.index > 0:
+            return BTreeCursor(x.leaf, x.index - 1)
+        if x.leaf.prev is not None:
+            return BTreeCursor(x.leaf.prev, len(x.leaf.prev.keys) - 1)
+        return None
+
+    def successor_key(self, key):
+        """Smallest key greater than `key` (which need not be present), or None."""
+        leaf = self._leaf(key)
+        i = bisect_right(leaf.keys, key)
+        if i == len(leaf.keys):
+            leaf = leaf.next
+            i = 0
+        return leaf.keys[i] if leaf is not None else None
+
+    def range(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yield the (key, value) pairs with lo <= key < hi in order, or in
+        reverse order with reverse=True. Either bound may be None.
+
+        The scan descends once to the first leaf and then follows the leaf links.
+        """
+        if not reverse:
+            if lo is None:
+                leaf, i = self.head, 0
+            else:
+                leaf = self._leaf(lo)
+                i = bisect_left(leaf.keys, lo)
+            while leaf is not None:
+                keys = leaf.keys
+                end = len(keys) if hi is None else bisect_left(keys, hi)
+                for j in range(i, end):
+                    yield keys[j], leaf.values[j]
+                if end < len(keys):
+                    return
+                leaf, i = leaf.next, 0
+        else:
+            if hi is None:
+                leaf = self.tail
+                i = len(leaf.keys)
+            else:
+                leaf = self._leaf(hi)
+                i = bisect_left(leaf.keys, hi)
+            while leaf is not None:
+                keys = leaf.keys
+                start = 0 if lo is None else bisect_left(keys, lo)
+                for j in range(i - 1, start - 1, -1):
+                    yield keys[j], leaf.values[j]
+                if start > 0:
+                    return
+                leaf = leaf.prev
+                if leaf is not None:
+                    i = len(leaf.keys)
+
+    def items(self, reverse=False):
+        return self.range(reverse=reverse)
+
+    def __iter__(self):
+        leaf = self.head
+        while leaf is not None:
+            yield from leaf.keys
+            leaf = leaf.next
+
+    @classmethod
+    def from_sorted(cls, keys, values=None, fanout=64, fill=1.0):
+        """
+        Build a tree from keys in ascending order in O(n), bottom-up.
+        :param keys: An iterable of keys in strictly ascending order.
+        :param values: Optional iterable of values, parallel to `keys`.
+        :param fanout: As for BTree().
+        :param fill: Fraction of each node to fill (between 0.5 and 1); leaving
+                     room makes later inserts split less often.
+        :raises ValueError: If the keys are not strictly ascending.
+        """
+        tree = cls(fanout)
+        keys = list(keys)
+        values = list(values) if values is not None else [None] * len(keys)
+        for a, b in zip(keys, keys[1:]):
+            if not a < b:
+                raise ValueError("from_sorted() needs strictly ascending keys")
+        if not keys:
+            return tree
+        per_node = max(tree.min_keys, min(tree.max_keys, int(tree.max_keys * fill)))
+
+        def chunks(n, size, least):
+            # Split range(n) into runs of about `size`, none shorter than `least`
+            count = max(1, min(-(-n // size), n // least))
+            bounds = [n * j // count for j in range(count + 1)]
+            return list(zip(bounds, bounds[1:]))
+
+        leaves = []
+        for start, stop in chunks(len(keys), per_node, tree.min_keys):
+            leaf = BTreeNode(keys[start:stop], None, values[start:stop])
+            if leaves:
+                leaves[-1].next = leaf
+                leaf.prev = leaves[-1]
+            leaves.append(leaf)
+        tree.head, tree.tail = leaves[0], leaves[-1]
+        level = leaves
+        lows = [leaf.keys[0] for leaf in leaves]  # Smallest key under each node of `level`
+        while len(level) > 1:
+            parents, parent_lows = [], []
+            for start, stop in chunks(len(level), per_node + 1, tree.min_keys + 1):
+                parents.append(BTreeNode(lows[start + 1:stop], level[start:stop]))
+                parent_lows.append(lows[start])
+            level, lows = parents, parent_lows
+            tree.height += 1
+        tree.root = level[0]
+        tree.size = len(keys)
+        return tree
+
+    def validate(self):
+        """
+        Check the B+ tree invariants.
+
+        Every node must hold sorted keys within the size limits (the root may
+        have fewer), internal nodes one more child than keys, all leaves must
+        be at the same depth with every key inside its separators' bounds, and
+        the leaf chain, head, tail, size and height must match the tree.
+        :return: The number of keys.
+        :raises AssertionError: Describing the first violation found.
+        """
+        leaves = []
+        stack = [(self.root, None, None, 1)]  # (node, lower bound, upper bound, depth)
+        while stack:
+            node, lo, hi, depth = stack.pop()
+            keys = node.keys
+            if any(not a < b for a, b in zip(keys, keys[1:])):
+                raise AssertionError(f"node keys {keys} are not strictly increasing")
+            if len(keys) > self.max_keys:
+                raise AssertionError(f"node holds {len(keys)} keys, more than {self.max_keys}")
+            if node is not self.root and len(keys) < self.min_keys:
+                raise AssertionError(f"node holds {len(keys)} keys, fewer than {self.min_keys}")
+            if keys and ((lo is not None and keys[0] < lo) or (hi is not None and not keys[-1] < hi)):
+                raise AssertionError(f"node keys {keys} fall outside [{lo}, {hi})")
+            if node.children is None:
+                if depth != self.height:
+                    raise AssertionError(f"leaf at depth {depth}, but the height is {self.height}")
+                if len(node.values) != len(keys):
+                    raise AssertionError("leaf has a different number of keys and values")
+                leaves.append(node)
+                continue
+            if len(node.children) != len(keys) + 1:
+                raise AssertionError(f"node with {len(keys)} keys has {len(node.children)} children")
+            if node is self.root and not keys:
+                raise AssertionError("internal root has no keys")
+            bounds = [lo] + keys + [hi]
+            # Pushed right to left so leaves are collected in key order
+            for j in reversed(range(len(node.children))):
+                stack.append((node.children[j], bounds[j], bounds[j + 1], depth + 1))
+
+        if self.head is not leaves[0] or self.tail is not leaves[-1]:
+            raise AssertionError("head or tail is not the first or last leaf")
+        for a, b in zip(leaves, leaves[1:]):
+            if a.next is not b or b.prev is not a:
+                raise AssertionError("leaf links do not follow key order")
+        if leaves[0].prev is not None or leaves[-1].next is not None:
+            raise AssertionError("leaf chain does not end at the first and last leaves")
+        count = sum(len(leaf.keys) for leaf in leaves)
+        if count != self.size:
+            raise AssertionError(f"size is {self.size} but the leaves hold {count} keys")
+        return count
+
+    def print_tree_structure(self):
+        """Print the keys of every node, one level per line."""
+        level = [self.root]
+        while level:
+            print(" ".join(str(node.keys) for node in level))
+            level = [child for node in level if node.children is not None for child in node.children]
+
+
+if __name__ == "__main__":
+    tree = BTree(fanout=4)
+    for key in [30, 15, 70, 10, 20, 60, 85, 5, 50, 65, 80, 90, 40, 55]:
+        tree.insert(key)
+    tree.print_tree_structure()
+    print("In order:", list(tree))
+    print("Search 60:", tree.search(60) is not None)
+    print("Minimum:", tree.minimum().key, "Maximum:", tree.maximum().key)
+    print("Successor of 55:", tree.successor(tree.search(55)).key)
+    print("Keys in [20, 65):", [key for key, _ in tree.range(20, 65)])
+    for key in [70, 15, 5]:
+        tree.delete(key)
+    tree.print_tree_structure()
+    tree.validate()
@@ -0,0 +1,105 @@
+import argparse
+import random
+import time
+
+from btree import BTree
+from red_black_tree import RedBlackTree
+from skiplist import SkipList
+from workloads import random_keys, zipf_keys
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def scan_rbtree(tree, lo, width):
+    """Visit `width` keys from the first key >= lo by successor steps."""
+    nil = tree.T_nil
+    node, best = tree.root, nil
+    while node != nil:
+        if node.key < lo:
+            node = node.right
+        else:
+            best = node
+            node = node.left
+    seen = 0
+    while best is not None and best != nil and seen < width:
+        seen += 1
+        best = tree.successor(best)  # None after the largest key
+    return seen
+
+
+def scan_btree(tree, lo, width):
+    seen = 0
+    for _ in tree.range(lo):
+        seen += 1
+        if seen == width:
+            break
+    return seen
+
+
+def scan_skiplist(skip_list, lo, width):
+    seen = 0
+    for _ in skip_list.range(lo):
+        seen += 1
+        if seen == width:
+            break
+    return seen
+
+
+def engines(fanouts):
+    """name -> (factory taking n, lookup(structure, key), scan(structure, lo, width), delete(structure, key))"""
+    result = {
+        "rbtree": (lambda n: RedBlackTree(verbose=False), RedBlackTree.search, scan_rbtree,
+                   RedBlackTree.delete),
+        "skiplist": (lambda n: SkipList(expected_size=n, seed=0, verbose=False), SkipList.__contains__,
+                     scan_skiplist, SkipList.delete),
+    }
+    for fanout in fanouts:
+        result[f"btree-{fanout}"] = (lambda n, fanout=fanout: BTree(fanout=fanout), BTree.__contains__,
+                                     scan_btree, BTree.delete)
+    return result
+
+
+def run_engine(factory, lookup, scan, delete, n, queries, width):
+    """
+    Time one engine on a read-heavy workload: build by random inserts, then
+    uniform and Zipfian point lookups, short range scans, and a round of deletes.
+    :return: {phase: operations per second}
+    """
+    keys = random_keys(n)
+    rng = random.Random(1)
+    uniform = [rng.randrange(n) for _ in range(queries)]
+    zipfian = zipf_keys(n, queries, seed=2)
+    starts = [rng.randrange(n) for _ in range(queries // width + 1)]
+    victims = keys[:min(n, queries)]
+
+    structure = factory(n)
+    results = {"insert": n / timed(lambda: [structure.insert(k) for k in keys])}
+    results["lookup"] = queries / timed(lambda: [lookup(structure, k) for k in uniform])
+    results["lookup-zipf"] = queries / timed(lambda: [lookup(structure, k) for k in zipfian])
+    scanned = []
+    elapsed = timed(lambda: scanned.extend(scan(structure, lo, width) for lo in starts))
+    results["scan keys"] = sum(scanned) / elapsed
+    results["delete"] = len(victims) / timed(lambda: [delete(structure, k) for k in victims])
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the B+ tree with the red-black tree and skip list on read-heavy ordered workloads.")
+    parser.add_argument("-n", type=int, nargs="+", default=[10000, 100000, 1000000], help="numbers of keys")
+    parser.add_argument("-q", type=int, default=200000, help="number of lookups per phase")
+    parser.add_argument("--width", type=int, default=100, help="keys visited per range scan")
+    parser.add_argument("--fanouts", type=int, nargs="+", default=[16, 64, 256])
+    args = parser.parse_args()
+
+    phases = ["insert", "lookup", "lookup-zipf", "scan keys", "delete"]
+    for n in args.n:
+        print(f"\nn={n}, {args.q} lookups, scans of {args.width} keys (operations per second)")
+        print(f"{'engine':<12}" + "".join(f"{phase:>13}" for phase in phases))
+        for name, (factory, lookup, scan, delete) in engines(args.fanouts).items():
+            results = run_engine(factory, lookup, scan, delete, n, args.q, args.width)
+            print(f"{name:<12}" + "".join(f"{results[phase]:>13.0f}" for phase in phases))
@@ -0,0 +1,370 @@
+from collections import OrderedDict
+
+from btree import BTree
+from hash import HashTable
+
+_MISSING = object()  # Marks "not cached", since None is a valid lookup result
+
+# Methods whose first argument is the key they change
+KEY_MUTATORS = ("insert", "delete", "pop", "set", "increase")
+# Methods whose first argument is a node; the node's key is invalidated
+NODE_MUTATORS = ("delete_node",)
+# Methods that may change any number of keys; they clear the caches
+BULK_MUTATORS = ("insert_many", "delete_many", "merge")
+# Methods known not to change any key; every other method reached through
+# the wrapper is assumed to mutate and clears the caches after it runs
+READ_METHODS = frozenset((
+    "search", "get", "find", "contains_many", "minimum", "maximum", "successor", "predecessor",
+    "successor_key", "range", "items", "rank", "count_range", "list_all_keys", "from_sorted",
+    "in_order_traversal", "calculate_height", "validate", "print_tree", "print_tree_structure",
+    "print_structure", "level_occupancy", "stats_report", "enable_stats", "disable_stats",
+    "_search", "_seek", "_leaf", "_hash",
+))
+
+
+class Cache:
+    """
+    Base class for the bounded caches: capacity and hit/miss statistics.
+
+    Subclasses implement get, put, discard, clear and __len__; lookup() is
+    the read-through entry point used by CachedStructure.
+    """
+    def __init__(self, capacity):
+        """
+        :param capacity: Maximum number of cached entries (at least 1).
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def lookup(self, key, loader):
+        """
+        Return the cached value for `key`, or call loader(key), cache its result and return it.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader(key)
+            self.put(key, value)
+        return value
+
+    @property
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def as_dict(self):
+        return {
+            "capacity": self.capacity,
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class LRUCache(Cache):
+    """Least-recently-used cache on an OrderedDict, most recent entry last."""
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self.data = OrderedDict()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def lookup(self, key, loader):
+        # Same as Cache.lookup, inlined: a hit is one dict probe and one move
+        data = self.data
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            data.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = data[key] = loader(key)
+        if len(data) > self.capacity:
+            data.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def get(self, key, default=None):
+        value = self.data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        data = self.data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self.capacity:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, key):
+        if self.data.pop(key, _MISSING) is not _MISSING:
+            self.invalidations += 1
+
+    def clear(self):
+        self.invalidations += len(self.data)
+        self.data.clear()
+
+
+class ARCCache(Cache):
+    """
+    Adaptive Replacement Cache (Megiddo and Modha, 2003).
+
+    Resident entries are split between t1 (seen once recently) and t2 (seen
+    at least twice); b1 and b2 remember the keys recently evicted from each.
+    A miss that hits a ghost list moves the target size `p` of t1 towards
+    the list that would have kept the key, so the cache adapts between
+    recency and frequency. Unlike LRU, a burst of one-off lookups (a scan)
+    only churns t1 and leaves the hot keys in t2 alone.
+    """
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()  # Ghost keys only; the values are None
+        self.b2 = OrderedDict()
+        self.p = 0.0  # Target size of t1
+
+    def __len__(self):
+        return len(self.t1) + len(self.t2)
+
+    def __contains__(self, key):
+        return key in self.t1 or key in self.t2
+
+    def get(self, key, default=None):
+        value = self.t2.get(key, _MISSING)
+        if value is not _MISSING:
+            self.t2.move_to_end(key)
+            self.hits += 1
+            return value
+        value = self.t1.pop(key, _MISSING)
+        if value is not _MISSING:
+            self.t2[key] = value  # Second use: promote to the frequency list
+            self.hits += 1
+            return value
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        t1, t2, b1, b2 = self.t1, self.t2, self.b1, self.b2
+        c = self.capacity
+        if key in t2:
+            t2[key] = value
+            t2.move_to_end(key)
+            return
+        if key in t1:
+            del t1[key]
+            t2[key] = value
+            return
+        if key in b1:
+            self.p = min(c, self.p + max(len(b2) / len(b1), 1))
+            del b1[key]
+            self._replace(False)
+            t2[key] = value
+            return
+        if key in b2:
+            self.p = max(0.0, self.p - max(len(b1) / len(b2), 1))
+            del b2[key]
+            self._replace(True)
+            t2[key] = value
+            return
+        if len(t1) + len(b1) >= c:
+            if len(t1) < c:
+                b1.popitem(last=False)
+                self._replace(False)
+            else:
+                t1.popitem(last=False)
+                self.evictions += 1
+        elif len(t1) + len(t2) + len(b1) + len(b2) >= c:
+            if len(t1) + len(t2) + len(b1) + len(b2) >= 2 * c:
+                b2.popitem(last=False)
+            self._replace(False)
+        t1[key] = value
+
+    def _replace(self, in_b2):
+        """Make room for one entry by moving the LRU key of t1 or t2 to its ghost list."""
+        if len(self.t1) + len(self.t2) < self.capacity:
+            return  # Invalidations left a free slot
+        t1_len = len(self.t1)
+        if self.t1 and (t1_len > self.p or (in_b2 and t1_len == self.p) or not self.t2):
+            key, _ = self.t1.popitem(last=False)
+            self.b1[key] = None
+        else:
+            key, _ = self.t2.popitem(last=False)
+            self.b2[key] = None
+        self.evictions += 1
+
+    def discard(self, key):
+        # The ghost entries carry no value, so they can stay
+        if self.t1.pop(key, _MISSING) is not _MISSING or self.t2.pop(key, _MISSING) is not _MISSING:
+            self.invalidations += 1
+
+    def clear(self):
+        self.invalidations += len(self)
+        for part in (self.t1, self.t2, self.b1, self.b2):
+            part.clear()
+        self.p = 0.0
+
+
+POLICIES = {
+    "lru": LRUCache,
+    "arc": ARCCache,
+}
+
+
+def default_methods(structure):
+    """
+    Lookups worth caching for a structure: the ones that return a result that
+    stays valid until its own key is inserted or deleted.
+
+    RedBlackTree, BST and SkipList search() results qualify (tree deletes
+    relink nodes rather than moving keys between them). A BTree's cursors
+    are invalidated by any split or merge, so its get() is cached instead.
+    """
+    if isinstance(structure, BTree):
+        return ("get",)
+    if isinstance(structure, HashTable):
+        return ("find",)
+    return ("search",)
+
+
+class CachedStructure:
+    """
+    Read-through cache in front of the lookups of an ordered structure.
+
+    Each cached method (by default see default_methods) gets its own bounded
+    LRU or ARC cache keyed by the lookup key, and repeated lookups of hot
+    keys are answered from it without descending the structure. Negative
+    results (None / False) are cached too.
+
+    Mutations must go through the wrapper: insert, delete, pop, set and
+    increase invalidate their key, delete_node invalidates the node's key,
+    and insert_many, delete_many and merge clear the caches. Other methods
+    are forwarded to the wrapped structure; those not in READ_METHODS also
+    clear the caches after they run, so an unknown mutator costs hit ratio
+    rather than serving stale results.
+    """
+    def __init__(self, structure, capacity=1024, policy="lru", methods=None):
+        """
+        :param structure: The structure to wrap, e.g. a RedBlackTree or SkipList.
+        :param capacity: Maximum number of cached entries per cached method.
+        :param policy: "lru" or "arc".
+        :param methods: Names of the lookup methods to cache, each taking the key
+                        as its only argument (default is default_methods(structure)).
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown cache policy {policy!r}; expected one of {sorted(POLICIES)}")
+        self.structure = structure
+        self.policy = policy
+        self.caches = {}
+        for method in default_methods(structure) if methods is None else methods:
+            cache = self.caches[method] = POLICIES[policy](capacity)
+            setattr(self, method, self._read_through(cache, getattr(structure, method)))
+        for method in KEY_MUTATORS + NODE_MUTATORS + BULK_MUTATORS:
+            bound = getattr(structure, method, None)
+            if callable(bound):
+                setattr(self, method, self._invalidating(method, bound))
+
+    @staticmethod
+    def _read_through(cache, loader):
+        lookup = cache.lookup
+
+        def cached(key):
+            return lookup(key, loader)
+        return cached
+
+    def _clearing(self, bound):
+        """Wrap `bound` so every cache is cleared after it runs."""
+        caches = list(self.caches.values())
+
+        def mutate(*args, **kwargs):
+            try:
+                return bound(*args, **kwargs)
+            finally:
+                for cache in caches:
+                    cache.clear()
+        return mutate
+
+    def _invalidating(self, method, bound):
+        if method in BULK_MUTATORS:
+            return self._clearing(bound)
+
+        caches = list(self.caches.values())
+        node_key = method in NODE_MUTATORS
+
+        def mutate(target, *args, **kwargs):
+            key = target.key if node_key else target
+            try:
+                return bound(target, *args, **kwargs)
+            finally:
+                for cache in caches:
+                    cache.discard(key)
+        return mutate
+
+    def invalidate(self, key=_MISSING):
+        """Drop `key` from every cache, or everything if no key is given."""
+        for cache in self.caches.values():
+            if key is _MISSING:
+                cache.clear()
+            else:
+                cache.discard(key)
+
+    def cache_stats(self):
+        """{cached method: statistics dict} for every cache."""
+        return {method: cache.as_dict() for method, cache in self.caches.items()}
+
+    def __getattr__(self, name):
+        # Only called for attributes not set on the wrapper itself
+        value = getattr(self.structure, name)
+        if not callable(value) or name in READ_METHODS or name.startswith("__"):
+            return value
+        return self._clearing(value)
+
+    def __len__(self):
+        return len(self.structure)
+
+    def __iter__(self):
+        return iter(self.structure)
+
+    def __contains__(self, key):
+        # `in` looks __contains__ up on the class, so a cached one is routed here
+        cache = self.caches.get("__contains__")
+        if cache is None:
+            return key in self.structure
+        return cache.lookup(key, self.structure.__contains__)
+
+
+if __name__ == "__main__":
+    from red_black_tree import RedBlackTree
+    from workloads import zipf_keys
+
+    tree = RedBlackTree(verbose=False)
+    for key in range(10000):
+        tree.insert(key)
+    for policy in POLICIES:
+        cached_tree = CachedStructure(tree, capacity=256, policy=policy)
+        for key in zipf_keys(10000, 50000, seed=1):
+            cached_tree.search(key)
+        cached_tree.delete(0)
+        assert cached_tree.search(0) is None
+        cached_tree.insert(0)
+        assert cached_tree.search(0).key == 0
+        print(policy, cached_tree.cache_stats()["search"])
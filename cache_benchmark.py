@@ -0,0 +1,83 @@
+import argparse
+import random
+import time
+
+from benchmark_suite import summarize
+from btree import BTree
+from cache import POLICIES, CachedStructure
+from red_black_tree import RedBlackTree
+from skiplist import SkipList
+from workloads import random_keys, zipf_keys
+
+# name -> (factory taking n, cached lookup method)
+STRUCTURES = {
+    "rbtree": (lambda n: RedBlackTree(verbose=False), "search"),
+    "skiplist": (lambda n: SkipList(expected_size=n, seed=0, verbose=False), "search"),
+    "btree": (lambda n: BTree(), "get"),
+}
+
+
+def build_ops(n, count, s, write_ratio, seed=0):
+    """
+    Zipfian operations over n keys, as (is write, key).
+
+    The popularity ranks are mapped to random keys, so the hot keys are
+    spread over the whole structure instead of sitting at its left edge. A
+    write deletes the key and inserts it again, which leaves the key set
+    unchanged but invalidates the cached entry.
+    """
+    keys = random_keys(n, seed)
+    rng = random.Random(seed + 1)
+    return keys, [(rng.random() < write_ratio, keys[rank]) for rank in zipf_keys(n, count, s=s, seed=seed)]
+
+
+def run(structure_name, policy, n, ops, keys, capacity):
+    """
+    Time every lookup of `ops` on one structure, cached with `policy` or uncached if it is None.
+    :return: (summary dict from benchmark_suite.summarize, cache statistics or None)
+    """
+    factory, method = STRUCTURES[structure_name]
+    structure = factory(n)
+    for key in keys:
+        structure.insert(key)
+    if policy is not None:
+        structure = CachedStructure(structure, capacity=capacity, policy=policy, methods=(method,))
+    lookup = getattr(structure, method)
+    latencies = []
+    clock = time.perf_counter_ns
+    for is_write, key in ops:
+        if is_write:
+            structure.delete(key)
+            structure.insert(key)
+            continue
+        start = clock()
+        lookup(key)
+        latencies.append(clock() - start)
+    stats = structure.cache_stats()[method] if policy is not None else None
+    return summarize(latencies), stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the LRU/ARC read-through cache on Zipfian lookups against the uncached structures.")
+    parser.add_argument("-n", type=int, default=100000, help="number of keys")
+    parser.add_argument("-q", type=int, default=200000, help="number of operations")
+    parser.add_argument("--skew", type=float, nargs="+", default=[0.8, 1.1, 1.3], help="Zipf exponents")
+    parser.add_argument("--capacity", type=int, default=1024, help="cache entries")
+    parser.add_argument("--write-ratio", type=float, default=0.0,
+                        help="fraction of operations that delete and re-insert the key")
+    parser.add_argument("--structures", nargs="+", default=list(STRUCTURES), choices=list(STRUCTURES))
+    args = parser.parse_args()
+
+    for s in args.skew:
+        keys, ops = build_ops(args.n, args.q, s, args.write_ratio)
+        print(f"\nn={args.n}, {args.q} operations, Zipf s={s}, capacity={args.capacity}, "
+              f"write ratio={args.write_ratio}")
+        print(f"{'structure':<10}{'cache':<6}{'ops/s':>11}{'p50 us':>9}{'p99 us':>9}{'p99.9 us':>10}"
+              f"{'hit ratio':>11}")
+        for name in args.structures:
+            for policy in [None] + list(POLICIES):
+                summary, stats = run(name, policy, args.n, ops, keys, args.capacity)
+                hit_ratio = f"{stats['hit_ratio']:.3f}" if stats else "-"
+                print(f"{name:<10}{policy or 'none':<6}{summary['ops_per_sec']:>11.0f}{summary['p50_us']:>9.2f}"
+                      f"{summary['p99_us']:>9.2f}{summary['p999_us']:>10.2f}{hit_ratio:>11}")
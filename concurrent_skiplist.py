@@ -0,0 +1,264 @@
+import math
+import random
+import threading
+import time
+
+_MISSING = object()  # Marks "no value" in pop(), since None is a valid value
+
+
+class ConcurrentNode:
+    def __init__(self, key, level, value=None):
+        self.key = key
+        self.value = value
+        # Forward references for each level
+        self.forward = [None] * (level + 1)
+        self.top_level = level
+        self.lock = threading.RLock()  # Held while this node's links are being changed
+        self.marked = False  # Set (under the lock) when the node is logically deleted
+        self.fully_linked = False  # Set once the node is linked at every level
+
+
+class ConcurrentSkipList:
+    """
+    Skip list map that is safe to share between threads.
+
+    Uses optimistic fine-grained locking (the "lazy" concurrent skip list of
+    Herlihy, Lev, Luchangco and Shavit). Writers search without locks, then
+    lock only the predecessors they are about to change and re-validate them,
+    retrying if another thread got there first. A node is deleted logically by
+    marking it before it is unlinked, so readers never take a lock: search and
+    get are wait-free and see a key exactly while it is fully linked and
+    unmarked, which makes them linearizable.
+
+    Link widths are not maintained here, so the indexing methods of
+    skiplist.SkipList (rank, sl[i], slicing) are not available.
+    """
+    def __init__(self, max_level=None, p=0.5, expected_size=65536, seed=None):
+        """
+        Initialize a concurrent skip list.
+        :param max_level: Maximum level for the skip list. By default it is derived
+                          from `expected_size` as log base 1/p of the size.
+        :param p: Probability for determining the level of each new node (default is 0.5).
+        :param expected_size: Number of keys the list is sized for when max_level is not given.
+        :param seed: Seed for the level generator.
+        """
+        if max_level is None:
+            max_level = max(1, math.ceil(math.log(max(expected_size, 2)) / math.log(1 / p)))
+        self.MAX_LEVEL = max_level
+        self.P = p
+        self.rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.header = ConcurrentNode(-float('inf'), self.MAX_LEVEL)
+        self.header.fully_linked = True
+
+    def random_level(self):
+        """
+        Generate a random level with P(level >= i) = P ** i, from a single draw.
+        """
+        with self._rng_lock:
+            u = self.rng.random()
+        return min(int(math.log(1.0 - u) / math.log(self.P)), self.MAX_LEVEL)
+
+    def _find(self, key, preds, succs):
+        """
+        Fill preds/succs with the nodes around `key` at every level, without locking.
+        :return: The highest level at which a node with `key` was found, or -1.
+        """
+        found = -1
+        pred = self.header
+        for i in reversed(range(self.MAX_LEVEL + 1)):
+            curr = pred.forward[i]
+            while curr is not None and curr.key < key:
+                pred = curr
+                curr = pred.forward[i]
+            if found == -1 and curr is not None and curr.key == key:
+                found = i
+            preds[i] = pred
+            succs[i] = curr
+        return found
+
+    def _lock_preds(self, preds, succs, top, check):
+        """
+        Lock preds[0..top] bottom-up and validate that each still links to succs[i].
+        :param check: Extra per-level validity test, check(pred, succ).
+        :return: (locked nodes, valid)
+        """
+        locked = []
+        prev = None
+        for i in range(top + 1):
+            pred = preds[i]
+            if pred is not prev:
+                pred.lock.acquire()
+                locked.append(pred)
+                prev = pred
+            if pred.marked or pred.forward[i] is not succs[i] or not check(pred, succs[i]):
+                return locked, False
+        return locked, True
+
+    def insert(self, key, value=None):
+        """
+        Insert `key` with `value`, or replace the value if the key is already present.
+        :return: True if the key was added, False if an existing value was replaced.
+        """
+        top = self.random_level()
+        preds = [None] * (self.MAX_LEVEL + 1)
+        succs = [None] * (self.MAX_LEVEL + 1)
+        while True:
+            found = self._find(key, preds, succs)
+            if found != -1:
+                node = succs[found]
+                if not node.marked:
+                    # Wait for a concurrent insert of the same key to finish linking
+                    while not node.fully_linked:
+                        time.sleep(0)
+                    with node.lock:
+                        if not node.marked:
+                            node.value = value
+                            return False
+                # The node is being deleted; retry once it is gone
+                continue
+
+            locked, valid = self._lock_preds(
+                preds, succs, top, lambda pred, succ: succ is None or not succ.marked)
+            try:
+                if not valid:
+                    continue
+                node = ConcurrentNode(key, top, value)
+                for i in range(top + 1):
+                    node.forward[i] = succs[i]
+                # Link bottom-up, so a node reachable at level i is reachable below it
+                for i in range(top + 1):
+                    preds[i].forward[i] = node
+                node.fully_linked = True
+                return True
+            finally:
+                for pred in locked:
+                    pred.lock.release()
+
+    def delete(self, key):
+        """
+        Remove `key`.
+        :return: True if the key was removed, False if it was not present.
+        """
+        return self.pop(key, _MISSING) is not _MISSING
+
+    def pop(self, key, default=None):
+        """
+        Remove `key` and return its value, or `default` if the key is not present.
+        """
+        victim = None
+        is_marked = False
+        top = -1
+        preds = [None] * (self.MAX_LEVEL + 1)
+        succs = [None] * (self.MAX_LEVEL + 1)
+        while True:
+            found = self._find(key, preds, succs)
+            if not is_marked:
+                if found == -1:
+                    return default
+                victim = succs[found]
+                # Only a fully linked node found at its top level can be deleted
+                if not victim.fully_linked or victim.top_level != found or victim.marked:
+                    if victim.marked:
+                        return default
+                    continue
+                top = victim.top_level
+                victim.lock.acquire()
+                if victim.marked:
+                    victim.lock.release()
+                    return default
+                # Logical deletion: from here on readers no longer see the key
+                victim.marked = True
+                is_marked = True
+
+            locked, valid = self._lock_preds(preds, succs, top, lambda pred, succ: True)
+            try:
+                if not valid:
+                    continue
+                # Unlink top-down
+                for i in reversed(range(top + 1)):
+                    preds[i].forward[i] = victim.forward[i]
+                value = victim.value
+                victim.lock.release()
+                return value
+            finally:
+                for pred in locked:
+                    pred.lock.release()
+
+    def search(self, key):
+        """
+        Wait-free membership test.
+        """
+        preds = [None] * (self.MAX_LEVEL + 1)
+        succs = [None] * (self.MAX_LEVEL + 1)
+        found = self._find(key, preds, succs)
+        return found != -1 and succs[found].fully_linked and not succs[found].marked
+
+    __contains__ = search
+
+    def get(self, key, default=None):
+        """
+        Wait-free lookup of the value stored for `key`.
+        """
+        node = self.header
+        for i in reversed(range(self.MAX_LEVEL + 1)):
+            while node.forward[i] is not None and node.forward[i].key < key:
+                node = node.forward[i]
+        node = node.forward[0]
+        if node is not None and node.key == key and node.fully_linked and not node.marked:
+            return node.value
+        return default
+
+    def items(self):
+        """
+        Lazily yield the (key, value) pairs in key order, skipping deleted nodes.
+
+        The walk is not a snapshot: pairs inserted or deleted while it runs
+        may or may not be seen.
+        """
+        node = self.header.forward[0]
+        while node is not None:
+            if node.fully_linked and not node.marked:
+                yield node.key, node.value
+            node = node.forward[0]
+
+    def __iter__(self):
+        for key, _ in self.items():
+            yield key
+
+    def validate(self):
+        """
+        Check the list structure while no other thread is modifying it.
+
+        Level 0 must hold strictly increasing keys, every node must be fully
+        linked and unmarked (deletions finished), and each higher level must
+        link, in order, exactly the level-0 nodes that reach it.
+        :return: The number of keys.
+        :raises AssertionError: Describing the first violation found.
+        """
+        nodes = []
+        node = self.header.forward[0]
+        while node is not None:
+            if nodes and not nodes[-1].key < node.key:
+                raise AssertionError(f"level 0 keys {nodes[-1].key}, {node.key} do not increase")
+            if not node.fully_linked or node.marked:
+                raise AssertionError(f"node {node.key} is not fully linked or is marked")
+            if len(node.forward) != node.top_level + 1 or node.top_level > self.MAX_LEVEL:
+                raise AssertionError(f"node {node.key} has {len(node.forward)} links for top level {node.top_level}")
+            nodes.append(node)
+            node = node.forward[0]
+        for i in range(1, self.MAX_LEVEL + 1):
+            expected = [n for n in nodes if n.top_level >= i]
+            linked = []
+            node = self.header.forward[i]
+            while node is not None and len(linked) <= len(expected):
+                linked.append(node)
+                node = node.forward[i]
+            if len(linked) != len(expected) or any(a is not b for a, b in zip(linked, expected)):
+                raise AssertionError(f"level {i} does not link the nodes that reach it")
+        return len(nodes)
+
+    def __len__(self):
+        """Count the live keys in O(n)."""
+        return sum(1 for _ in self.items())
+
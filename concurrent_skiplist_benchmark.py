@@ -0,0 +1,129 @@
+import argparse
+import random
+import threading
+import time
+
+from concurrent_skiplist import ConcurrentSkipList
+
+
+def check_structure(skip_list):
+    """
+    Check that every level is sorted, holds only unmarked nodes, and is a
+    subset of the level below it.
+    """
+    below = None
+    for i in range(skip_list.MAX_LEVEL + 1):
+        keys = []
+        node = skip_list.header.forward[i]
+        while node is not None:
+            assert not node.marked, f"marked node {node.key} still linked at level {i}"
+            keys.append(node.key)
+            node = node.forward[i]
+        assert keys == sorted(set(keys)), f"level {i} is not strictly increasing"
+        if below is not None:
+            assert set(keys) <= below, f"level {i} has keys missing from the level below"
+        below = set(keys)
+
+
+def stress(n_threads=8, ops=20000, key_space=2000, seed=0):
+    """
+    Hammer one list from n_threads threads and verify the result.
+
+    Every thread owns the keys congruent to its index, so the final contents
+    can be predicted from each thread's own operations, while all threads
+    still contend for the same predecessors. Readers run alongside and check
+    that get() never returns a value that was never stored for the key.
+    :raises AssertionError: If the final list is inconsistent.
+    """
+    skip_list = ConcurrentSkipList(expected_size=key_space, seed=seed)
+    expected = [dict() for _ in range(n_threads)]
+    errors = []
+    stop = threading.Event()
+
+    def writer(t):
+        rng = random.Random(seed + t)
+        mine = expected[t]
+        for _ in range(ops):
+            key = rng.randrange(key_space // n_threads) * n_threads + t
+            if rng.random() < 0.6:
+                skip_list.insert(key, (key, t))
+                mine[key] = (key, t)
+            else:
+                skip_list.delete(key)
+                mine.pop(key, None)
+
+    def reader():
+        rng = random.Random(seed)
+        while not stop.is_set():
+            key = rng.randrange(key_space)
+            value = skip_list.get(key)
+            if value is not None and value != (key, key % n_threads):
+                errors.append(f"get({key}) returned {value}")
+
+    writers = [threading.Thread(target=writer, args=(t,)) for t in range(n_threads)]
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert not errors, errors[:5]
+    check_structure(skip_list)
+    merged = {}
+    for mine in expected:
+        merged.update(mine)
+    assert dict(skip_list.items()) == merged, "final contents differ from the writers' operations"
+
+
+def throughput(n_threads, read_fraction, duration, key_space=100000):
+    """
+    Run a mixed workload for `duration` seconds.
+    :return: Operations per second across all threads.
+    """
+    skip_list = ConcurrentSkipList(expected_size=key_space, seed=0)
+    for key in random.Random(0).sample(range(key_space), key_space // 2):
+        skip_list.insert(key)
+    counts = [0] * n_threads
+    stop = threading.Event()
+
+    def worker(t):
+        rng = random.Random(t)
+        done = 0
+        while not stop.is_set():
+            key = rng.randrange(key_space)
+            r = rng.random()
+            if r < read_fraction:
+                skip_list.search(key)
+            elif r < (1 + read_fraction) / 2:
+                skip_list.insert(key)
+            else:
+                skip_list.delete(key)
+            done += 1
+        counts[t] = done
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / duration
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stress-test and benchmark ConcurrentSkipList.")
+    parser.add_argument("--threads", type=int, default=4, help="worker threads")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per throughput run")
+    args = parser.parse_args()
+
+    stress(n_threads=args.threads)
+    print(f"Stress test with {args.threads} threads passed")
+
+    print(f"{'reads':>6}{'ops/s':>12}")
+    for read_fraction in (0.5, 0.9, 0.99):
+        ops = throughput(args.threads, read_fraction, args.duration)
+        print(f"{read_fraction:>6.0%}{ops:>12.0f}")
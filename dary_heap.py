@@ -0,0 +1,408 @@
+from binomial_heap import MINUS_INFINITY
+
+
+class DaryHeapHandle:
+    """
+    Stable reference to one heap entry.
+
+    Entries move around the array as keys are sifted, so the heap keeps each
+    handle's position up to date. This position index is what lets
+    decrease_key and delete find an entry without searching.
+    """
+    def __init__(self, heap, pos, item_id=None):
+        self.heap = heap
+        self.pos = pos  # Index of the entry in the heap's arrays, or None once extracted
+        self.item_id = item_id  # User-supplied id, or None
+
+    @property
+    def key(self):
+        return self.heap.keys[self.pos] if self.pos is not None else None
+
+
+class DaryHeap:
+    """
+    Implicit d-ary min-heap stored in contiguous arrays.
+
+    Offers the same interface as BinomialHeap (insert, minimum, extract_min,
+    decrease_key, delete, union/meld, find_node, get, from_iterable,
+    extract_k_min, drain), but with no per-node objects: keys live in one list
+    and the children of position i are at d*i+1 .. d*i+d. Handles stand in
+    for nodes wherever BinomialHeap returns or accepts a node.
+
+    Union has to copy and re-heapify, so it costs O(n) rather than O(log n);
+    the binomial heap is the better engine for union-heavy workloads.
+    """
+    def __init__(self, d=4, index_keys=False, verbose=True):
+        """
+        Initialize an empty d-ary heap.
+
+        Args:
+          d (int): Number of children per node (default is 4).
+          index_keys (bool): Also index entries inserted without an item_id by
+            their key, so find_node(key) is O(1).
+          verbose (bool): Print the heap after every operation.
+        """
+        if d < 2:
+            raise ValueError("A d-ary heap needs d >= 2")
+        self.d = d
+        self.keys = []  # Heap-ordered keys
+        self.handles = []  # handles[i] is the handle of keys[i]
+        self.index = {}  # item_id (or key, with index_keys) -> DaryHeapHandle
+        self.index_keys = index_keys
+        self.verbose = verbose
+
+    @classmethod
+    def from_iterable(cls, keys, **kwargs):
+        """
+        Build a heap from an iterable of keys in O(n) with a bottom-up heapify.
+
+        Args:
+          keys: An iterable of keys.
+          **kwargs: Passed on to DaryHeap().
+
+        Returns:
+          DaryHeap: The new heap.
+        """
+        heap = cls(**kwargs)
+        heap.keys = list(keys)
+        heap.handles = [DaryHeapHandle(heap, i) for i in range(len(heap.keys))]
+        if heap.index_keys:
+            for key, handle in zip(heap.keys, heap.handles):
+                heap.index[key] = handle
+        heap._heapify()
+        return heap
+
+    def make_heap(self):
+        return DaryHeap(d=self.d, index_keys=self.index_keys, verbose=self.verbose)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _index_id(self, handle):
+        """Return the id `handle` is indexed under, or None if it is not indexed."""
+        if handle.item_id is not None:
+            return handle.item_id
+        if self.index_keys:
+            return handle.key
+        return None
+
+    def _unindex(self, handle):
+        index_id = self._index_id(handle)
+        if index_id is not None and self.index.get(index_id) is handle:
+            del self.index[index_id]
+
+    def get(self, item_id):
+        """
+        Return the handle indexed under `item_id` (a key, with index_keys), or None.
+        """
+        return self.index.get(item_id)
+
+    def _sift_up(self, pos):
+        """Move the entry at pos up until its parent is not larger."""
+        keys, handles, d = self.keys, self.handles, self.d
+        key, handle = keys[pos], handles[pos]
+        # Shift larger parents down into the hole instead of swapping
+        while pos > 0:
+            parent = (pos - 1) // d
+            if not key < keys[parent]:
+                break
+            keys[pos] = keys[parent]
+            handles[pos] = handles[parent]
+            handles[pos].pos = pos
+            pos = parent
+        keys[pos] = key
+        handles[pos] = handle
+        handle.pos = pos
+
+    def _sift_down(self, pos):
+        """Move the entry at pos down until no child is smaller."""
+        keys, handles, d = self.keys, self.handles, self.d
+        n = len(keys)
+        key, handle = keys[pos], handles[pos]
+        while True:
+            first = d * pos + 1
+            if first >= n:
+                break
+            # Find the smallest child
+            best = first
+            for child in range(first + 1, min(first + d, n)):
+                if keys[child] < keys[best]:
+                    best = child
+            if not keys[best] < key:
+                break
+            keys[pos] = keys[best]
+            handles[pos] = handles[best]
+            handles[pos].pos = pos
+            pos = best
+        keys[pos] = key
+        handles[pos] = handle
+        handle.pos = pos
+
+    def _heapify(self):
+        for pos in reversed(range((len(self.keys) - 2) // self.d + 1)):
+            self._sift_down(pos)
+
+    def insert(self, key, item_id=None):
+        """
+        Inserts a new key into the heap in O(log_d n).
+
+        Args:
+          key: The key to be inserted into the heap.
+          item_id: Optional hashable id to index the entry under, for get().
+
+        Returns:
+          DaryHeapHandle: A handle that stays valid until the entry is extracted.
+        """
+        handle = DaryHeapHandle(self, len(self.keys), item_id)
+        self.keys.append(key)
+        self.handles.append(handle)
+        index_id = self._index_id(handle)
+        if index_id is not None:
+            self.index[index_id] = handle
+        self._sift_up(handle.pos)
+
+        if self.verbose:
+            print(f"Inserted {key}")
+            self.print_heap()
+        return handle
+
+    def union(self, h2):
+        """
+        Union two heaps and return the resulting heap in O(n + m).
+
+        Both input heaps are consumed: their handles move to the new heap and
+        both are left empty, as meld leaves h2.
+
+        Args:
+          h2 (DaryHeap): The heap to be merged with the current heap.
+
+        Returns:
+          DaryHeap: A new heap containing all elements from both heaps.
+        """
+        new_heap = self.make_heap()
+        new_heap.keys = self.keys + h2.keys
+        new_heap.handles = self.handles + h2.handles
+        for pos, handle in enumerate(new_heap.handles):
+            handle.heap = new_heap
+            handle.pos = pos
+        new_heap.index = {**self.index, **h2.index}
+        new_heap._heapify()
+        for heap in (self, h2):
+            heap.keys, heap.handles, heap.index = [], [], {}
+        return new_heap
+
+    def meld(self, h2):
+        """
+        Union h2 into this heap in place, taking over its handles. h2 is left empty.
+
+        Small heaps are inserted key by key; otherwise the combined array is
+        heapified from scratch.
+
+        Args:
+          h2 (DaryHeap): The heap to absorb.
+        """
+        n, m = len(self.keys), len(h2.keys)
+        self.keys.extend(h2.keys)
+        self.handles.extend(h2.handles)
+        for pos in range(n, n + m):
+            self.handles[pos].heap = self
+            self.handles[pos].pos = pos
+        self.index.update(h2.index)
+        if m * max(1, (n + m).bit_length()) < n + m:
+            for pos in range(n, n + m):
+                self._sift_up(pos)
+        else:
+            self._heapify()
+        h2.keys, h2.handles, h2.index = [], [], {}
+
+    def minimum(self):
+        """
+        Return the handle of the minimum key in O(1), or None if the heap is empty.
+        """
+        return self.handles[0] if self.handles else None
+
+    def extract_min(self):
+        """
+        Extracts the minimum key from the heap and returns it.
+
+        Returns:
+          The minimum key in the heap, or None if the heap is empty.
+        """
+        if not self.keys:
+            return None
+        key = self._remove_at(0)
+        if self.verbose:
+            print(f"Extracted minimum key {key}")
+            self.print_heap()
+        return key
+
+    def _remove_at(self, pos):
+        """Remove the entry at pos, retire its handle and return its key."""
+        keys, handles = self.keys, self.handles
+        key, handle = keys[pos], handles[pos]
+        self._unindex(handle)
+        handle.pos = None
+
+        # Fill the hole with the last entry and restore the heap order
+        last_key, last_handle = keys.pop(), handles.pop()
+        if pos < len(keys):
+            keys[pos] = last_key
+            handles[pos] = last_handle
+            last_handle.pos = pos
+            if pos > 0 and last_key < keys[(pos - 1) // self.d]:
+                self._sift_up(pos)
+            else:
+                self._sift_down(pos)
+        return key
+
+    def _pop_min(self):
+        """extract_min without printing."""
+        return self._remove_at(0)
+
+    def extract_k_min(self, k):
+        """
+        Generator that extracts up to k minimum keys in ascending order.
+
+        Args:
+          k (int): The maximum number of keys to extract.
+
+        Yields:
+          The extracted keys, smallest first.
+        """
+        for _ in range(k):
+            if not self.keys:
+                return
+            yield self._pop_min()
+
+    def drain(self):
+        """
+        Generator that extracts every key in ascending order, emptying the heap.
+
+        Yields:
+          The extracted keys, smallest first.
+        """
+        while self.keys:
+            yield self._pop_min()
+
+    def decrease_key(self, x, k):
+        """
+        Decreases the key of an entry in O(log_d n).
+
+        Parameters:
+        x (DaryHeapHandle): The handle of the entry whose key is to be decreased.
+        k: The new key value. It must be less than or equal to the current key.
+
+        Raises:
+        ValueError: If the handle is stale or the new key is greater than the current key.
+        """
+        if x.pos is None or x.heap is not self:
+            raise ValueError("Handle refers to an entry that is not in this heap")
+        if k > self.keys[x.pos]:
+            raise ValueError("New key is greater than current key")
+
+        # Entries indexed by their key have to be re-indexed under the new key
+        rekey = x.item_id is None and self.index_keys
+        if rekey:
+            self._unindex(x)
+        self.keys[x.pos] = k
+        if rekey:
+            self.index[k] = x
+        self._sift_up(x.pos)
+
+        if self.verbose:
+            print(f"Decreased key to {k}")
+            self.print_heap()
+
+    def delete(self, x):
+        """
+        Delete the entry held by handle x in O(log_d n).
+        """
+        self.decrease_key(x, MINUS_INFINITY)
+        self.extract_min()
+
+    def find_node(self, key):
+        """
+        Find the handle of an entry with the given key.
+
+        With index_keys this is an O(1) dictionary lookup; otherwise the array
+        is scanned.
+
+        Returns:
+          The handle of an entry with the specified key if found, otherwise None.
+        """
+        if self.index_keys:
+            handle = self.index.get(key)
+            if handle is not None:
+                return handle
+        for pos, stored in enumerate(self.keys):
+            if stored == key:
+                return self.handles[pos]
+        return None
+
+    def validate(self):
+        """
+        Check the heap order and the handle bookkeeping.
+
+        No key may be smaller than its parent's, every handle must record its
+        own position and this heap, and every index entry must point at a
+        handle in the heap that is indexed under that id.
+
+        Returns:
+          int: The number of entries in the heap.
+
+        Raises:
+          AssertionError: Describing the first violation found.
+        """
+        keys, handles, d = self.keys, self.handles, self.d
+        if len(keys) != len(handles):
+            raise AssertionError(f"{len(keys)} keys but {len(handles)} handles")
+        for pos, handle in enumerate(handles):
+            if handle.pos != pos or handle.heap is not self:
+                raise AssertionError(f"handle at position {pos} records position {handle.pos}")
+            if pos > 0 and keys[pos] < keys[(pos - 1) // d]:
+                raise AssertionError(f"key {keys[pos]} at position {pos} is smaller than its parent "
+                                     f"{keys[(pos - 1) // d]}")
+        for index_id, handle in self.index.items():
+            if handle.pos is None or handle.heap is not self or handles[handle.pos] is not handle:
+                raise AssertionError(f"index entry {index_id!r} points at an entry not in the heap")
+            if self._index_id(handle) != index_id:
+                raise AssertionError(f"index entry {index_id!r} holds the handle of {self._index_id(handle)!r}")
+        return len(keys)
+
+    def print_heap(self):
+        print(f"Current {self.d}-ary Heap:")
+        if not self.keys:
+            print("Heap is empty")
+            return
+        # One line per level; level l holds d**l positions
+        start, width = 0, 1
+        while start < len(self.keys):
+            print(" ".join(str(key) for key in self.keys[start:start + width]))
+            start += width
+            width *= self.d
+        print("-" * 40)
+
+
+# Testing the d-ary heap
+if __name__ == "__main__":
+    heap = DaryHeap(d=3)
+
+    keys = [27, 11, 8, 17, 14, 38, 6, 29, 12, 18, 1, 25, 10]
+    handles = {key: heap.insert(key) for key in keys}
+
+    print(f"\nMinimum key in the heap: {heap.minimum().key}\n")
+
+    heap.extract_min()
+
+    heap.decrease_key(handles[12], 5)
+
+    heap.delete(handles[25])
+
+    heap2 = DaryHeap(d=3)
+    heap2.insert(3)
+    heap2.insert(7)
+    heap.meld(heap2)
+    print("Heap after union with second heap:")
+    heap.print_heap()
+
+    print("Drained in order:", list(heap.drain()))
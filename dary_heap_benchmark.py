@@ -0,0 +1,89 @@
+import argparse
+import random
+import time
+
+from binomial_heap import BinomialHeap
+from dary_heap import DaryHeap
+
+ENGINES = {
+    "binomial": lambda: BinomialHeap(verbose=False),
+    "binomial-lazy": lambda: BinomialHeap(lazy=True, verbose=False),
+    "binary": lambda: DaryHeap(d=2, verbose=False),
+    "4-ary": lambda: DaryHeap(d=4, verbose=False),
+}
+
+
+def insert_heavy(make_heap, n):
+    """Insert n random keys, then extract n // 100 minimums."""
+    rng = random.Random(0)
+    keys = [rng.random() for _ in range(n)]
+    start = time.perf_counter()
+    heap = make_heap()
+    for key in keys:
+        heap.insert(key)
+    for _ in range(n // 100):
+        heap.extract_min()
+    return time.perf_counter() - start
+
+
+def union_heavy(make_heap, n, size):
+    """Meld n // size heaps of `size` keys into one, extracting a minimum after each meld."""
+    rng = random.Random(0)
+    batches = [[rng.random() for _ in range(size)] for _ in range(n // size)]
+    start = time.perf_counter()
+    merged = make_heap()
+    for batch in batches:
+        heap = make_heap()
+        for key in batch:
+            heap.insert(key)
+        merged.meld(heap)
+        merged.extract_min()
+    return time.perf_counter() - start
+
+
+def random_graph(n, degree, seed=0):
+    """Return adjacency lists of a random directed graph with n vertices."""
+    rng = random.Random(seed)
+    return [[(rng.randrange(n), rng.randrange(1, 100)) for _ in range(degree)] for _ in range(n)]
+
+
+def dijkstra(make_heap, graph, source=0):
+    """
+    Single-source shortest paths with one heap entry per vertex and
+    decrease_key on every edge relaxation that improves a distance.
+    """
+    start = time.perf_counter()
+    heap = make_heap()
+    dist = [float("inf")] * len(graph)
+    handles = [None] * len(graph)
+    dist[source] = 0
+    handles[source] = heap.insert((0, source))
+    done = [False] * len(graph)
+    while heap.minimum() is not None:
+        d, u = heap.extract_min()
+        done[u] = True
+        for v, weight in graph[u]:
+            alt = d + weight
+            if not done[v] and alt < dist[v]:
+                dist[v] = alt
+                if handles[v] is None:
+                    handles[v] = heap.insert((alt, v))
+                else:
+                    heap.decrease_key(handles[v], (alt, v))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the binomial and d-ary heap engines.")
+    parser.add_argument("-n", type=int, default=100000, help="number of keys / vertices")
+    args = parser.parse_args()
+
+    graph = random_graph(args.n // 10, 16)
+    workloads = {
+        "insert-heavy": lambda make: insert_heavy(make, args.n),
+        "union-heavy": lambda make: union_heavy(make, args.n, 100),
+        "dijkstra": lambda make: dijkstra(make, graph),
+    }
+    print(f"{'workload':<14}" + "".join(f"{name:>15}" for name in ENGINES))
+    for name, run in workloads.items():
+        print(f"{name:<14}" + "".join(f"{run(make):>15.4f}" for make in ENGINES.values()))
@@ -0,0 +1,586 @@
+import argparse
+import bisect
+import heapq
+import random
+import time
+
+from binomial_heap import BinomialHeap
+from bst import BST
+from btree import BTree
+from concurrent_skiplist import ConcurrentSkipList
+from dary_heap import DaryHeap
+from flat import flatten, view
+from hash import HashTable
+from red_black_tree import RedBlackTree
+from skiplist import SkipList
+
+
+class Divergence(AssertionError):
+    """A structure disagreed with its reference or failed validate()."""
+
+
+class Replay:
+    """
+    Drives one randomized run and reports where it went wrong.
+
+    Every failure message carries the harness name, the seed and the index
+    of the operation, so `python differential.py --structures NAME --seed S
+    --ops N` replays the run up to the failing operation.
+    """
+    def __init__(self, name, seed, check_every):
+        self.name = name
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.check_every = check_every
+        self.step = 0
+        self.last_op = None
+
+    def op(self, description):
+        self.step += 1
+        self.last_op = description
+
+    def expect(self, got, expected, what):
+        if got != expected:
+            self.fail(f"{what}: got {got!r}, expected {expected!r}")
+
+    def check(self, structure, size, force=False):
+        """Run validate() every `check_every` operations and compare the size it reports."""
+        if not force and self.step % self.check_every:
+            return
+        try:
+            count = structure.validate()
+        except AssertionError as e:
+            self.fail(f"validate() failed: {e}")
+        self.expect(count, size, "validate() count")
+
+    def fail(self, message):
+        raise Divergence(f"[{self.name} seed={self.seed} op #{self.step} {self.last_op}] {message}")
+
+
+def in_order(tree, nil=None):
+    """Keys of a BST or RedBlackTree in order, walked iteratively."""
+    keys = []
+    stack = []
+    node = tree.root
+    while stack or node is not nil:
+        while node is not nil:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        keys.append(node.key)
+        node = node.right
+    return keys
+
+
+def run_hash(replay, n_ops, key_space):
+    """HashTable against a dict."""
+    rng = replay.rng
+    table = HashTable(m=rng.choice([1, 7, 64, 1009]))
+    reference = {}
+    for _ in range(n_ops):
+        key = f"k{rng.randrange(key_space)}"
+        r = rng.random()
+        if r < 0.3:
+            value = rng.randrange(1000)
+            replay.op(f"insert({key!r}, {value})")
+            table.insert(key, value)
+            reference[key] = value
+        elif r < 0.6:
+            amount = rng.randrange(1, 4)
+            replay.op(f"increase({key!r}, {amount})")
+            table.increase(key, amount)
+            reference[key] = reference.get(key, 0) + amount
+        elif r < 0.75 and key in reference:
+            replay.op(f"delete({key!r})")
+            table.delete(key)
+            del reference[key]
+        else:
+            replay.op(f"find({key!r})")
+            replay.expect(table.find(key), reference.get(key), "find")
+        replay.check(table, len(reference))
+    replay.expect(sorted(table.items()), sorted(reference.items()), "items")
+    replay.check(table, len(reference), force=True)
+
+
+def run_bst(replay, n_ops, key_space, balance=None):
+    """BST (with a balancing policy) against a sorted list; duplicate keys are allowed."""
+    rng = replay.rng
+    tree = BST(balance=balance, verbose=False)
+    reference = []
+    for _ in range(n_ops):
+        key = rng.randrange(key_space)
+        r = rng.random()
+        if len(reference) >= 2 * key_space:
+            r = 0.35 + 0.2 * r  # Only deletes until the size is back under the cap
+        if r < 0.35:
+            replay.op(f"insert({key})")
+            tree.insert(key)
+            bisect.insort(reference, key)
+        elif r < 0.55:
+            replay.op(f"delete({key})")
+            tree.delete(key)
+            i = bisect.bisect_left(reference, key)
+            if i < len(reference) and reference[i] == key:
+                del reference[i]
+        elif r < 0.85:
+            replay.op(f"search({key})")
+            node = tree.search(key)
+            i = bisect.bisect_left(reference, key)
+            replay.expect(node is not None, i < len(reference) and reference[i] == key, "search")
+        elif r < 0.9 and reference:
+            replay.op("minimum/maximum")
+            replay.expect(tree.minimum().key, reference[0], "minimum")
+            replay.expect(tree.maximum().key, reference[-1], "maximum")
+        elif r < 0.95:
+            batch = [rng.randrange(key_space) for _ in range(rng.randrange(1, 20))]
+            if rng.random() < 0.5:
+                replay.op(f"insert_many({batch})")
+                tree.insert_many(batch)
+                for key in batch:
+                    bisect.insort(reference, key)
+            else:
+                replay.op(f"delete_many({batch})")
+                deleted = 0
+                for key in sorted(batch):
+                    i = bisect.bisect_left(reference, key)
+                    if i < len(reference) and reference[i] == key:
+                        del reference[i]
+                        deleted += 1
+                replay.expect(tree.delete_many(batch), deleted, "delete_many")
+        else:
+            batch = [rng.randrange(key_space) for _ in range(rng.randrange(1, 20))]
+            replay.op(f"contains_many({batch})")
+            present = set(reference)
+            replay.expect(tree.contains_many(batch), [key in present for key in batch], "contains_many")
+        replay.check(tree, len(reference))
+    replay.expect(in_order(tree), reference, "in-order keys")
+    replay.check(tree, len(reference), force=True)
+
+
+def run_rbtree(replay, n_ops, key_space):
+    """RedBlackTree against a sorted list; duplicate keys are allowed."""
+    rng = replay.rng
+    tree = RedBlackTree(verbose=False)
+    reference = []
+    for _ in range(n_ops):
+        key = rng.randrange(key_space)
+        r = rng.random()
+        if len(reference) >= 2 * key_space:
+            r = 0.4 + 0.3 * r  # Only deletes until the size is back under the cap
+        if r < 0.4:
+            replay.op(f"insert({key})")
+            tree.insert(key)
+            bisect.insort(reference, key)
+        elif r < 0.7:
+            replay.op(f"delete({key})")
+            tree.delete(key)
+            i = bisect.bisect_left(reference, key)
+            if i < len(reference) and reference[i] == key:
+                del reference[i]
+        elif r < 0.95:
+            replay.op(f"search({key})")
+            node = tree.search(key)
+            i = bisect.bisect_left(reference, key)
+            replay.expect(node is not None, i < len(reference) and reference[i] == key, "search")
+        elif reference:
+            replay.op("minimum/maximum")
+            replay.expect(tree.minimum().key, reference[0], "minimum")
+            replay.expect(tree.maximum().key, reference[-1], "maximum")
+        replay.check(tree, len(reference))
+    replay.expect(in_order(tree, tree.T_nil), reference, "in-order keys")
+    replay.check(tree, len(reference), force=True)
+
+
+def run_skiplist(replay, n_ops, key_space):
+    """SkipList map against a sorted key list and a dict, including indexing and bulk builds."""
+    rng = replay.rng
+    skip_list = SkipList(expected_size=key_space, seed=replay.seed, verbose=False)
+    keys = []
+    values = {}
+    for _ in range(n_ops):
+        key = rng.randrange(key_space)
+        r = rng.random()
+        if r < 0.3:
+            replay.op(f"insert({key})")
+            skip_list.insert(key, replay.step)
+            if key not in values:
+                bisect.insort(keys, key)
+            values[key] = replay.step
+        elif r < 0.45:
+            replay.op(f"pop({key})")
+            replay.expect(skip_list.pop(key, None), values.pop(key, None), "pop")
+            i = bisect.bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+        elif r < 0.65:
+            replay.op(f"get({key})")
+            replay.expect(skip_list.get(key), values.get(key), "get")
+            replay.expect(skip_list.search(key), key in values, "search")
+        elif r < 0.8:
+            replay.op(f"rank({key})")
+            replay.expect(skip_list.rank(key), bisect.bisect_left(keys, key), "rank")
+            hi = key + rng.randrange(key_space // 4 + 1)
+            replay.expect(skip_list.count_range(key, hi),
+                          bisect.bisect_left(keys, hi) - bisect.bisect_left(keys, key), "count_range")
+        elif r < 0.95 and keys:
+            index = rng.randrange(-len(keys), len(keys))
+            replay.op(f"sl[{index}]")
+            replay.expect(skip_list[index], keys[index], "index")
+            lo = rng.randrange(len(keys))
+            replay.expect(skip_list[lo:lo + 5], keys[lo:lo + 5], "slice")
+        elif r < 0.98:
+            randomized = rng.random() < 0.5
+            p = rng.choice((0.5, 0.25, 0.75, 0.9))
+            replay.op(f"rebuild with from_sorted(randomized={randomized}, p={p})")
+            skip_list = SkipList.from_sorted(keys, [values[k] for k in keys],
+                                             randomized=randomized, p=p, seed=replay.step,
+                                             verbose=False)
+            if not randomized:
+                # Deterministic levels branch by at least 2, so no level exceeds log2(n)
+                replay.expect(skip_list.level <= max(1, len(keys)).bit_length(), True, "from_sorted level")
+        else:
+            extra = sorted({rng.randrange(key_space) for _ in range(rng.randrange(1, 30))})
+            replay.op(f"merge({extra})")
+            other = SkipList.from_sorted(extra, [-k for k in extra], verbose=False)
+            skip_list.merge(other)
+            for k in extra:
+                if k not in values:
+                    bisect.insort(keys, k)
+                values[k] = -k
+        replay.check(skip_list, len(keys))
+    replay.expect(list(skip_list.items()), [(k, values[k]) for k in keys], "items")
+    replay.expect(list(reversed(skip_list)), keys[::-1], "reversed")
+    replay.check(skip_list, len(keys), force=True)
+
+
+def run_btree(replay, n_ops, key_space, fanout=4):
+    """BTree map against a sorted key list and a dict; a small fanout exercises splits and merges."""
+    rng = replay.rng
+    tree = BTree(fanout=fanout)
+    keys = []
+    values = {}
+    for _ in range(n_ops):
+        key = rng.randrange(key_space)
+        r = rng.random()
+        if r < 0.35:
+            replay.op(f"insert({key})")
+            replay.expect(tree.insert(key, replay.step), key not in values, "insert")
+            if key not in values:
+                bisect.insort(keys, key)
+            values[key] = replay.step
+        elif r < 0.6:
+            replay.op(f"pop({key})")
+            replay.expect(tree.pop(key, None), values.pop(key, None), "pop")
+            i = bisect.bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+        elif r < 0.75:
+            replay.op(f"get({key})")
+            replay.expect(tree.get(key), values.get(key), "get")
+            i = bisect.bisect_right(keys, key)
+            replay.expect(tree.successor_key(key), keys[i] if i < len(keys) else None, "successor_key")
+        elif r < 0.9:
+            hi = key + rng.randrange(key_space // 4 + 1)
+            reverse = rng.random() < 0.5
+            replay.op(f"range({key}, {hi}, reverse={reverse})")
+            expected = keys[bisect.bisect_left(keys, key):bisect.bisect_left(keys, hi)]
+            replay.expect([k for k, _ in tree.range(key, hi, reverse=reverse)],
+                          expected[::-1] if reverse else expected, "range")
+        elif r < 0.995 and keys:
+            replay.op(f"successor/predecessor walk from {key}")
+            cursor = tree.search(keys[bisect.bisect_left(keys, key) % len(keys)])
+            i = bisect.bisect_left(keys, cursor.key)
+            step = tree.successor(cursor)
+            replay.expect(step.key if step else None, keys[i + 1] if i + 1 < len(keys) else None, "successor")
+            step = tree.predecessor(cursor)
+            replay.expect(step.key if step else None, keys[i - 1] if i > 0 else None, "predecessor")
+        else:
+            replay.op("rebuild with from_sorted")
+            tree = BTree.from_sorted(keys, [values[k] for k in keys], fanout=fanout,
+                                     fill=rng.uniform(0.5, 1.0))
+        replay.check(tree, len(keys))
+    replay.expect(list(tree.items()), [(k, values[k]) for k in keys], "items")
+    replay.check(tree, len(keys), force=True)
+
+
+def run_binomial(replay, n_ops, key_space, lazy=False):
+    """BinomialHeap with handles against a heapq with lazy deletion."""
+    rng = replay.rng
+    heap = BinomialHeap(lazy=lazy, verbose=False)
+    handles = {}  # item id -> handle
+    keys = {}  # item id -> current key
+    pending = []  # heapq of (key, item id); entries whose key is stale are skipped
+    next_id = 0
+
+    def reference_min():
+        while pending and keys.get(pending[0][1]) != pending[0][0]:
+            heapq.heappop(pending)
+        return pending[0][0] if pending else None
+
+    def forget_extracted(key):
+        # Among the live entries with this key, the extracted one is the handle without a node
+        for item_id in [i for i, k in keys.items() if k == key]:
+            if handles[item_id].node is None:
+                del handles[item_id], keys[item_id]
+                return
+        replay.fail(f"no entry with key {key!r} was extracted")
+
+    for _ in range(n_ops):
+        r = rng.random()
+        if len(keys) >= 2 * key_space:
+            r = 0.45 + 0.25 * r  # Only extractions until the size is back under the cap
+        if r < 0.45 or not keys:
+            key = rng.randrange(key_space)
+            replay.op(f"insert({key})")
+            handles[next_id] = heap.insert(key, item_id=next_id)
+            keys[next_id] = key
+            heapq.heappush(pending, (key, next_id))
+            next_id += 1
+        elif r < 0.7:
+            replay.op("extract_min")
+            expected = reference_min()
+            got = heap.extract_min()
+            replay.expect(got, expected, "extract_min")
+            forget_extracted(got)
+        elif r < 0.85:
+            item_id = rng.choice(list(keys))
+            key = keys[item_id] - rng.randrange(key_space // 10 + 1)
+            replay.op(f"decrease_key(#{item_id}, {key})")
+            heap.decrease_key(handles[item_id], key)
+            keys[item_id] = key
+            heapq.heappush(pending, (key, item_id))
+        elif r < 0.95:
+            item_id = rng.choice(list(keys))
+            replay.op(f"delete(#{item_id})")
+            heap.delete(handles[item_id])
+            replay.expect(handles[item_id].node, None, "deleted handle")
+            del handles[item_id], keys[item_id]
+        else:
+            batch = [rng.randrange(key_space) for _ in range(rng.randrange(1, 10))]
+            replay.op(f"meld({batch})")
+            other = BinomialHeap(lazy=lazy, verbose=False)
+            for key in batch:
+                handles[next_id] = other.insert(key, item_id=next_id)
+                keys[next_id] = key
+                heapq.heappush(pending, (key, next_id))
+                next_id += 1
+            heap.meld(other)
+        replay.expect(heap.minimum().key if heap.head is not None else None, reference_min(), "minimum")
+        replay.check(heap, len(keys))
+    replay.check(heap, len(keys), force=True)
+    drained = [heap.extract_min() for _ in range(len(keys))]
+    replay.expect(drained, sorted(keys.values()), "drain order")
+
+
+
+def run_dary(replay, n_ops, key_space, d=4):
+    """DaryHeap with handles against a heapq with lazy deletion."""
+    rng = replay.rng
+    heap = DaryHeap(d=d, verbose=False)
+    handles = {}  # item id -> handle
+    keys = {}  # item id -> current key
+    pending = []  # heapq of (key, item id); entries whose key is stale are skipped
+    next_id = 0
+
+    def reference_min():
+        while pending and keys.get(pending[0][1]) != pending[0][0]:
+            heapq.heappop(pending)
+        return pending[0][0] if pending else None
+
+    def forget_extracted(key):
+        # Among the live entries with this key, the extracted one is the handle without a position
+        for item_id in [i for i, k in keys.items() if k == key]:
+            if handles[item_id].pos is None:
+                del handles[item_id], keys[item_id]
+                return
+        replay.fail(f"no entry with key {key!r} was extracted")
+
+    for _ in range(n_ops):
+        r = rng.random()
+        if len(keys) >= 2 * key_space:
+            r = 0.45 + 0.25 * r  # Only extractions until the size is back under the cap
+        if r < 0.45 or not keys:
+            key = rng.randrange(key_space)
+            replay.op(f"insert({key})")
+            handles[next_id] = heap.insert(key, item_id=next_id)
+            keys[next_id] = key
+            heapq.heappush(pending, (key, next_id))
+            next_id += 1
+        elif r < 0.7:
+            replay.op("extract_min")
+            expected = reference_min()
+            got = heap.extract_min()
+            replay.expect(got, expected, "extract_min")
+            forget_extracted(got)
+        elif r < 0.85:
+            item_id = rng.choice(list(keys))
+            key = keys[item_id] - rng.randrange(key_space // 10 + 1)
+            replay.op(f"decrease_key(#{item_id}, {key})")
+            heap.decrease_key(handles[item_id], key)
+            keys[item_id] = key
+            heapq.heappush(pending, (key, item_id))
+        elif r < 0.95:
+            item_id = rng.choice(list(keys))
+            replay.op(f"delete(#{item_id})")
+            heap.delete(handles[item_id])
+            replay.expect(handles[item_id].pos, None, "deleted handle")
+            replay.expect(heap.get(item_id), None, "get after delete")
+            del handles[item_id], keys[item_id]
+        else:
+            batch = [rng.randrange(key_space) for _ in range(rng.randrange(1, 10 if r < 0.98 else 200))]
+            replay.op(f"meld({batch})")
+            other = DaryHeap(d=d, verbose=False)
+            for key in batch:
+                handles[next_id] = other.insert(key, item_id=next_id)
+                keys[next_id] = key
+                heapq.heappush(pending, (key, next_id))
+                next_id += 1
+            heap.meld(other)
+            replay.expect(len(other), 0, "melded heap size")
+        minimum = heap.minimum()
+        replay.expect(minimum.key if minimum is not None else None, reference_min(), "minimum")
+        replay.check(heap, len(keys))
+    replay.check(heap, len(keys), force=True)
+    replay.expect(list(heap.drain()), sorted(keys.values()), "drain order")
+
+
+def run_concurrent_skiplist(replay, n_ops, key_space):
+    """ConcurrentSkipList map, driven from one thread, against a dict."""
+    rng = replay.rng
+    skip_list = ConcurrentSkipList(expected_size=key_space, seed=replay.seed)
+    values = {}
+    for _ in range(n_ops):
+        key = rng.randrange(key_space)
+        r = rng.random()
+        if r < 0.35:
+            replay.op(f"insert({key})")
+            replay.expect(skip_list.insert(key, replay.step), key not in values, "insert")
+            values[key] = replay.step
+        elif r < 0.5:
+            replay.op(f"pop({key})")
+            replay.expect(skip_list.pop(key, None), values.pop(key, None), "pop")
+        elif r < 0.6:
+            replay.op(f"delete({key})")
+            replay.expect(skip_list.delete(key), values.pop(key, None) is not None, "delete")
+        elif r < 0.995:
+            replay.op(f"get({key})")
+            replay.expect(skip_list.get(key), values.get(key), "get")
+            replay.expect(key in skip_list, key in values, "search")
+        else:
+            replay.op("items")
+            replay.expect(list(skip_list.items()), sorted(values.items()), "items")
+            replay.expect(len(skip_list), len(values), "len")
+        replay.check(skip_list, len(values))
+    replay.expect(list(skip_list.items()), sorted(values.items()), "items")
+    replay.check(skip_list, len(values), force=True)
+
+
+def run_flat(replay, n_ops, key_space):
+    """
+    flatten() then view() of a HashTable, RedBlackTree, SkipList and BTree,
+    with every lookup of the views checked against a dict.
+    """
+    rng = replay.rng
+    table = HashTable(m=rng.choice([1, 7, 64, 1009]))
+    trees = [RedBlackTree(verbose=False), SkipList(expected_size=key_space, seed=replay.seed, verbose=False),
+             BTree(fanout=4)]
+    values = {}
+    for _ in range(n_ops):
+        key = rng.randrange(key_space)
+        r = rng.random()
+        if r < 0.55:
+            replay.op(f"insert({key})")
+            table.insert(f"k{key}", replay.step)
+            if key not in values:
+                trees[0].insert(key)
+            for tree in trees[1:]:
+                tree.insert(key, replay.step)
+            values[key] = replay.step
+        elif r < 0.98:
+            if key in values:
+                replay.op(f"delete({key})")
+                table.delete(f"k{key}")
+                for tree in trees:
+                    tree.delete(key)
+                del values[key]
+        else:
+            replay.op("flatten and view")
+            keys = sorted(values)
+            probes = [rng.randrange(-1, key_space + 1) for _ in range(50)]
+            hash_view = view(flatten(table))
+            replay.expect(sorted(hash_view.items()), sorted((f"k{k}", v) for k, v in values.items()), "hash items")
+            for probe in probes:
+                replay.expect(hash_view.find(f"k{probe}"), values.get(probe), "hash find")
+                replay.expect(f"k{probe}" in hash_view, probe in values, "hash contains")
+            hash_view.close()
+            for tree in trees:
+                sorted_view = view(flatten(tree))
+                has_values = not isinstance(tree, RedBlackTree)
+                what = type(tree).__name__
+                replay.expect(list(sorted_view), keys, f"{what} keys")
+                replay.expect(sorted_view.min(), keys[0] if keys else None, f"{what} min")
+                replay.expect(sorted_view.max(), keys[-1] if keys else None, f"{what} max")
+                for probe in probes:
+                    i = bisect.bisect_left(keys, probe)
+                    j = bisect.bisect_right(keys, probe)
+                    replay.expect(sorted_view.rank(probe), i, f"{what} rank")
+                    replay.expect(probe in sorted_view, probe in values, f"{what} contains")
+                    replay.expect(sorted_view.get(probe), values.get(probe) if has_values else None, f"{what} get")
+                    replay.expect(sorted_view.successor(probe), keys[j] if j < len(keys) else None,
+                                  f"{what} successor")
+                    hi = probe + rng.randrange(key_space // 4 + 1)
+                    replay.expect(list(sorted_view.range(probe, hi)), keys[i:bisect.bisect_left(keys, hi)],
+                                  f"{what} range")
+                sorted_view.close()
+        replay.check(table, len(values))
+    for structure in [table] + trees:
+        replay.check(structure, len(values), force=True)
+
+
+HARNESSES = {
+    "hash": run_hash,
+    "bst": run_bst,
+    "bst-avl": lambda replay, n, k: run_bst(replay, n, k, balance="avl"),
+    "bst-treap": lambda replay, n, k: run_bst(replay, n, k, balance="treap"),
+    "bst-splay": lambda replay, n, k: run_bst(replay, n, k, balance="splay"),
+    "rbtree": run_rbtree,
+    "skiplist": run_skiplist,
+    "btree": run_btree,
+    "btree-64": lambda replay, n, k: run_btree(replay, n, k, fanout=64),
+    "binomial": run_binomial,
+    "binomial-lazy": lambda replay, n, k: run_binomial(replay, n, k, lazy=True),
+    "dary-2": lambda replay, n, k: run_dary(replay, n, k, d=2),
+    "dary-4": run_dary,
+    "dary-8": lambda replay, n, k: run_dary(replay, n, k, d=8),
+    "concurrent-skiplist": run_concurrent_skiplist,
+    "flat": run_flat,
+}
+
+
+def run(name, n_ops, seed=0, key_space=512, check_every=1000):
+    """
+    Replay `n_ops` random operations on one structure and its reference.
+    :raises Divergence: On the first disagreement or failed validate().
+    """
+    replay = Replay(name, seed, check_every)
+    HARNESSES[name](replay, n_ops, key_space)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Differential testing: replay random operations against reference implementations "
+                    "and validate() the invariants along the way. Exits non-zero on the first divergence.")
+    parser.add_argument("--structures", nargs="+", default=list(HARNESSES), choices=list(HARNESSES))
+    parser.add_argument("--ops", type=int, default=1_000_000, help="operations per structure and seed")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--seeds", type=int, default=1, help="number of consecutive seeds to run")
+    parser.add_argument("--key-space", type=int, default=512, help="keys are drawn from range(key_space)")
+    parser.add_argument("--check-every", type=int, default=1000, help="operations between validate() calls")
+    args = parser.parse_args()
+
+    for name in args.structures:
+        for seed in range(args.seed, args.seed + args.seeds):
+            start = time.perf_counter()
+            run(name, args.ops, seed, args.key_space, args.check_every)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<20} seed {seed}: {args.ops} ops OK in {elapsed:.1f} s ({args.ops / elapsed:.0f} ops/s)")
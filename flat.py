@@ -0,0 +1,288 @@
+import bisect
+import struct
+from multiprocessing import shared_memory
+
+from bst import BST
+from btree import BTree
+from hash import HashTable
+from red_black_tree import RedBlackTree
+from skiplist import SkipList
+
+# magic, version, kind, key type, value type, n, m, blob length
+HEADER = struct.Struct("<4sBBBBQQQ")
+MAGIC = b"FLAT"
+VERSION = 1
+
+KIND_HASH, KIND_SORTED = 1, 2
+KEYS_INT, KEYS_STR = 0, 1
+VALUES_NONE, VALUES_INT = 0, 1
+
+_INT64 = struct.Struct("<q")
+
+
+def _pad(n):
+    return -n % 8
+
+
+def _encode_keys(keys):
+    """Return (key type, packed arrays) for a list of all-int or all-str keys."""
+    if all(isinstance(k, str) for k in keys):
+        data = [k.encode("utf-8") for k in keys]
+        offsets = [0]
+        for d in data:
+            offsets.append(offsets[-1] + len(d))
+        blob = b"".join(data)
+        return KEYS_STR, struct.pack(f"<{len(offsets)}Q", *offsets), blob + bytes(_pad(len(blob)))
+    if all(isinstance(k, int) and not isinstance(k, bool) for k in keys):
+        return KEYS_INT, struct.pack(f"<{len(keys)}q", *keys), b""
+    raise ValueError("only all-int or all-str keys can be flattened")
+
+
+def _encode_values(values):
+    if values is None:
+        return VALUES_NONE, b""
+    if not all(isinstance(v, int) for v in values):
+        raise ValueError("only integer values (counts) can be flattened")
+    return VALUES_INT, struct.pack(f"<{len(values)}q", *values)
+
+
+def _in_order(root, nil):
+    """Nodes of a BST or RedBlackTree in key order, walked iteratively."""
+    stack = []
+    node = root
+    while stack or node is not nil:
+        while node is not nil:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def flatten(structure):
+    """
+    Serialize a structure into one contiguous, position-independent buffer.
+
+    A HashTable keeps its bucket layout: the entries are grouped by bucket,
+    with an array of bucket start offsets, so a view hashes a key exactly
+    like the table and scans the same chain. RedBlackTree, BST, SkipList and
+    BTree become a sorted key array (plus a value array for a SkipList or
+    BTree with integer values), which a view binary-searches. Keys must be
+    all ints or all strings; values must be integers.
+    :return: bytes laid out as HEADER followed by 8-byte aligned arrays.
+    """
+    if isinstance(structure, HashTable):
+        keys, values, starts = [], [], [0]
+        for head in structure.table:
+            current = head
+            while current is not None:
+                keys.append(current.key)
+                values.append(current.value)
+                current = current.next
+            starts.append(len(keys))
+        m = structure.m
+        prefix = struct.pack(f"<{len(starts)}Q", *starts)
+        kind = KIND_HASH
+    else:
+        values = None
+        if isinstance(structure, RedBlackTree):
+            keys = [node.key for node in _in_order(structure.root, structure.T_nil)]
+        elif isinstance(structure, BST):
+            keys = [node.key for node in _in_order(structure.root, None)]
+        elif isinstance(structure, (SkipList, BTree)):
+            keys, values = [], []
+            for key, value in structure.items():
+                keys.append(key)
+                values.append(value)
+            if all(v is None for v in values):
+                values = None
+        else:
+            raise TypeError(f"cannot flatten {type(structure).__name__}")
+        m = 0
+        prefix = b""
+        kind = KIND_SORTED
+
+    key_type, offsets, blob = _encode_keys(keys)
+    value_type, packed_values = _encode_values(values)
+    header = HEADER.pack(MAGIC, VERSION, kind, key_type, value_type, len(keys), m, len(blob))
+    return b"".join((header, prefix, offsets, blob, packed_values))
+
+
+class FlatView:
+    """
+    Read-only view over a flattened buffer (bytes, mmap or shared memory).
+
+    Nothing is copied or decoded up front: the arrays are memoryview casts of
+    the buffer, and keys are decoded only when a query touches them, so
+    opening a view is O(1) whatever the size of the index.
+    """
+    def __init__(self, buffer, owner=None):
+        """
+        :param buffer: Object supporting the buffer protocol, holding the output of flatten().
+        :param owner: Object to keep alive (and close) along with the view, e.g. a SharedMemory.
+        """
+        self._owner = owner
+        self._buffer = memoryview(buffer).toreadonly()
+        magic, version, self.kind, self.key_type, self.value_type, self.n, self.m, blob_len = \
+            HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a flattened structure")
+        self._views = []
+        pos = HEADER.size
+        if self.kind == KIND_HASH:
+            self._starts = self._cast(pos, self.m + 1, "Q")
+            pos += 8 * (self.m + 1)
+        if self.key_type == KEYS_STR:
+            self._offsets = self._cast(pos, self.n + 1, "Q")
+            pos += 8 * (self.n + 1)
+            self._blob = self._buffer[pos:pos + blob_len]
+            self._views.append(self._blob)
+            pos += blob_len
+        else:
+            self._ints = self._cast(pos, self.n, "q")
+            pos += 8 * self.n
+        self._values = self._cast(pos, self.n, "q") if self.value_type == VALUES_INT else None
+
+    def _cast(self, pos, count, fmt):
+        view = self._buffer[pos:pos + 8 * count].cast(fmt)
+        self._views.append(view)
+        return view
+
+    def _key(self, i):
+        if self.key_type == KEYS_INT:
+            return self._ints[i]
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+
+    def _value(self, i):
+        return self._values[i] if self._values is not None else None
+
+    def __len__(self):
+        return self.n
+
+    def items(self):
+        for i in range(self.n):
+            yield self._key(i), self._value(i)
+
+    def close(self):
+        """Release the memoryviews and close the owner (the process's mapping of shared memory)."""
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._buffer.release()
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class FlatHashView(FlatView):
+    """Read-only HashTable: find() hashes the key with HashTable._hash and scans one bucket."""
+    _hash = HashTable._hash  # Reads self.m, so the buckets match the flattened table
+
+    def find(self, key):
+        """Find the value associated with the key, or None."""
+        index = self._hash(key)
+        data = key.encode("utf-8")
+        offsets = self._offsets
+        for i in range(self._starts[index], self._starts[index + 1]):
+            start = offsets[i]
+            if offsets[i + 1] - start == len(data) and self._blob[start:offsets[i + 1]] == data:
+                return self._values[i]
+        return None
+
+    def __contains__(self, key):
+        return self.find(key) is not None
+
+
+class FlatSortedView(FlatView):
+    """Read-only sorted keys of a RedBlackTree, BST, SkipList or BTree, queried by binary search."""
+    def _bisect(self, key, right=False):
+        lo, hi = 0, self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k = self._key(mid)
+            if k < key or (right and k == key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def rank(self, key):
+        """Number of keys smaller than `key`, like bisect_left."""
+        return self._bisect(key)
+
+    def __contains__(self, key):
+        i = self._bisect(key)
+        return i < self.n and self._key(i) == key
+
+    def get(self, key, default=None):
+        i = self._bisect(key)
+        if i < self.n and self._key(i) == key:
+            return self._value(i)
+        return default
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.n
+        if not 0 <= index < self.n:
+            raise IndexError("index out of range")
+        return self._key(index)
+
+    def min(self):
+        return self._key(0) if self.n else None
+
+    def max(self):
+        return self._key(self.n - 1) if self.n else None
+
+    def successor(self, key):
+        """Smallest key greater than `key`, or None."""
+        i = self._bisect(key, right=True)
+        return self._key(i) if i < self.n else None
+
+    def range(self, lo=None, hi=None):
+        """Yield the keys k with lo <= k < hi in order (either bound may be None)."""
+        start = self._bisect(lo) if lo is not None else 0
+        stop = self._bisect(hi) if hi is not None else self.n
+        for i in range(start, stop):
+            yield self._key(i)
+
+    def __iter__(self):
+        return self.range()
+
+
+def view(buffer, owner=None):
+    """Open the right read-only view for a buffer written by flatten()."""
+    kind = HEADER.unpack_from(buffer)[2]
+    cls = FlatHashView if kind == KIND_HASH else FlatSortedView
+    return cls(buffer, owner)
+
+
+def share(structure, name=None):
+    """
+    Flatten `structure` into a new shared memory block.
+
+    Pass the block's name to worker processes, which open it with attach().
+    The caller owns the block: close() it when done and unlink() it once no
+    process needs it any more.
+    :return: The multiprocessing.shared_memory.SharedMemory holding the buffer.
+    """
+    data = flatten(structure)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(1, len(data)))
+    shm.buf[:len(data)] = data
+    return shm
+
+
+def attach(name):
+    """
+    Map the shared memory block `name` and return a read-only view of it, in O(1).
+
+    Closing the view unmaps the block from this process.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    return view(shm.buf, owner=shm)
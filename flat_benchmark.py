@@ -0,0 +1,58 @@
+import argparse
+import pickle
+import random
+import time
+
+import flat
+from hash import HashTable
+from red_black_tree import RedBlackTree
+
+
+def build(structure, n, seed=0):
+    rng = random.Random(seed)
+    if structure == "hash":
+        table = HashTable(m=max(1, n // 4))
+        for i in range(n):
+            table.insert(f"w{i}", i)
+        return table, [f"w{rng.randrange(n)}" for _ in range(10000)]
+    tree = RedBlackTree(verbose=False)
+    for key in rng.sample(range(4 * n), n):
+        tree.insert(key)
+    return tree, [rng.randrange(4 * n) for _ in range(10000)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare unpickling a structure with attaching to its flattened shared-memory copy.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--structures", nargs="+", default=["hash", "rbtree"], choices=["hash", "rbtree"])
+    args = parser.parse_args()
+
+    print(f"{'structure':<9} {'n':>8} {'pickle MB':>9} {'unpickle s':>10} {'flat MB':>8} {'attach s':>9}"
+          f" {'copy q/s':>10} {'view q/s':>10}")
+    for structure in args.structures:
+        for n in args.sizes:
+            original, queries = build(structure, n)
+            data = pickle.dumps(original)
+            unpickle_s, copy = timed(lambda: pickle.loads(data))
+            lookup = copy.find if structure == "hash" else copy.search
+            query_s, _ = timed(lambda: [lookup(q) for q in queries])
+
+            shm = flat.share(original)
+            try:
+                attach_s, view = timed(lambda: flat.attach(shm.name))
+                lookup = view.find if structure == "hash" else view.__contains__
+                view_s, _ = timed(lambda: [lookup(q) for q in queries])
+                view.close()
+            finally:
+                shm.close()
+                shm.unlink()
+            print(f"{structure:<9} {n:>8} {len(data) / 2 ** 20:>9.1f} {unpickle_s:>10.4f}"
+                  f" {shm.size / 2 ** 20:>8.1f} {attach_s:>9.6f}"
+                  f" {len(queries) / query_s:>10.0f} {len(queries) / view_s:>10.0f}")
@@ -1,6 +1,9 @@
-import re
-import numpy as np
-import matplotlib.pyplot as plt
+import struct
+
+from tokenizer import Tokenizer, read_text
+
+# numpy and matplotlib are only needed by analyze_collisions and are imported
+# there, so counting jobs that never plot don't pay for loading them.
 
 class Node:
     """Node class for linked list in hash table collision management."""
@@ -29,18 +32,45 @@ class HashTable:
 
         return hash_value
 
-    def insert(self, key, value):
-        """Insert a key-value pair into the hash table."""
+    @staticmethod
+    def _counted_walk(current, key, probe_counter):
+        """
+        Walk a chain from `current` to the node holding `key`, or to its end.
+
+        Calls probe_counter with the number of nodes visited and returns the
+        node, or None. find, insert and increase take this path only when a
+        probe_counter is given, so their usual loops pay nothing for it.
+        """
+        probes = 0
+        while current is not None:
+            probes += 1
+            if current.key == key:
+                break
+            current = current.next
+        probe_counter(probes)
+        return current
+
+    def insert(self, key, value, probe_counter=None):
+        """
+        Insert a key-value pair into the hash table.
+        :param probe_counter: Optional callable, called with the number of chain nodes visited.
+        """
         index = self._hash(key)
         head = self.table[index]
         
         # Check if key already exists in the list
-        current = head
-        while current is not None:
-            if current.key == key:
-                current.value = value  # Update value if key is found
+        if probe_counter is not None:
+            current = self._counted_walk(head, key, probe_counter)
+            if current is not None:
+                current.value = value
                 return
-            current = current.next
+        else:
+            current = head
+            while current is not None:
+                if current.key == key:
+                    current.value = value  # Update value if key is found
+                    return
+                current = current.next
         
         # Insert new node at the beginning of the list
         new_node = Node(key, value)
@@ -66,46 +96,124 @@ class HashTable:
             current = current.next
         print(f"Key {key} not found for deletion.")
 
-    def increase(self, key):
-        """Increase the value associated with the key by 1."""
+    def increase(self, key, amount=1, probe_counter=None):
+        """
+        Increase the value associated with the key by `amount` (default 1).
+        :param probe_counter: Optional callable, called with the number of chain nodes visited.
+        """
         index = self._hash(key)
         current = self.table[index]
         
+        if probe_counter is not None:
+            current = self._counted_walk(current, key, probe_counter)
+            if current is not None:
+                current.value += amount
+                return
         while current is not None:
             if current.key == key:
-                current.value += 1
+                current.value += amount
                 return
             current = current.next
 
-        # If key doesn't exist, insert it with value 1
-        self.insert(key, 1)
+        # If key doesn't exist, insert it with value `amount`
+        self.insert(key, amount)
 
-    def find(self, key):
-        """Find the value associated with the key."""
+    def find(self, key, probe_counter=None):
+        """
+        Find the value associated with the key.
+        :param probe_counter: Optional callable, called with the number of chain nodes visited.
+        """
         index = self._hash(key)
         current = self.table[index]
         
+        if probe_counter is not None:
+            current = self._counted_walk(current, key, probe_counter)
+            return current.value if current is not None else None
         while current is not None:
             if current.key == key:
                 return current.value
             current = current.next
         return None
 
-    def list_all_keys(self):
-        """List all keys and their counts."""
-        result = []
+    def __getstate__(self):
+        # Flat lists instead of the linked nodes, so pickling never recurses
+        # down a chain (long chains would hit the recursion limit)
+        keys, values, sizes = [], [], []
         for head in self.table:
+            size = 0
             current = head
             while current is not None:
-                result.append((current.key, current.value))
+                keys.append(current.key)
+                values.append(current.value)
+                size += 1
                 current = current.next
-        return result
+            sizes.append(size)
+        state = {k: v for k, v in self.__dict__.items() if k != "table"}
+        state["chains"] = (keys, values, sizes)
+        return state
 
-def process_text(text, hash_table):
-    """Process the text to insert word counts into the hash table."""
-    words = re.findall(r'\b\w+\b', text.lower()) # make the words lowercase, and extract the individual words
-    for word in words:
-        hash_table.increase(word) # increase the count of the word by 1
+    def __setstate__(self, state):
+        keys, values, sizes = state.pop("chains")
+        self.__dict__.update(state)
+        self.table = [None] * self.m
+        i = 0
+        for index, size in enumerate(sizes):
+            tail = None
+            for _ in range(size):
+                node = Node(keys[i], values[i])
+                if tail is None:
+                    self.table[index] = node
+                else:
+                    tail.next = node
+                tail = node
+                i += 1
+
+    def validate(self):
+        """
+        Check that every key sits in the bucket its hash selects, appears only once
+        and that no chain loops back on itself. Returns the number of keys and
+        raises AssertionError on the first violation.
+        """
+        if len(self.table) != self.m:
+            raise AssertionError(f"table has {len(self.table)} buckets but m is {self.m}")
+        keys = set()
+        for index, head in enumerate(self.table):
+            seen = set()
+            current = head
+            while current is not None:
+                if id(current) in seen:
+                    raise AssertionError(f"chain of bucket {index} loops")
+                seen.add(id(current))
+                if self._hash(current.key) != index:
+                    raise AssertionError(f"key {current.key!r} is in bucket {index}, not {self._hash(current.key)}")
+                if current.key in keys:
+                    raise AssertionError(f"key {current.key!r} is stored twice")
+                keys.add(current.key)
+                current = current.next
+        return len(keys)
+
+    def items(self):
+        """Lazily yield all keys and their counts, in bucket order."""
+        for head in self.table:
+            current = head
+            while current is not None:
+                yield current.key, current.value
+                current = current.next
+
+    def list_all_keys(self):
+        """List all keys and their counts."""
+        return list(self.items())
+
+def process_text(text, hash_table, pattern=r'\b\w+\b', lowercase=True, tokenizer=None):
+    """
+    Process the text to insert word counts into the hash table.
+
+    Words are produced lazily by a tokenizer.Tokenizer, built from `pattern`
+    and `lowercase` unless one is passed in. Returns the number of words counted.
+    """
+    if tokenizer is None:
+        tokenizer = Tokenizer(pattern, casefold=lowercase)
+    return tokenizer.count(text, hash_table)
 
 
 def save_output(hash_table, filename="output.txt"):
@@ -115,8 +223,86 @@ def save_output(hash_table, filename="output.txt"):
             f.write(f"{key}: {value}\n")
 
 
+SNAPSHOT_MAGIC = b"WCNT1"
+
+
+def save_snapshot(hash_table, filename):
+    """
+    Save the table size and all (word, count) pairs in a compact binary file.
+
+    Layout: magic, table size and entry count as little-endian uint32, then
+    per entry a uint32 byte length, the UTF-8 word and a uint64 count.
+    """
+    with open(filename, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack("<II", hash_table.m, 0))
+        count = write_snapshot_entries(f, hash_table.items())
+        # Entries are streamed, so the count is patched in afterwards
+        f.seek(len(SNAPSHOT_MAGIC) + 4)
+        f.write(struct.pack("<I", count))
+
+
+def write_snapshot_entries(f, pairs):
+    """
+    Write (word, count) pairs to an open binary file in the snapshot entry format.
+
+    Returns the number of pairs written.
+    """
+    n = 0
+    for key, value in pairs:
+        data = key.encode("utf-8")
+        f.write(struct.pack("<I", len(data)))
+        f.write(data)
+        f.write(struct.pack("<Q", value))
+        n += 1
+    return n
+
+
+def read_snapshot_header(f):
+    """Check the magic of an open snapshot file and return its (table size, entry count)."""
+    if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+        raise ValueError(f"{f.name} is not a word count snapshot")
+    return struct.unpack("<II", f.read(8))
+
+
+def read_snapshot_entries(f, count):
+    """Lazily read `count` (word, count) entries from an open snapshot file."""
+    for _ in range(count):
+        (length,) = struct.unpack("<I", f.read(4))
+        key = f.read(length).decode("utf-8")
+        (value,) = struct.unpack("<Q", f.read(8))
+        yield key, value
+
+
+def iter_snapshot(filename):
+    """
+    Lazily yield the (word, count) pairs of a file written by save_snapshot,
+    without building a table.
+    """
+    with open(filename, "rb") as f:
+        _, count = read_snapshot_header(f)
+        yield from read_snapshot_entries(f, count)
+
+
+def load_snapshot(filename, m=None):
+    """
+    Load a file written by save_snapshot into a new hash table.
+
+    The table gets the saved size unless `m` is given.
+    """
+    with open(filename, "rb") as f:
+        saved_m, count = read_snapshot_header(f)
+        hash_table = HashTable(m=m or saved_m)
+        for key, value in read_snapshot_entries(f, count):
+            hash_table.insert(key, value)
+    return hash_table
+
+
 def analyze_collisions(hash_table):
     """Analyze collision lengths and calculate variance, displaying a histogram."""
+    import numpy as np
+    import matplotlib.pyplot as plt
+
     # Collect lengths of linked lists at each slot
     lengths = np.zeros(hash_table.m, dtype=int)
     for i in range(hash_table.m):
@@ -155,8 +341,7 @@ if __name__ == "__main__":
         hash_table = HashTable(m=m)
 
         # Load the sample text
-        with open("alice_in_wonderland.txt", "r", encoding="latin-1") as file:
-            text = file.read()
+        text, _ = read_text("alice_in_wonderland.txt")
 
         # Process the text and populate the hash table
         process_text(text, hash_table)
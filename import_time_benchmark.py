@@ -0,0 +1,51 @@
+import argparse
+import subprocess
+import sys
+
+# Modules that must stay out of the import of the counting path
+HEAVY_MODULES = ("numpy", "matplotlib")
+
+
+def import_times(module):
+    """
+    Import `module` in a fresh interpreter under `python -X importtime`.
+    :return: {imported module name: cumulative microseconds}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(cumulative_us)
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check that importing a module stays fast; exits non-zero on failure "
+                    "(run by .github/workflows/import-time.yml).")
+    parser.add_argument("module", nargs="?", default="hash")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="maximum cumulative import time of the module")
+    parser.add_argument("--runs", type=int, default=5, help="imports to take the best of")
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    heavy = sorted({name for times in runs for name in times
+                    if name.split(".")[0] in HEAVY_MODULES})
+    best_ms = min(times[args.module] for times in runs) / 1000
+
+    print(f"import {args.module}: {best_ms:.2f} ms (best of {args.runs})")
+    failed = False
+    if heavy:
+        print(f"FAIL: importing {args.module} loads {', '.join(heavy)}")
+        failed = True
+    if best_ms > args.budget_ms:
+        print(f"FAIL: over the {args.budget_ms:.0f} ms budget")
+        failed = True
+    sys.exit(1 if failed else 0)
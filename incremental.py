@@ -0,0 +1,185 @@
+import codecs
+import hashlib
+import json
+import os
+
+from hash import HashTable, load_snapshot, process_text, save_snapshot
+from tokenizer import Tokenizer, detect_encoding
+
+MANIFEST = "manifest.json"
+
+# Bytes hashed at the start of a file and just before its offset to notice rewrites
+CHECK_BYTES = 4096
+
+# ASCII whitespace; in every encoding handled here these bytes can't sit inside a multibyte character
+_WHITESPACE_BYTES = (b" ", b"\t", b"\n", b"\r", b"\f", b"\v")
+
+
+class IncrementalCounter:
+    """
+    Word counts for files that only ever grow.
+
+    The counts live in a state directory: a base snapshot, a list of delta
+    snapshots (one per update that found new text) and a manifest recording,
+    for every file, how many bytes have been counted and checksums of the
+    first bytes and of the bytes just before that offset. An update reads
+    only the bytes past each file's offset, so its cost is proportional to the
+    new data, not to the whole corpus. compact() folds the deltas into the base.
+
+    Text is consumed up to the last whitespace byte, so a word that is still
+    being written is counted on the next update; pass final=True to count
+    through the end of the files. A file that shrank or whose checked bytes
+    changed was rewritten rather than appended to, and since the counts can't
+    be split per file, the whole state is rebuilt from the current files. The
+    same happens when the tokenizer settings differ from the ones recorded in
+    the manifest, since deltas counted with different settings can't be mixed.
+
+    Each file's encoding is detected from its first chunk and re-detected
+    whenever a later chunk doesn't decode with it (an ASCII start is taken
+    for UTF-8, and the file may turn out to be cp1252), unless an encoding is
+    given; a file recorded with a different encoding than the given one is
+    rebuilt like a rewritten file. UTF-16 and UTF-32 files are not supported.
+    """
+    def __init__(self, state_dir, tokenizer=None, m=4096, encoding=None):
+        """
+        Open the state in `state_dir`, creating the directory if needed.
+        :param tokenizer: tokenizer.Tokenizer to split the text with (default is Tokenizer()).
+        :param m: Table size used for new snapshots; an existing state keeps its own.
+        :param encoding: Decode every file with this encoding instead of detecting it.
+        """
+        self.state_dir = state_dir
+        self.tokenizer = tokenizer if tokenizer is not None else Tokenizer()
+        self.encoding = codecs.lookup(encoding).name if encoding is not None else None
+        os.makedirs(state_dir, exist_ok=True)
+        path = os.path.join(state_dir, MANIFEST)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {"m": m, "base": None, "deltas": [], "next_delta": 0, "files": {},
+                             "tokenizer": self.tokenizer.config()}
+
+    def _path(self, name):
+        return os.path.join(self.state_dir, name)
+
+    def _save_manifest(self):
+        # Write then rename, so a crash leaves either the old or the new manifest
+        tmp = self._path(MANIFEST + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp, self._path(MANIFEST))
+
+    @staticmethod
+    def _digest(f, start, length):
+        f.seek(start)
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+    def _checksums(self, f, offset):
+        head = min(offset, CHECK_BYTES)
+        tail_start = max(0, offset - CHECK_BYTES)
+        return self._digest(f, 0, head), self._digest(f, tail_start, offset - tail_start)
+
+    def _unchanged(self, f, size, entry):
+        if size < entry["offset"]:
+            return False
+        return list(self._checksums(f, entry["offset"])) == [entry["head"], entry["tail"]]
+
+    def update(self, paths, final=False):
+        """
+        Count the bytes appended to `paths` since the last update and save them as a delta.
+
+        New files are counted from the start.
+        :return: (number of tokens, number of bytes) counted.
+        """
+        if self.manifest.get("tokenizer") != self.tokenizer.config():
+            return self.rebuild(paths, final=final)
+        files = self.manifest["files"]
+        chunks = []
+        for path in paths:
+            key = os.path.abspath(path)
+            entry = files.get(key)
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if entry is not None and not self._unchanged(f, size, entry):
+                    return self.rebuild(paths, final=final)
+                if entry is not None and self.encoding is not None and \
+                        codecs.lookup(entry["encoding"]).name != self.encoding:
+                    return self.rebuild(paths, final=final)
+                offset = entry["offset"] if entry is not None else 0
+                f.seek(offset)
+                data = f.read()
+                if not final:
+                    data = data[:max(data.rfind(ws) for ws in _WHITESPACE_BYTES) + 1]
+                if not data:
+                    continue
+                if self.encoding is not None:
+                    encoding = self.encoding
+                    text = data.decode(encoding, errors="replace")
+                else:
+                    encoding = entry["encoding"] if entry is not None else detect_encoding(data)
+                    try:
+                        text = data.decode(encoding)
+                    except UnicodeDecodeError:
+                        encoding = detect_encoding(data)
+                        text = data.decode(encoding, errors="replace")
+                if encoding.startswith(("utf-16", "utf-32")):
+                    raise ValueError(f"{path}: incremental counting does not support {encoding}")
+                end = offset + len(data)
+                head, tail = self._checksums(f, end)
+            chunks.append((key, text, encoding, end, head, tail))
+
+        if not chunks:
+            return 0, 0
+        table = HashTable(m=self.manifest["m"])
+        tokens = n_bytes = 0
+        for key, text, encoding, end, head, tail in chunks:
+            tokens += process_text(text, table, tokenizer=self.tokenizer)
+            n_bytes += end - files[key]["offset"] if key in files else end
+            files[key] = {"offset": end, "head": head, "tail": tail, "encoding": encoding}
+        name = f"delta-{self.manifest['next_delta']:06d}.snap"
+        save_snapshot(table, self._path(name))
+        self.manifest["deltas"].append(name)
+        self.manifest["next_delta"] += 1
+        self._save_manifest()
+        return tokens, n_bytes
+
+    def table(self, m=None):
+        """
+        Merge the base and every delta into one HashTable.
+        :param m: Size of the returned table (default is the state's size).
+        """
+        names = ([self.manifest["base"]] if self.manifest["base"] else []) + self.manifest["deltas"]
+        merged = HashTable(m=m or self.manifest["m"])
+        for name in names:
+            for word, value in load_snapshot(self._path(name)).list_all_keys():
+                merged.increase(word, value)
+        return merged
+
+    def compact(self):
+        """
+        Fold every delta into a new base snapshot and delete the old files.
+        """
+        if not self.manifest["deltas"]:
+            return
+        old = ([self.manifest["base"]] if self.manifest["base"] else []) + self.manifest["deltas"]
+        # A fresh name, so the old base stays valid until the manifest points at the new one
+        name = f"base-{self.manifest['next_delta']:06d}.snap"
+        self.manifest["next_delta"] += 1
+        save_snapshot(self.table(), self._path(name))
+        self.manifest["base"] = name
+        self.manifest["deltas"] = []
+        self._save_manifest()
+        for name in old:
+            os.remove(self._path(name))
+
+    def rebuild(self, paths, final=False):
+        """
+        Drop all counts and count `paths` again from the start.
+        :return: (number of tokens, number of bytes) counted.
+        """
+        old = ([self.manifest["base"]] if self.manifest["base"] else []) + self.manifest["deltas"]
+        self.manifest.update(base=None, deltas=[], files={}, tokenizer=self.tokenizer.config())
+        self._save_manifest()
+        for name in old:
+            os.remove(self._path(name))
+        return self.update(paths, final=final)
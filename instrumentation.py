@@ -0,0 +1,286 @@
+import inspect
+import json
+import time
+import types
+
+# Methods counted into a structural counter besides being timed
+STRUCTURAL_COUNTERS = {
+    "left_rotate": "rotations",
+    "right_rotate": "rotations",
+    "_link": "links",
+}
+
+# Keyword of the methods (HashTable find, insert and increase) that report
+# the chain nodes their walk visits; counted as "chain_probes"
+PROBE_COUNTER = "probe_counter"
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram in the style of HdrHistogram.
+
+    Values below 2**precision are counted exactly; above that, every power
+    of two is split into 2**(precision - 1) equal buckets, so a recorded
+    value is known to within a relative error of 2**(1 - precision)
+    (about 3% for the default precision of 6) in constant memory per decade.
+    """
+    def __init__(self, precision=6):
+        self.precision = precision
+        self.half = 1 << (precision - 1)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        shift = max(0, value.bit_length() - self.precision)
+        return shift * self.half + (value >> shift)
+
+    def _bounds(self, index):
+        """(lowest, highest) value counted in bucket `index`."""
+        shift = max(0, index // self.half - 1)
+        low = (index - shift * self.half) << shift
+        return low, low + (1 << shift) - 1
+
+    def record(self, value):
+        value = int(value)
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, q):
+        """
+        Value at quantile q (0 <= q <= 1), as the highest value of its bucket.
+        """
+        if not self.count:
+            return 0
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self._bounds(index)[1], self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+            "p999": self.percentile(0.999),
+            # Lowest value of each non-empty bucket -> count
+            "buckets": {str(self._bounds(i)[0]): n for i, n in sorted(self.buckets.items())},
+        }
+
+
+class StructureProfile:
+    """Call counts, latency histograms (in nanoseconds) and counters for one structure."""
+    def __init__(self, name):
+        self.name = name
+        self.calls = {}
+        self.latency = {}
+        self.counters = {}
+        self.histograms = {}
+
+    def count(self, counter, amount=1):
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def histogram(self, name):
+        if name not in self.histograms:
+            self.histograms[name] = LatencyHistogram()
+        return self.histograms[name]
+
+    def as_dict(self):
+        return {
+            "calls": dict(self.calls),
+            "latency_ns": {method: h.as_dict() for method, h in self.latency.items()},
+            "counters": dict(self.counters),
+            "histograms": {name: h.as_dict() for name, h in self.histograms.items()},
+        }
+
+
+class Profiler:
+    """
+    Opt-in instrumentation for the repo's data structures.
+
+    attach() shadows the methods of one structure instance with timed
+    wrappers stored on the instance itself; the classes are never changed,
+    so structures that are not attached (or have been detached) run the
+    original code at no extra cost. Internal calls go through the wrappers
+    too (a RedBlackTree.delete is also counted as a search), which is how
+    rotations and binomial links are counted.
+
+    Generator methods (items, range, ...) are counted but not timed, since
+    calling them only creates the generator. Special methods such as
+    __len__ and __getitem__ are looked up on the class and are not seen.
+    """
+    def __init__(self, clock=time.perf_counter_ns):
+        self.clock = clock
+        self.profiles = {}
+        self._attached = {}  # id(structure) -> (structure, method names, saved verbose, profile)
+
+    def attach(self, structure, name=None, methods=None, quiet=True):
+        """
+        Start recording calls on `structure`.
+        :param name: Key of this structure in the report (default is its class name,
+                     numbered if the name is already used).
+        :param methods: Method names to wrap (default is every public method plus
+                        the structural ones in STRUCTURAL_COUNTERS).
+        :param quiet: Switch off the structure's per-operation printing while attached,
+                      so the prints don't dominate the timings (default is True).
+        :return: The StructureProfile that collects the results.
+        """
+        if id(structure) in self._attached:
+            raise ValueError("structure is already attached")
+        if name is None:
+            name = type(structure).__name__
+            suffix = 2
+            while name in self.profiles:
+                name = f"{type(structure).__name__}#{suffix}"
+                suffix += 1
+        profile = self.profiles[name] = StructureProfile(name)
+        if methods is None:
+            methods = [m for m in dir(type(structure))
+                       if not m.startswith("_") or m in STRUCTURAL_COUNTERS]
+        wrapped = []
+        for method in methods:
+            original = inspect.getattr_static(structure, method, None)
+            if not isinstance(original, types.FunctionType):
+                continue  # properties, class and static methods, data attributes
+            setattr(structure, method, self._wrap(structure, method, getattr(structure, method), profile))
+            wrapped.append(method)
+        saved_verbose = getattr(structure, "verbose", None)
+        if quiet and saved_verbose is not None:
+            structure.verbose = False
+        self._attached[id(structure)] = (structure, wrapped, saved_verbose, profile)
+        return profile
+
+    def _wrap(self, structure, method, bound, profile):
+        clock = self.clock
+        calls = profile.calls
+        calls[method] = 0
+        counter = STRUCTURAL_COUNTERS.get(method)
+
+        if inspect.isgeneratorfunction(bound):
+            def counted(*args, **kwargs):
+                calls[method] += 1
+                return bound(*args, **kwargs)
+            return counted
+
+        histogram = profile.latency[method] = LatencyHistogram()
+        probed = PROBE_COUNTER in inspect.signature(bound).parameters
+
+        def timed(*args, **kwargs):
+            calls[method] += 1
+            if counter is not None:
+                profile.count(counter)
+            probes = None
+            if probed and PROBE_COUNTER not in kwargs:
+                # Filled by the method's own chain walk; recorded after the clock stops
+                probes = []
+                kwargs[PROBE_COUNTER] = probes.append
+            start = clock()
+            try:
+                return bound(*args, **kwargs)
+            finally:
+                histogram.record(clock() - start)
+                if probes:
+                    for n in probes:
+                        profile.count("chain_probes", n)
+                        profile.histogram("chain_probes").record(n)
+        return timed
+
+    def detach(self, structure):
+        """Stop recording `structure` and restore its original methods and verbosity."""
+        structure, wrapped, saved_verbose, _ = self._attached.pop(id(structure))
+        for method in wrapped:
+            delattr(structure, method)
+        if saved_verbose is not None:
+            structure.verbose = saved_verbose
+
+    def detach_all(self):
+        for structure, _, _, _ in list(self._attached.values()):
+            self.detach(structure)
+
+    def report(self):
+        """All profiles as a dict, including a SkipList's own lookup stats when it collects them."""
+        result = {name: profile.as_dict() for name, profile in self.profiles.items()}
+        for structure, _, _, profile in self._attached.values():
+            stats = getattr(structure, "stats", None)
+            if stats is not None and hasattr(stats, "as_dict"):
+                result[profile.name]["skiplist_stats"] = stats.as_dict()
+        return result
+
+    def to_json(self, filename=None, indent=2):
+        """
+        Export the report as JSON; written to `filename` if given, else returned as a string.
+        """
+        text = json.dumps({"structures": self.report()}, indent=indent)
+        if filename is None:
+            return text
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.detach_all()
+        return False
+
+
+def instrument(structure, **kwargs):
+    """
+    Shortcut for a Profiler with one attached structure.
+
+        profiler = instrument(tree)
+        ...
+        print(profiler.to_json())
+        profiler.detach_all()
+    """
+    profiler = Profiler()
+    profiler.attach(structure, **kwargs)
+    return profiler
+
+
+if __name__ == "__main__":
+    import random
+
+    from binomial_heap import BinomialHeap
+    from bst import BST
+    from hash import HashTable
+    from red_black_tree import RedBlackTree
+    from skiplist import SkipList
+
+    rng = random.Random(0)
+    keys = rng.sample(range(100000), 2000)
+    structures = [BST(balance="avl"), RedBlackTree(), SkipList(collect_stats=True), BinomialHeap()]
+    hash_table = HashTable(m=300)
+    with Profiler() as profiler:
+        for structure in structures + [hash_table]:
+            profiler.attach(structure)
+        for key in keys:
+            for structure in structures:
+                structure.insert(key)
+            hash_table.increase(f"w{key % 500}")
+        for key in keys[:500]:
+            structures[0].search(key)
+            structures[1].search(key)
+            structures[2].search(key)
+            structures[3].extract_min()
+            hash_table.find(f"w{key % 500}")
+        print(profiler.to_json())
@@ -0,0 +1,165 @@
+import itertools
+
+from binomial_heap import BinomialHeap
+
+# Shared by every queue, so sequence numbers stay unique when queues are melded
+_sequence = itertools.count()
+
+
+class PriorityQueueEntry:
+    """
+    Handle for one queued item, returned by push().
+
+    The heap is keyed on (priority, sequence number). Sequence numbers are
+    unique, so payloads are never compared and equal priorities pop in FIFO
+    order.
+    """
+    def __init__(self, priority, payload, seq):
+        self.priority = priority
+        self.payload = payload
+        self.seq = seq
+        self.heap_handle = None  # BinomialHeapHandle of the (priority, seq) key
+
+    @property
+    def queued(self):
+        """True until the entry is popped or removed."""
+        return self.heap_handle is not None and self.heap_handle.node is not None
+
+
+class BinomialPriorityQueue:
+    """
+    Priority queue of (priority, payload) items on top of a BinomialHeap.
+
+    push/pop/peek/pushpop/replace mirror heapq's heappush, heappop, heap[0],
+    heappushpop and heapreplace on a list of (priority, payload) tuples. On
+    top of that, entries can be re-prioritised or removed through the handle
+    push() returns, and two queues can be melded.
+    """
+    def __init__(self, lazy=True):
+        """
+        :param lazy: Use the heap's lazy merge mode (default is True).
+        """
+        self._heap = BinomialHeap(lazy=lazy, verbose=False)
+        self._entries = {}  # seq -> PriorityQueueEntry
+
+    @classmethod
+    def from_iterable(cls, items, lazy=True):
+        """
+        Build a queue from (priority, payload) pairs in O(n), like heapq.heapify.
+        """
+        queue = cls(lazy=lazy)
+        keys = []
+        for priority, payload in items:
+            entry = PriorityQueueEntry(priority, payload, next(_sequence))
+            queue._entries[entry.seq] = entry
+            keys.append((priority, entry.seq))
+        queue._heap = BinomialHeap.from_iterable(keys, lazy=lazy, verbose=False)
+        # from_iterable gives every node a handle; hand them to the entries
+        stack = [queue._heap.head]
+        while stack:
+            node = stack.pop()
+            while node:
+                queue._entries[node.key[1]].heap_handle = node.handle
+                if node.child:
+                    stack.append(node.child)
+                node = node.sibling
+        return queue
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __bool__(self):
+        return bool(self._entries)
+
+    def push(self, priority, payload=None):
+        """
+        Add an item.
+        :return: The entry's handle, for update_priority() and remove().
+        """
+        entry = PriorityQueueEntry(priority, payload, next(_sequence))
+        entry.heap_handle = self._heap.insert((priority, entry.seq))
+        self._entries[entry.seq] = entry
+        return entry
+
+    def peek(self):
+        """
+        Return the (priority, payload) of the smallest item without removing it.
+        :raises IndexError: If the queue is empty.
+        """
+        node = self._heap.minimum()
+        if node is None:
+            raise IndexError("peek from an empty priority queue")
+        entry = self._entries[node.key[1]]
+        return entry.priority, entry.payload
+
+    def pop(self):
+        """
+        Remove and return the (priority, payload) of the smallest item.
+        :raises IndexError: If the queue is empty.
+        """
+        if not self._entries:
+            raise IndexError("pop from an empty priority queue")
+        _, seq = self._heap._pop_min()
+        entry = self._entries.pop(seq)
+        return entry.priority, entry.payload
+
+    def pushpop(self, priority, payload=None):
+        """
+        Push an item, then pop and return the smallest, like heapq.heappushpop.
+        """
+        # Strict: an older entry with the same priority comes out first (FIFO)
+        if not self._entries or priority < self._heap.minimum().key[0]:
+            return priority, payload
+        result = self.pop()
+        self.push(priority, payload)
+        return result
+
+    def replace(self, priority, payload=None):
+        """
+        Pop and return the smallest item, then push a new one, like heapq.heapreplace.
+        :raises IndexError: If the queue is empty.
+        """
+        result = self.pop()
+        self.push(priority, payload)
+        return result
+
+    def update_priority(self, entry, priority):
+        """
+        Change the priority of a queued entry.
+
+        Lowering the priority is a decrease_key in O(log n) and keeps the
+        entry's place among equal priorities. Raising it re-queues the entry
+        behind the items already queued at the new priority.
+        :raises ValueError: If the entry is no longer queued.
+        """
+        if not entry.queued:
+            raise ValueError("Entry is not in the queue")
+        if priority < entry.priority:
+            self._heap.decrease_key(entry.heap_handle, (priority, entry.seq))
+            entry.priority = priority
+        elif entry.priority < priority:
+            self.remove(entry)
+            entry.seq = next(_sequence)
+            entry.priority = priority
+            entry.heap_handle = self._heap.insert((priority, entry.seq))
+            self._entries[entry.seq] = entry
+
+    def remove(self, entry):
+        """
+        Remove a queued entry in O(log n).
+        :raises ValueError: If the entry is no longer queued.
+        """
+        if not entry.queued:
+            raise ValueError("Entry is not in the queue")
+        self._heap.delete(entry.heap_handle)
+        del self._entries[entry.seq]
+
+    def meld(self, other):
+        """
+        Move every item of `other` into this queue; `other` is left empty.
+
+        Equal priorities still pop in the order they were pushed, across both queues.
+        """
+        self._heap.meld(other._heap)
+        self._entries.update(other._entries)
+        other._entries = {}
@@ -0,0 +1,108 @@
+import argparse
+import heapq
+import itertools
+import random
+import time
+
+from priority_queue import BinomialPriorityQueue
+
+
+def push_pop(n, use_heapq):
+    """Push n items, then pop them all."""
+    rng = random.Random(0)
+    priorities = [rng.randrange(n) for _ in range(n)]
+    start = time.perf_counter()
+    if use_heapq:
+        heap = []
+        counter = itertools.count()
+        for p in priorities:
+            heapq.heappush(heap, (p, next(counter), None))
+        while heap:
+            heapq.heappop(heap)
+    else:
+        queue = BinomialPriorityQueue()
+        for p in priorities:
+            queue.push(p)
+        while queue:
+            queue.pop()
+    return time.perf_counter() - start
+
+
+def updates(n, n_updates, use_heapq):
+    """
+    Push n items, lower the priority of random items n_updates times, then pop all.
+
+    heapq has no decrease-key; the standard workaround pushes a new tuple and
+    marks the old one as removed, to be skipped when popped.
+    """
+    rng = random.Random(0)
+    priorities = [rng.randrange(n, 2 * n) for _ in range(n)]
+    targets = [rng.randrange(n) for _ in range(n_updates)]
+    start = time.perf_counter()
+    if use_heapq:
+        heap = []
+        counter = itertools.count()
+        entries = []
+        for p in priorities:
+            entry = [p, next(counter), True]
+            entries.append(entry)
+            heapq.heappush(heap, entry)
+        for i in targets:
+            old = entries[i]
+            old[2] = False
+            entry = [old[0] - 1, next(counter), True]
+            entries[i] = entry
+            heapq.heappush(heap, entry)
+        while heap:
+            heapq.heappop(heap)
+    else:
+        queue = BinomialPriorityQueue()
+        entries = [queue.push(p) for p in priorities]
+        for i in targets:
+            queue.update_priority(entries[i], entries[i].priority - 1)
+        while queue:
+            queue.pop()
+    return time.perf_counter() - start
+
+
+def melds(n_queues, size, use_heapq):
+    """Build n_queues queues of `size` items, meld them all into one, then pop 10 items."""
+    rng = random.Random(0)
+    batches = [[rng.random() for _ in range(size)] for _ in range(n_queues)]
+    start = time.perf_counter()
+    if use_heapq:
+        counter = itertools.count()
+        heaps = []
+        for batch in batches:
+            heap = [(p, next(counter), None) for p in batch]
+            heapq.heapify(heap)
+            heaps.append(heap)
+        merged = heaps[0]
+        for heap in heaps[1:]:
+            merged.extend(heap)
+            heapq.heapify(merged)
+        for _ in range(10):
+            heapq.heappop(merged)
+    else:
+        queues = [BinomialPriorityQueue.from_iterable((p, None) for p in batch) for batch in batches]
+        merged = queues[0]
+        for queue in queues[1:]:
+            merged.meld(queue)
+        for _ in range(10):
+            merged.pop()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare BinomialPriorityQueue with heapq.")
+    parser.add_argument("-n", type=int, default=100000, help="number of items")
+    args = parser.parse_args()
+
+    runs = {
+        "push/pop": lambda h: push_pop(args.n, h),
+        "decrease-key": lambda h: updates(args.n, args.n, h),
+        "meld": lambda h: melds(100, args.n // 100, h),
+    }
+    print(f"{'workload':<14}{'heapq s':>10}{'binomial s':>12}")
+    for name, run in runs.items():
+        print(f"{name:<14}{run(True):>10.4f}{run(False):>12.4f}")
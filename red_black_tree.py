@@ -8,9 +8,53 @@ class Node:
 
 
 class RedBlackTree:
-    def __init__(self):
+    def __init__(self, verbose=True):
+        """
+        Initialize an empty Red-Black Tree.
+        :param verbose: Print the height and structure after every operation (default is True).
+        """
         self.T_nil = Node(key=None, color="BLACK")  # Sentinel node
         self.root = self.T_nil
+        self.verbose = verbose
+
+    def __getstate__(self):
+        """
+        Pickle the tree as flat lists instead of linked nodes, so pickling is
+        not recursive. Nodes are listed in pre-order with one shape byte each
+        (bit 0: has a left child, bit 1: has a right child, bit 2: red).
+        """
+        nil = self.T_nil
+        keys = []
+        shape = bytearray()
+        stack = [self.root] if self.root != nil else []
+        while stack:
+            node = stack.pop()
+            keys.append(node.key)
+            shape.append((node.left != nil) | (node.right != nil) << 1 | (node.color == "RED") << 2)
+            if node.right != nil:
+                stack.append(node.right)
+            if node.left != nil:
+                stack.append(node.left)
+        state = {k: v for k, v in self.__dict__.items() if k not in ("T_nil", "root")}
+        state["nodes"] = (keys, bytes(shape))
+        return state
+
+    def __setstate__(self, state):
+        keys, shape = state.pop("nodes")
+        self.__dict__.update(state)
+        self.T_nil = Node(key=None, color="BLACK")
+        self.root = self.T_nil
+        # Pre-order rebuild: each slot is (parent, attribute) waiting for a node
+        slots = [(None, "root")]
+        for key, bits in zip(keys, shape):
+            parent, side = slots.pop()
+            node = Node(key, color="RED" if bits & 4 else "BLACK",
+                        left=self.T_nil, right=self.T_nil, parent=parent or self.T_nil)
+            setattr(parent or self, side, node)
+            if bits & 2:
+                slots.append((node, "right"))
+            if bits & 1:
+                slots.append((node, "left"))
 
     def left_rotate(self, x):
         """
@@ -102,9 +146,10 @@ class RedBlackTree:
         self.insert_fixup(new_node)
 
         # After insertion, print the height and tree structure
-        print(f"Inserted {key}, Tree Height: {self.calculate_height()}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Inserted {key}, Tree Height: {self.calculate_height()}")
+            self.print_tree_structure()
+            print("-" * 40)
 
     def insert_fixup(self, z):
         """
@@ -156,10 +201,11 @@ class RedBlackTree:
             else:
                 current = current.right
         # After search, print the height and tree structure
-        print(f"Searching for {key}: {'Found' if current != self.T_nil else 'Not found'}")
-        print(f"Tree Height after search: {self.calculate_height()}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Searching for {key}: {'Found' if current != self.T_nil else 'Not found'}")
+            print(f"Tree Height after search: {self.calculate_height()}")
+            self.print_tree_structure()
+            print("-" * 40)
         return current if current != self.T_nil else None
 
     def minimum(self, node=None):
@@ -168,10 +214,11 @@ class RedBlackTree:
         while node.left != self.T_nil:
             node = node.left
         # After finding minimum, print the height and tree structure
-        print(f"Minimum key: {node.key}")
-        print(f"Tree Height after finding minimum: {self.calculate_height()}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Minimum key: {node.key}")
+            print(f"Tree Height after finding minimum: {self.calculate_height()}")
+            self.print_tree_structure()
+            print("-" * 40)
         return node
 
     def maximum(self, node=None):
@@ -180,10 +227,11 @@ class RedBlackTree:
         while node.right != self.T_nil:
             node = node.right
         # After finding maximum, print the height and tree structure
-        print(f"Maximum key: {node.key}")
-        print(f"Tree Height after finding maximum: {self.calculate_height()}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Maximum key: {node.key}")
+            print(f"Tree Height after finding maximum: {self.calculate_height()}")
+            self.print_tree_structure()
+            print("-" * 40)
         return node
 
     def successor(self, x):
@@ -196,10 +244,11 @@ class RedBlackTree:
                 y = y.parent
             succ = y
         # After finding successor, print the height and tree structure
-        print(f"Successor of {x.key}: {succ.key if succ != self.T_nil else 'None'}")
-        print(f"Tree Height after finding successor: {self.calculate_height()}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Successor of {x.key}: {succ.key if succ != self.T_nil else 'None'}")
+            print(f"Tree Height after finding successor: {self.calculate_height()}")
+            self.print_tree_structure()
+            print("-" * 40)
         return succ if succ != self.T_nil else None
 
     def predecessor(self, x):
@@ -212,10 +261,11 @@ class RedBlackTree:
                 y = y.parent
             pred = y
         # After finding predecessor, print the height and tree structure
-        print(f"Predecessor of {x.key}: {pred.key if pred != self.T_nil else 'None'}")
-        print(f"Tree Height after finding predecessor: {self.calculate_height()}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Predecessor of {x.key}: {pred.key if pred != self.T_nil else 'None'}")
+            print(f"Tree Height after finding predecessor: {self.calculate_height()}")
+            self.print_tree_structure()
+            print("-" * 40)
         return pred if pred != self.T_nil else None
 
     def in_order_traversal(self, node=None):
@@ -239,16 +289,72 @@ class RedBlackTree:
         right_height = self.calculate_height(node.right)
         return max(left_height, right_height) + 1
 
+    def validate(self):
+        """
+        Check the red-black properties and the links of the whole tree.
+
+        Checks that the root and the sentinel are black, no red node has a red
+        child, every root-to-leaf path has the same number of black nodes,
+        every child points back to its parent, and the keys are in order.
+        :return: The number of keys in the tree.
+        :raises AssertionError: Describing the first violation found.
+        """
+        nil = self.T_nil
+        if nil.color != "BLACK":
+            raise AssertionError("the sentinel is not black")
+        if self.root == nil:
+            return 0
+        if self.root.color != "BLACK":
+            raise AssertionError(f"root {self.root.key} is not black")
+        if self.root.parent != nil and self.root.parent is not None:
+            raise AssertionError(f"root {self.root.key} has a parent")
+
+        # Iterative in-order walk carrying the black count from the root
+        black_height = None
+        count = 0
+        previous = None
+        stack = []
+        node, blacks = self.root, 0
+        while stack or node != nil:
+            while node != nil:
+                if node.color not in ("RED", "BLACK"):
+                    raise AssertionError(f"node {node.key} has color {node.color!r}")
+                blacks += node.color == "BLACK"
+                for child in (node.left, node.right):
+                    if child == nil:
+                        # Every missing child ends a path; all paths need the same black count
+                        if black_height is None:
+                            black_height = blacks
+                        elif blacks != black_height:
+                            raise AssertionError(
+                                f"black height {blacks} below {node.key}, expected {black_height}")
+                    else:
+                        if child.parent != node:
+                            raise AssertionError(f"child {child.key} of {node.key} has a wrong parent")
+                        if node.color == "RED" and child.color == "RED":
+                            raise AssertionError(f"red node {node.key} has a red child {child.key}")
+                stack.append((node, blacks))
+                node = node.left
+            node, blacks = stack.pop()
+            if previous is not None and node.key < previous.key:
+                raise AssertionError(f"key {node.key} comes after {previous.key} in order")
+            previous = node
+            count += 1
+            node = node.right
+        return count
+
     def delete(self, key):
         z = self.search(key)
         if z is None:
-            print(f"Key {key} not found in the tree.")
+            if self.verbose:
+                print(f"Key {key} not found in the tree.")
             return
         self.delete_node(z)
         # After deletion, print the height and tree structure
-        print(f"Deleted {key}, Tree Height: {self.calculate_height()}")
-        self.print_tree_structure()
-        print("-" * 40)
+        if self.verbose:
+            print(f"Deleted {key}, Tree Height: {self.calculate_height()}")
+            self.print_tree_structure()
+            print("-" * 40)
 
     def delete_node(self, z):
         y = z
@@ -332,54 +438,55 @@ class RedBlackTree:
         x.color = "BLACK"
 
 # Sample usage
-rb_tree = RedBlackTree()
-# Sample operations
-nodes_to_insert = [30, 15, 70, 10, 20, 60, 85, 5, 50, 65, 80, 90, 40, 55]
-for key in nodes_to_insert:
-    rb_tree.insert(key)
-
-# Testing in-order traversal (sort)
-print("\nIn-order traversal (sorted keys):")
-rb_tree.in_order_traversal()
-print()
-print(f"Tree Height after in-order traversal: {rb_tree.calculate_height()}")
-rb_tree.print_tree_structure()
-print("-" * 40)
-
-# Testing search
-rb_tree.search(60)
-
-# Testing minimum
-rb_tree.minimum()
-
-# Testing maximum
-rb_tree.maximum()
-
-# Testing successor
-node = rb_tree.search(55)
-if node:
-    rb_tree.successor(node)
-
-# Testing predecessor
-if node:
-    rb_tree.predecessor(node)
-
-# Testing delete
-keys_to_delete = [70, 15, 5]
-for key in keys_to_delete:
-    rb_tree.delete(key)
-
-
-# Sample usage with specific insertions to trigger all cases
-rb_tree1 = RedBlackTree()
-# Insert nodes to trigger Case 1
-rb_tree1.insert(10)
-rb_tree1.insert(5)
-rb_tree1.insert(15)
-rb_tree1.insert(1)  # Triggers Case 1
-
-# Insert nodes to trigger Case 2
-rb_tree1.insert(7)  # Triggers Case 2
-
-# Insert nodes to trigger Case 3
-rb_tree1.insert(6)  # Triggers Case 3
\ No newline at end of file
+if __name__ == "__main__":
+    rb_tree = RedBlackTree()
+    # Sample operations
+    nodes_to_insert = [30, 15, 70, 10, 20, 60, 85, 5, 50, 65, 80, 90, 40, 55]
+    for key in nodes_to_insert:
+        rb_tree.insert(key)
+
+    # Testing in-order traversal (sort)
+    print("\nIn-order traversal (sorted keys):")
+    rb_tree.in_order_traversal()
+    print()
+    print(f"Tree Height after in-order traversal: {rb_tree.calculate_height()}")
+    rb_tree.print_tree_structure()
+    print("-" * 40)
+
+    # Testing search
+    rb_tree.search(60)
+
+    # Testing minimum
+    rb_tree.minimum()
+
+    # Testing maximum
+    rb_tree.maximum()
+
+    # Testing successor
+    node = rb_tree.search(55)
+    if node:
+        rb_tree.successor(node)
+
+    # Testing predecessor
+    if node:
+        rb_tree.predecessor(node)
+
+    # Testing delete
+    keys_to_delete = [70, 15, 5]
+    for key in keys_to_delete:
+        rb_tree.delete(key)
+
+
+    # Sample usage with specific insertions to trigger all cases
+    rb_tree1 = RedBlackTree()
+    # Insert nodes to trigger Case 1
+    rb_tree1.insert(10)
+    rb_tree1.insert(5)
+    rb_tree1.insert(15)
+    rb_tree1.insert(1)  # Triggers Case 1
+
+    # Insert nodes to trigger Case 2
+    rb_tree1.insert(7)  # Triggers Case 2
+
+    # Insert nodes to trigger Case 3
+    rb_tree1.insert(6)  # Triggers Case 3
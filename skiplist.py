@@ -1,55 +1,142 @@
+import math
 import random
 
+_MISSING = object()  # Default for pop() that lets None be a real default
+
 class Node:
-    def __init__(self, key, level):
+    def __init__(self, key, level, value=None):
         self.key = key
+        self.value = value
+        self.backward = None  # Previous node at level 0 (None for the first node)
         # Forward references for each level
         self.forward = [None] * (level + 1)
+        # width[i] is how many level-0 steps forward[i] skips (only meaningful
+        # while forward[i] is not None)
+        self.width = [1] * (level + 1)
+
+class SkipListStats:
+    """
+    Counters for the lookups of one skip list.
+
+    A lookup's path length is the number of right moves plus the number of
+    levels it descended through; comparisons counts every key comparison.
+    """
+    def __init__(self, max_level):
+        self.max_level = max_level
+        self.reset()
+
+    def reset(self):
+        self.searches = 0
+        self.comparisons = 0
+        self.total_path_length = 0
+        self.max_path_length = 0
+        self.hops_per_level = [0] * (self.max_level + 1)  # Right moves made at each level
+
+    def record(self, comparisons, path_length):
+        self.searches += 1
+        self.comparisons += comparisons
+        self.total_path_length += path_length
+        if path_length > self.max_path_length:
+            self.max_path_length = path_length
+
+    @property
+    def average_path_length(self):
+        return self.total_path_length / self.searches if self.searches else 0.0
+
+    @property
+    def comparisons_per_search(self):
+        return self.comparisons / self.searches if self.searches else 0.0
+
+    def as_dict(self):
+        return {
+            "searches": self.searches,
+            "comparisons": self.comparisons,
+            "comparisons_per_search": self.comparisons_per_search,
+            "average_path_length": self.average_path_length,
+            "max_path_length": self.max_path_length,
+            "hops_per_level": list(self.hops_per_level),
+        }
 
 class SkipList:
-    def __init__(self, max_level=16, p=0.5):
+    def __init__(self, max_level=None, p=0.5, expected_size=65536, seed=None, verbose=True,
+                 collect_stats=False):
         """
         Initialize a skip list.
-        :param max_level: Maximum level for the skip list (default is 16).
+        :param max_level: Maximum level for the skip list. By default it is derived
+                          from `expected_size` as log base 1/p of the size (16 for the defaults).
         :param p: Probability for determining the level of each new node (default is 0.5).
+        :param expected_size: Number of keys the list is sized for when max_level is not given.
+        :param seed: Seed for the level generator, for reproducible structures.
+        :param verbose: Print the structure after every operation (default is True).
+        :param collect_stats: Count comparisons and hops for every lookup in `self.stats`.
         """
+        if max_level is None:
+            max_level = max(1, math.ceil(math.log(max(expected_size, 2)) / math.log(1 / p)))
         self.MAX_LEVEL = max_level  # The maximum number of levels allowed in the skip list.
         self.P = p  # Probability used to determine the height of nodes.
+        self.rng = random.Random(seed)  # Private generator so runs can be reproduced
+        # When P is 1/2**k, each level costs k fair coin flips, so the level is
+        # the number of trailing zero bits of a random word divided by k.
+        k = math.log2(1 / p)
+        self._bits_per_level = round(k) if abs(k - round(k)) < 1e-9 else None
+        self._log_p = math.log(p)
         # Create the header node with the maximum number of levels and a key of negative infinity.
         self.header = self.create_node(self.MAX_LEVEL, -float('inf'))
         self.level = 0  # Tracks the current highest level in the skip list.
-
-    def create_node(self, lvl, key):
+        self.size = 0  # Number of keys, for indexing from the end
+        self.tail = None  # Last node at level 0, where reverse iteration starts
+        self.verbose = verbose
+        # SkipListStats while lookups are being counted, otherwise None. Lookups
+        # only check this once, so switching it off costs nothing per step.
+        self.stats = SkipListStats(max_level) if collect_stats else None
+
+    def create_node(self, lvl, key, value=None):
         """
         Create a new node for the skip list.
         :param lvl: Number of levels this node spans.
         :param key: The key stored in the node.
+        :param value: The value stored with the key.
         :return: A new node with the given key and level.
         """
-        return Node(key, lvl)  # Create a Node object with the given key and level.
+        return Node(key, lvl, value)  # Create a Node object with the given key and level.
 
     def random_level(self):
         """
         Generate a random level for a new node based on the probability `P`.
+
+        Uses a single random draw: the trailing zero bits of a 64-bit word when
+        P is a power of 1/2, otherwise the inverse CDF of the geometric
+        distribution. Either way, P(level >= i) = P ** i.
         :return: A random level (integer) between 0 and MAX_LEVEL.
         """
-        lvl = 0  # Start at level 0.
-        # Increment the level with probability `P` until the maximum level is reached.
-        while random.random() < self.P and lvl < self.MAX_LEVEL:
-            lvl += 1
-        return lvl  # Return the generated random level.
+        if self._bits_per_level is not None:
+            word = self.rng.getrandbits(64)
+            # word & -word isolates the lowest set bit; a zero word has 64 zeros
+            zeros = (word & -word).bit_length() - 1 if word else 64
+            lvl = zeros // self._bits_per_level
+        else:
+            lvl = int(math.log(1.0 - self.rng.random()) / self._log_p)
+        return min(lvl, self.MAX_LEVEL)  # Return the generated random level.
 
-    def insert(self, key):
+    def insert(self, key, value=None):
+      """
+      Insert `key` with `value`, or replace the value if the key is already present.
+      """
       # Step 1: Initialize a list to track nodes that need their forward pointers updated
-      update = [None] * (self.MAX_LEVEL + 1)
+      # (only the levels currently in use; it is extended if the new node is taller)
+      update = [None] * (self.level + 1)
+      rank = [0] * (self.level + 1)  # Position of update[i] (the header is position 0)
       current = self.header  # Start traversal from the header node
+      pos = 0
 
       # Step 2: Traverse the skip list from the highest level down to level 0
       for i in reversed(range(self.level + 1)):  # Start from the highest level and go down
           # Move forward in the current level until the key is smaller than the next node's key
           while current.forward[i] and current.forward[i].key < key:
+              pos += current.width[i]
               current = current.forward[i]  # Move forward on the same level
           update[i] = current  # Save the node where the traversal stopped at this level
+          rank[i] = pos
 
       # Step 3: Move to level 0 to check if the key already exists
       current = current.forward[0]  # Move one step forward at level 0
@@ -62,30 +149,64 @@ class SkipList:
           # Step 5: If the new node's level is higher than the current skip list level,
           # initialize `update` pointers for the new levels and update the skip list level
           if rlevel > self.level:
-              for i in range(self.level + 1, rlevel + 1):
-                  update[i] = self.header  # At higher levels, the header node will point to the new node
+              # At higher levels, the header node will point to the new node
+              update.extend([self.header] * (rlevel - self.level))
+              rank.extend([0] * (rlevel - self.level))
               self.level = rlevel  # Update the skip list's current maximum level
 
           # Step 6: Create a new node with the random level and key
-          n = self.create_node(rlevel, key)
+          n = self.create_node(rlevel, key, value)
 
           # Step 7: Update forward pointers in all levels for the new node
           for i in range(rlevel + 1):  # Loop through all levels up to the new node's level
               n.forward[i] = update[i].forward[i]  # Point the new node to the next node
               update[i].forward[i] = n  # Update the previous node to point to the new node
+              # Split the span of update[i] at the new node's position rank[0] + 1
+              n.width[i] = update[i].width[i] - (rank[0] - rank[i])
+              update[i].width[i] = rank[0] - rank[i] + 1
+          # Higher links now skip over one more node
+          for i in range(rlevel + 1, self.level + 1):
+              update[i].width[i] += 1
+          # Link the new node backwards at level 0
+          n.backward = update[0] if update[0] is not self.header else None
+          if n.forward[0] is not None:
+              n.forward[0].backward = n
+          else:
+              self.tail = n
+          self.size += 1
 
           # Step 8: Print a message indicating successful insertion and the updated structure
-          print(f"Inserted {key}")
-          self.print_structure()  # Visualize the updated skip list structure
+          if self.verbose:
+              print(f"Inserted {key}")
+              self.print_structure()  # Visualize the updated skip list structure
 
-      # Step 9: If the key already exists, print a message
+      # Step 9: If the key already exists, update its value and print a message
       else:
-          print(f"Key {key} already exists")
+          current.value = value
+          if self.verbose:
+              print(f"Key {key} already exists, value updated")
 
 
     def delete(self, key):
+      removed = self._unlink(key)
+
+      # Print confirmation of deletion and the updated skip list structure
+      if removed is not None:
+          if self.verbose:
+              print(f"Deleted {key}")
+              self.print_structure()
+
+      # If the key is not found, print an appropriate message
+      elif self.verbose:
+          print(f"Key {key} not found")
+
+    def _unlink(self, key):
+      """
+      Remove the node holding `key`.
+      :return: The removed node, or None if the key is not present.
+      """
       # Initialize an update list to track nodes that need their forward pointers updated
-      update = [None] * (self.MAX_LEVEL + 1)
+      update = [None] * (self.level + 1)
       
       # Start from the header node of the skip list
       current = self.header
@@ -108,50 +229,418 @@ class SkipList:
           for i in range(self.level + 1):  # Traverse all levels from 0 to the current highest level
               # If the forward pointer at this level points to the node being deleted, update it
               if update[i].forward[i] != current:
+                  update[i].width[i] -= 1  # The link skips one node fewer
                   continue
+              update[i].width[i] += current.width[i] - 1
               update[i].forward[i] = current.forward[i]
+          if current.forward[0] is not None:
+              current.forward[0].backward = current.backward
+          else:
+              self.tail = current.backward
+          self.size -= 1
 
           # Adjust the level of the skip list
           # If the highest levels have no nodes, reduce the level of the skip list
           while self.level > 0 and self.header.forward[self.level] is None:
               self.level -= 1
-
-          # Print confirmation of deletion and the updated skip list structure
-          print(f"Deleted {key}")
-          self.print_structure()
-
-      # If the key is not found, print an appropriate message
-      else:
-          print(f"Key {key} not found")
+          return current
+      return None
 
 
     def search(self, key):
+      verbose = self.verbose
+      if not verbose:
+          node = self._seek(key).forward[0]
+          return node is not None and node.key == key
+
       # Start from the header node
       current = self.header
-      print(f"Searching for {key}:")  # Print the key being searched for
+      if verbose:
+          print(f"Searching for {key}:")  # Print the key being searched for
 
       # Step 1: Traverse the skip list from the highest level to level 0
       for i in reversed(range(self.level + 1)):  # Start from the highest level and go down
           # Step 2: Move forward in the current level while the next node's key is smaller than the target key
           while current.forward[i] and current.forward[i].key < key:
               # Print the move to the right, showing the current key and the key of the next node
-              print(f"At level {i}, moving right from {current.key} to {current.forward[i].key}")
+              if verbose:
+                  print(f"At level {i}, moving right from {current.key} to {current.forward[i].key}")
               current = current.forward[i]  # Move forward to the next node
           # Print the move down to the next level
-          print(f"At level {i}, moving down")
+          if verbose:
+              print(f"At level {i}, moving down")
 
       # Step 3: Move to the next node at level 0 to check if the key exists
       current = current.forward[0]
 
       # Step 4: Check if the current node's key matches the target key
       if current and current.key == key:
-          print(f"Found key {key}")  # Print success message if key is found
+          if verbose:
+              print(f"Found key {key}")  # Print success message if key is found
           return True  # Return True to indicate the key is found
 
       # Step 5: If the key is not found, print a failure message
-      print(f"Key {key} not found")
+      if verbose:
+          print(f"Key {key} not found")
       return False  # Return False to indicate the key is not found
 
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def from_sorted(cls, keys, values=None, randomized=False, **kwargs):
+        """
+        Build a skip list from keys in ascending order in O(n).
+
+        Nothing is searched: every node is appended at the end of each of its
+        levels in a single pass. By default levels are assigned
+        deterministically, so with P = 1/2 every 2**k-th node reaches level k
+        (every b**k-th node for P = 1/b), which gives a perfectly balanced list.
+        The branching factor is at least 2: for P above 2/3, round(1/P) would be
+        1 and every node would be promoted to MAX_LEVEL.
+        :param keys: An iterable of keys in ascending order. Repeated keys keep the last value.
+        :param values: Optional iterable of values, parallel to `keys`.
+        :param randomized: Draw levels with random_level() instead.
+        :param kwargs: Passed on to SkipList(); expected_size defaults to the number of keys.
+        :raises ValueError: If the keys are not in ascending order.
+        """
+        keys = list(keys)
+        values = list(values) if values is not None else [None] * len(keys)
+        if "max_level" not in kwargs and "expected_size" not in kwargs:
+            kwargs["expected_size"] = len(keys)
+        skip_list = cls(**kwargs)
+        branching = max(2, round(1 / skip_list.P))
+
+        nodes = []
+        for key, value in zip(keys, values):
+            if nodes and not nodes[-1].key <= key:
+                raise ValueError("from_sorted() needs keys in ascending order")
+            if nodes and nodes[-1].key == key:
+                nodes[-1].value = value
+                continue
+            if randomized:
+                lvl = skip_list.random_level()
+            else:
+                # The number of times the 1-based position divides by `branching`
+                position = len(nodes) + 1
+                lvl = 0
+                while position % branching == 0 and lvl < skip_list.MAX_LEVEL:
+                    position //= branching
+                    lvl += 1
+            nodes.append(skip_list.create_node(lvl, key, value))
+        skip_list._relink(nodes)
+        return skip_list
+
+    def _relink(self, nodes):
+        """
+        Rebuild every level from `nodes`, which must be sorted by key, in one pass.
+
+        Each node keeps its own height; forward pointers, widths, backward
+        pointers, the level and the size are all recomputed.
+        """
+        for i in range(self.MAX_LEVEL + 1):
+            self.header.forward[i] = None
+        last = [self.header] * (self.MAX_LEVEL + 1)  # Last node linked at each level
+        last_pos = [0] * (self.MAX_LEVEL + 1)  # ... and its position
+        prev = None
+        level = 0
+        pos = 0
+        for pos, node in enumerate(nodes, 1):
+            for i in range(len(node.forward)):
+                last[i].forward[i] = node
+                last[i].width[i] = pos - last_pos[i]
+                last[i] = node
+                last_pos[i] = pos
+            level = max(level, len(node.forward) - 1)
+            node.backward = prev
+            prev = node
+        for i in range(self.MAX_LEVEL + 1):
+            last[i].forward[i] = None
+        self.tail = prev
+        self.level = level
+        self.size = pos
+
+    def merge(self, other):
+        """
+        Move every key of `other` into this list in O(n + m); `other` is left empty.
+
+        Both lists are walked once at level 0 and the merged sequence of nodes
+        is relinked in place, so no node is allocated and every node keeps its
+        height (capped at this list's MAX_LEVEL). For keys present in both
+        lists the value from `other` wins.
+        """
+        merged = []
+        a = self.header.forward[0]
+        b = other.header.forward[0]
+        while a is not None or b is not None:
+            if b is None or (a is not None and a.key < b.key):
+                node, a = a, a.forward[0]
+            elif a is None or b.key < a.key:
+                node, b = b, b.forward[0]
+                if len(node.forward) > self.MAX_LEVEL + 1:
+                    del node.forward[self.MAX_LEVEL + 1:]
+                    del node.width[self.MAX_LEVEL + 1:]
+            else:
+                a.value = b.value
+                node, a, b = a, a.forward[0], b.forward[0]
+            merged.append(node)
+        self._relink(merged)
+        other._relink([])
+
+    def _seek(self, key):
+        """
+        Return the last node whose key is smaller than `key` (the header if none is).
+        """
+        if self.stats is not None:
+            return self._seek_counted(key)
+        current = self.header
+        for i in reversed(range(self.level + 1)):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+        return current
+
+    def _seek_counted(self, key):
+        """
+        _seek that records its comparisons and path in `self.stats`.
+        """
+        hops = self.stats.hops_per_level
+        comparisons = 0
+        path_length = 0
+        current = self.header
+        for i in reversed(range(self.level + 1)):
+            following = current.forward[i]
+            while following is not None:
+                comparisons += 1
+                if not following.key < key:
+                    break
+                current = following
+                following = current.forward[i]
+                hops[i] += 1
+                path_length += 1
+            path_length += 1  # Moving down (or, at level 0, stopping)
+        self.stats.record(comparisons, path_length)
+        return current
+
+    def validate(self):
+        """
+        Check the ordering, links, widths and bookkeeping of every level.
+
+        Level 0 must hold strictly increasing keys with consistent backward
+        pointers, `size` and `tail`. Every level i must link, in order, exactly
+        the nodes taller than i, and each link's width must equal the number of
+        level-0 steps it skips. `level` must be the highest level in use.
+        :return: The number of keys.
+        :raises AssertionError: Describing the first violation found.
+        """
+        # Positions along level 0; the header is position 0
+        position = {id(self.header): 0}
+        nodes = []
+        prev = None
+        node = self.header.forward[0]
+        while node is not None:
+            if prev is not None and not prev.key < node.key:
+                raise AssertionError(f"level 0 has {node.key} after {prev.key}")
+            if node.backward is not prev:
+                raise AssertionError(f"node {node.key} has a wrong backward pointer")
+            if len(node.forward) - 1 > self.MAX_LEVEL:
+                raise AssertionError(f"node {node.key} is taller than MAX_LEVEL")
+            nodes.append(node)
+            position[id(node)] = len(nodes)
+            prev = node
+            node = node.forward[0]
+        if len(nodes) != self.size:
+            raise AssertionError(f"size is {self.size} but level 0 holds {len(nodes)} nodes")
+        if self.tail is not prev:
+            raise AssertionError("tail is not the last node")
+
+        for i in range(self.MAX_LEVEL + 1):
+            expected = [n for n in nodes if len(n.forward) > i]
+            if i > self.level and (expected or self.header.forward[i] is not None):
+                raise AssertionError(f"level {i} is in use above the list level {self.level}")
+            current = self.header
+            for n in expected:
+                if current.forward[i] is not n:
+                    raise AssertionError(f"level {i} skips or misorders key {n.key}")
+                if current.width[i] != position[id(n)] - position[id(current)]:
+                    raise AssertionError(f"link at level {i} into key {n.key} has a wrong width")
+                current = n
+            if current.forward[i] is not None:
+                raise AssertionError(f"level {i} does not end after its last node")
+        if self.level > 0 and self.header.forward[self.level] is None:
+            raise AssertionError(f"level {self.level} is empty")
+        return len(nodes)
+
+    def enable_stats(self):
+        """
+        Start counting lookups (resetting any earlier counts) and return the stats object.
+        """
+        self.stats = SkipListStats(self.MAX_LEVEL)
+        return self.stats
+
+    def disable_stats(self):
+        """
+        Stop counting lookups.
+        """
+        self.stats = None
+
+    def level_occupancy(self):
+        """
+        Count the nodes that reach each level, in O(n).
+        :return: A list whose i-th entry is the number of nodes linked at level i.
+        """
+        counts = []
+        for i in range(self.level + 1):
+            count = 0
+            node = self.header.forward[i]
+            while node is not None:
+                count += 1
+                node = node.forward[i]
+            counts.append(count)
+        return counts
+
+    def stats_report(self):
+        """
+        Return the lookup counters together with the level occupancy, as a dict.
+        """
+        report = self.stats.as_dict() if self.stats is not None else {}
+        report["size"] = self.size
+        report["level_occupancy"] = self.level_occupancy()
+        return report
+
+    def get(self, key, default=None):
+        """
+        Return the value stored for `key`, or `default` if the key is not present.
+        """
+        node = self._seek(key).forward[0]
+        if node is not None and node.key == key:
+            return node.value
+        return default
+
+    def set(self, key, value):
+        """
+        Store `value` for `key`, replacing any existing value.
+        """
+        verbose, self.verbose = self.verbose, False
+        try:
+            self.insert(key, value)
+        finally:
+            self.verbose = verbose
+
+    def pop(self, key, default=_MISSING):
+        """
+        Remove `key` and return its value.
+        :raises KeyError: If the key is not present and no default is given.
+        """
+        node = self._unlink(key)
+        if node is not None:
+            return node.value
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def __contains__(self, key):
+        node = self._seek(key).forward[0]
+        return node is not None and node.key == key
+
+    def range(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yield the (key, value) pairs with lo <= key < hi, in key order.
+
+        Finding the first pair costs O(log n); after that the generator walks
+        level 0 one node per pair, so stopping early costs nothing extra.
+        :param lo: Inclusive lower bound, or None for no lower bound.
+        :param hi: Exclusive upper bound, or None for no upper bound.
+        :param reverse: Yield the pairs from the largest key down.
+        """
+        if reverse:
+            node = self.tail if hi is None else self._seek(hi)
+            while node is not None and node is not self.header and (lo is None or node.key >= lo):
+                yield node.key, node.value
+                node = node.backward
+        else:
+            node = self.header.forward[0] if lo is None else self._seek(lo).forward[0]
+            while node is not None and (hi is None or node.key < hi):
+                yield node.key, node.value
+                node = node.forward[0]
+
+    def items(self, reverse=False):
+        """
+        Lazily yield every (key, value) pair in key order.
+        """
+        return self.range(reverse=reverse)
+
+    def __iter__(self):
+        node = self.header.forward[0]
+        while node is not None:
+            yield node.key
+            node = node.forward[0]
+
+    def __reversed__(self):
+        node = self.tail
+        while node is not None:
+            yield node.key
+            node = node.backward
+
+    def rank(self, key):
+        """
+        Count the keys smaller than `key` in O(log n), like bisect_left on a sorted list.
+        :param key: The key to rank; it does not have to be in the list.
+        :return: The number of keys smaller than `key`.
+        """
+        current = self.header
+        pos = 0
+        for i in reversed(range(self.level + 1)):
+            while current.forward[i] and current.forward[i].key < key:
+                pos += current.width[i]
+                current = current.forward[i]
+        return pos
+
+    def count_range(self, lo, hi):
+        """
+        Count the keys k with lo <= k < hi in O(log n).
+        """
+        if not lo < hi:
+            return 0
+        return self.rank(hi) - self.rank(lo)
+
+    def _node_at(self, index):
+        """
+        Return the node at 0-based position `index` in O(log n).
+        """
+        current = self.header
+        pos = 0  # Position of `current`; the header is 0 and the first key is 1
+        target = index + 1
+        for i in reversed(range(self.level + 1)):
+            while current.forward[i] and pos + current.width[i] <= target:
+                pos += current.width[i]
+                current = current.forward[i]
+        return current
+
+    def __getitem__(self, index):
+        """
+        Return the key at a position, or a list of keys for a slice, like a sorted list.
+
+        A single position costs O(log n); a slice costs O(log n + k) for k keys
+        when its step is 1.
+        :raises IndexError: If the position is out of range.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step != 1:
+                return [self._node_at(i).key for i in range(start, stop, step)]
+            result = []
+            if start < stop:
+                node = self._node_at(start)
+                for _ in range(stop - start):
+                    result.append(node.key)
+                    node = node.forward[0]
+            return result
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("skip list index out of range")
+        return self._node_at(index).key
+
 
     def print_structure(self):
       # Print a header to indicate the skip list structure is being displayed
@@ -178,7 +667,7 @@ class SkipList:
 
 # Example usage
 if __name__ == "__main__":
-    skip_list = SkipList(max_level=50)
+    skip_list = SkipList(expected_size=16, seed=42)
 
     operations = [
         ("insert", 20),
@@ -0,0 +1,81 @@
+import argparse
+import bisect
+import random
+import time
+
+from skiplist import SkipList
+from workloads import random_keys
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def indexing(n, queries):
+    """
+    Compare an indexable SkipList with bisect on a sorted list for building,
+    rank, select (sl[i]) and count_range queries.
+    :return: {operation: (skip list seconds, sorted list seconds)}
+    """
+    keys = random_keys(n)
+    rng = random.Random(1)
+    probes = [rng.randrange(n) for _ in range(queries)]
+    positions = [rng.randrange(n) for _ in range(queries)]
+    ranges = [sorted((rng.randrange(n), rng.randrange(n))) for _ in range(queries)]
+    victims = rng.sample(range(n), min(n, queries))
+
+    skip_list = SkipList(expected_size=n, seed=0, verbose=False)
+    sorted_list = []
+    results = {}
+    results["insert"] = (
+        timed(lambda: [skip_list.insert(k) for k in keys]),
+        timed(lambda: [bisect.insort(sorted_list, k) for k in keys]),
+    )
+    results["rank"] = (
+        timed(lambda: [skip_list.rank(k) for k in probes]),
+        timed(lambda: [bisect.bisect_left(sorted_list, k) for k in probes]),
+    )
+    results["select"] = (
+        timed(lambda: [skip_list[i] for i in positions]),
+        timed(lambda: [sorted_list[i] for i in positions]),
+    )
+    results["count_range"] = (
+        timed(lambda: [skip_list.count_range(lo, hi) for lo, hi in ranges]),
+        timed(lambda: [bisect.bisect_left(sorted_list, hi) - bisect.bisect_left(sorted_list, lo)
+                       for lo, hi in ranges]),
+    )
+    results["delete"] = (
+        timed(lambda: [skip_list.delete(k) for k in victims]),
+        timed(lambda: [sorted_list.pop(bisect.bisect_left(sorted_list, k)) for k in victims]),
+    )
+    return results
+
+
+def build(n):
+    """
+    Build a list of n keys by repeated insert and with from_sorted.
+    :return: (insert seconds, from_sorted seconds)
+    """
+    keys = list(range(n))
+    skip_list = SkipList(expected_size=n, seed=0, verbose=False)
+    insert_time = timed(lambda: [skip_list.insert(k) for k in keys])
+    return insert_time, timed(lambda: SkipList.from_sorted(keys, verbose=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare SkipList indexing with bisect on a sorted list.")
+    parser.add_argument("-n", type=int, default=1000000, help="number of keys")
+    parser.add_argument("-q", type=int, default=100000, help="number of queries per operation")
+    args = parser.parse_args()
+
+    print(f"n={args.n}, {args.q} queries per operation")
+    print(f"{'operation':<14}{'skiplist s':>12}{'bisect s':>12}")
+    for name, (skip_time, list_time) in indexing(args.n, args.q).items():
+        print(f"{name:<14}{skip_time:>12.4f}{list_time:>12.4f}")
+
+    insert_time, bulk_time = build(args.n)
+    print(f"\nBuild from sorted input: n={args.n}")
+    print(f"{'insert loop':<14}{insert_time:>12.4f}")
+    print(f"{'from_sorted':<14}{bulk_time:>12.4f}")
@@ -0,0 +1,298 @@
+from abc import ABC, abstractmethod
+
+from bst import BST
+from btree import BTree
+from hash import HashTable
+from red_black_tree import RedBlackTree
+from skiplist import SkipList
+
+
+class SortedContainer(ABC):
+    """
+    Common interface over the repo's ordered structures.
+
+    Every adapter wraps one structure with printing switched off and exposes
+    the same methods with the same return conventions:
+
+      insert(key)      add key (inserting a key that is present is a no-op)
+      delete(key)      remove key; True if it was present
+      contains(key)    True if key is present
+      min(), max()     smallest / largest key, or None if empty
+      successor(key)   smallest key greater than key, or None
+      iter(c), len(c)  keys in ascending order, number of keys
+
+    The methods are abstract, so an adapter that misses one fails when it is
+    created. len() defaults to a `size` attribute kept by the adapter.
+    """
+    name = None
+
+    @abstractmethod
+    def insert(self, key):
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key):
+        raise NotImplementedError
+
+    @abstractmethod
+    def contains(self, key):
+        raise NotImplementedError
+
+    @abstractmethod
+    def min(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def max(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def successor(self, key):
+        raise NotImplementedError
+
+    @abstractmethod
+    def __iter__(self):
+        raise NotImplementedError
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+
+class BSTContainer(SortedContainer):
+    """bst.BST, optionally with one of its balancing policies."""
+    def __init__(self, balance=None):
+        self.tree = BST(balance=balance, verbose=False)
+        self.name = "bst" if balance is None else f"bst-{balance}"
+        self.size = 0
+
+    def insert(self, key):
+        if self.tree._search(self.tree.root, key) is None:
+            self.tree.insert(key)
+            self.size += 1
+
+    def delete(self, key):
+        node = self.tree._search(self.tree.root, key)
+        if node is None:
+            return False
+        self.tree.policy.remove(self.tree, node)
+        self.size -= 1
+        return True
+
+    def contains(self, key):
+        return self.tree.search(key) is not None
+
+    def min(self):
+        return self.tree.minimum().key if self.tree.root is not None else None
+
+    def max(self):
+        return self.tree.maximum().key if self.tree.root is not None else None
+
+    def successor(self, key):
+        node = self.tree.root
+        best = None
+        while node is not None:
+            if key < node.key:
+                best = node.key
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def __iter__(self):
+        # Iterative in-order walk, safe on degenerate trees
+        stack = []
+        node = self.tree.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+
+class RedBlackTreeContainer(SortedContainer):
+    """red_black_tree.RedBlackTree."""
+    name = "rbtree"
+
+    def __init__(self):
+        self.tree = RedBlackTree(verbose=False)
+        self.size = 0
+
+    def insert(self, key):
+        if self.tree.search(key) is None:
+            self.tree.insert(key)
+            self.size += 1
+
+    def delete(self, key):
+        node = self.tree.search(key)
+        if node is None:
+            return False
+        self.tree.delete_node(node)
+        self.size -= 1
+        return True
+
+    def contains(self, key):
+        return self.tree.search(key) is not None
+
+    def min(self):
+        return self.tree.minimum().key if self.tree.root != self.tree.T_nil else None
+
+    def max(self):
+        return self.tree.maximum().key if self.tree.root != self.tree.T_nil else None
+
+    def successor(self, key):
+        nil = self.tree.T_nil
+        node = self.tree.root
+        best = None
+        while node != nil:
+            if key < node.key:
+                best = node.key
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def __iter__(self):
+        nil = self.tree.T_nil
+        stack = []
+        node = self.tree.root
+        while stack or node != nil:
+            while node != nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+
+class SkipListContainer(SortedContainer):
+    """skiplist.SkipList."""
+    name = "skiplist"
+
+    def __init__(self, expected_size=65536, seed=0):
+        self.skip_list = SkipList(expected_size=expected_size, seed=seed, verbose=False)
+
+    def __len__(self):
+        return len(self.skip_list)
+
+    def insert(self, key):
+        self.skip_list.insert(key)
+
+    def delete(self, key):
+        return self.skip_list._unlink(key) is not None
+
+    def contains(self, key):
+        return key in self.skip_list
+
+    def min(self):
+        node = self.skip_list.header.forward[0]
+        return node.key if node is not None else None
+
+    def max(self):
+        node = self.skip_list.tail
+        return node.key if node is not None else None
+
+    def successor(self, key):
+        node = self.skip_list._seek(key).forward[0]
+        if node is not None and node.key == key:
+            node = node.forward[0]
+        return node.key if node is not None else None
+
+    def __iter__(self):
+        return iter(self.skip_list)
+
+
+class BTreeContainer(SortedContainer):
+    """btree.BTree (a B+ tree with linked leaves)."""
+    def __init__(self, fanout=64):
+        self.tree = BTree(fanout=fanout)
+        self.name = "btree" if fanout == 64 else f"btree-{fanout}"
+
+    def __len__(self):
+        return len(self.tree)
+
+    def insert(self, key):
+        self.tree.insert(key)
+
+    def delete(self, key):
+        return self.tree.delete(key)
+
+    def contains(self, key):
+        return key in self.tree
+
+    def min(self):
+        cursor = self.tree.minimum()
+        return cursor.key if cursor is not None else None
+
+    def max(self):
+        cursor = self.tree.maximum()
+        return cursor.key if cursor is not None else None
+
+    def successor(self, key):
+        return self.tree.successor_key(key)
+
+    def __iter__(self):
+        return iter(self.tree)
+
+
+class HashTableContainer(SortedContainer):
+    """
+    hash.HashTable, for comparison.
+
+    The table is unordered, so min, max and successor scan every bucket in
+    O(n) and iteration sorts all keys. Keys must be strings.
+    """
+    name = "hash"
+
+    def __init__(self, m=1024):
+        self.table = HashTable(m=m)
+        self.size = 0
+
+    def insert(self, key):
+        if self.table.find(key) is None:
+            self.table.insert(key, True)
+            self.size += 1
+
+    def delete(self, key):
+        if self.table.find(key) is None:
+            return False
+        self.table.delete(key)
+        self.size -= 1
+        return True
+
+    def contains(self, key):
+        return self.table.find(key) is not None
+
+    def _keys(self):
+        for head in self.table.table:
+            current = head
+            while current is not None:
+                yield current.key
+                current = current.next
+
+    def min(self):
+        return min(self._keys(), default=None)
+
+    def max(self):
+        return max(self._keys(), default=None)
+
+    def successor(self, key):
+        return min((k for k in self._keys() if k > key), default=None)
+
+    def __iter__(self):
+        return iter(sorted(self._keys()))
+
+
+# name -> factory taking the expected number of keys
+CONTAINERS = {
+    "bst": lambda n: BSTContainer(),
+    "bst-avl": lambda n: BSTContainer(balance="avl"),
+    "rbtree": lambda n: RedBlackTreeContainer(),
+    "skiplist": lambda n: SkipListContainer(expected_size=n),
+    "btree": lambda n: BTreeContainer(),
+    "hash": lambda n: HashTableContainer(m=max(1, n)),
+}
@@ -0,0 +1,138 @@
+import heapq
+import os
+import tempfile
+
+from hash import read_snapshot_entries, write_snapshot_entries
+from red_black_tree import RedBlackTree
+from skiplist import SkipList
+
+ORDERS = ("key", "count")
+
+
+def sort_key(by):
+    """
+    Sort key on (word, count) pairs: alphabetical for "key", most frequent
+    first (ties alphabetical) for "count".
+    """
+    if by == "key":
+        return lambda pair: pair[0]
+    if by == "count":
+        return lambda pair: (-pair[1], pair[0])
+    raise ValueError(f"Unknown order {by!r}, expected one of {ORDERS}")
+
+
+class SkipListRun:
+    """An in-memory run kept sorted in a skiplist.SkipList."""
+    def __init__(self, by, expected_size):
+        self.by = by
+        self.skip_list = SkipList(expected_size=expected_size, verbose=False)
+
+    def add(self, word, count):
+        if self.by == "key":
+            self.skip_list.insert(word, count)
+        else:
+            self.skip_list.insert((-count, word))
+
+    def __len__(self):
+        return len(self.skip_list)
+
+    def __iter__(self):
+        if self.by == "key":
+            yield from self.skip_list.items()
+        else:
+            for negated, word in self.skip_list:
+                yield word, -negated
+
+
+class RedBlackTreeRun:
+    """An in-memory run kept sorted in a red_black_tree.RedBlackTree."""
+    def __init__(self, by, expected_size):
+        self.by = by
+        self.tree = RedBlackTree(verbose=False)
+        self.size = 0
+
+    def add(self, word, count):
+        # Words are unique, so the tuples never tie
+        self.tree.insert((word, count) if self.by == "key" else (-count, word))
+        self.size += 1
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        nil = self.tree.T_nil
+        stack = []
+        node = self.tree.root
+        while stack or node != nil:
+            while node != nil:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            if self.by == "key":
+                yield node.key
+            else:
+                yield node.key[1], -node.key[0]
+            node = node.right
+
+
+ENGINES = {"skiplist": SkipListRun, "rbtree": RedBlackTreeRun}
+
+
+def _spill(run, spill_dir):
+    """Write a sorted run to a temporary file and return its (path, number of pairs)."""
+    fd, path = tempfile.mkstemp(prefix="wordcount-run-", suffix=".bin", dir=spill_dir)
+    with os.fdopen(fd, "wb") as f:
+        count = write_snapshot_entries(f, run)
+    return path, count
+
+
+def _read_run(path, count):
+    with open(path, "rb") as f:
+        yield from read_snapshot_entries(f, count)
+
+
+def sorted_pairs(pairs, by="key", run_size=1_000_000, engine="skiplist", spill_dir=None):
+    """
+    Lazily yield (word, count) pairs in sorted order, holding at most `run_size` of them in memory.
+
+    Pairs are inserted into an ordered structure; if the input fits in one
+    run it is streamed straight out of that structure. Otherwise every full
+    run is spilled to a temporary file and the runs are merged with a k-way
+    heap merge (an external merge sort). Words must be unique, as they are in
+    a HashTable or a snapshot.
+    :param pairs: Iterable of (word, count), e.g. HashTable.items() or hash.iter_snapshot(filename).
+    :param by: "key" for alphabetical order, "count" for most frequent first.
+    :param run_size: Maximum number of pairs per in-memory run.
+    :param engine: "skiplist" or "rbtree", the structure that sorts each run.
+    :param spill_dir: Directory for the run files (default is the system temporary directory).
+    """
+    key = sort_key(by)
+    make_run = ENGINES[engine]
+    spilled = []
+    try:
+        run = make_run(by, run_size)
+        for word, count in pairs:
+            run.add(word, count)
+            if len(run) >= run_size:
+                spilled.append(_spill(run, spill_dir))
+                run = make_run(by, run_size)
+        if not spilled:
+            yield from run
+            return
+        if len(run):
+            spilled.append(_spill(run, spill_dir))
+        run = None
+        yield from heapq.merge(*(_read_run(path, count) for path, count in spilled), key=key)
+    finally:
+        for path, _ in spilled:
+            os.remove(path)
+
+
+def export_sorted(pairs, filename, by="key", **kwargs):
+    """
+    Write (word, count) pairs to `filename` as "word: count" lines (the save_output
+    format), sorted by `by`. Extra keyword arguments go to sorted_pairs.
+    """
+    with open(filename, "w", encoding="utf-8") as f:
+        for word, count in sorted_pairs(pairs, by=by, **kwargs):
+            f.write(f"{word}: {count}\n")
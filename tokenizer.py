@@ -0,0 +1,153 @@
+import codecs
+import hashlib
+import re
+import unicodedata
+
+DEFAULT_PATTERN = r'\b\w+\b'
+
+# A short list of very common English function words, for stop_words=ENGLISH_STOP_WORDS
+ENGLISH_STOP_WORDS = frozenset("""
+a about above after again against all am an and any are as at be because been
+before being below between both but by can did do does doing down during each
+few for from further had has have having he her here hers herself him himself
+his how i if in into is it its itself just me more most my myself no nor not
+now of off on once only or other our ours ourselves out over own same she
+should so some such than that the their theirs them themselves then there
+these they this those through to too under until up very was we were what
+when where which while who whom why will with you your yours yourself
+yourselves
+""".split())
+
+# Tried in order by detect_encoding; latin-1 decodes any byte string, so it always ends the list
+FALLBACK_ENCODINGS = ("utf-8", "cp1252", "latin-1")
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def detect_encoding(data):
+    """
+    Guess the encoding of the bytes `data`.
+
+    A byte order mark wins; otherwise the first of FALLBACK_ENCODINGS that
+    decodes the data without errors is returned.
+    """
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return encoding
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    return FALLBACK_ENCODINGS[-1]
+
+
+def read_text(filename, encoding=None):
+    """
+    Read a text file, detecting its encoding unless `encoding` is given.
+
+    Line endings are translated to "\\n" as in text-mode open().
+    :return: (text, encoding used)
+    """
+    with open(filename, "rb") as f:
+        data = f.read()
+    if encoding is None:
+        encoding = detect_encoding(data)
+    text = data.decode(encoding, errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, encoding
+
+
+class Tokenizer:
+    """
+    Lazy word tokenizer.
+
+    Tokens are produced one at a time with re.finditer, so no lowercase copy
+    of the text and no list of all tokens is ever built. Case folding is done
+    per token with str.casefold (so "Straße" and "STRASSE" count as one word);
+    Unicode normalization is applied to the text only when it is not already
+    in the requested form.
+    """
+    def __init__(self, pattern=DEFAULT_PATTERN, casefold=True, normalize=None, stop_words=None):
+        """
+        :param pattern: Regex matching one token (default is runs of word characters);
+                        matched case-insensitively when `casefold` is set.
+        :param casefold: Fold the case of every token (default is True).
+        :param normalize: Unicode normalization form ("NFC", "NFKC", "NFD" or "NFKD"), or None.
+        :param stop_words: Words to drop, compared after case folding, or None.
+        """
+        if normalize not in (None, "NFC", "NFKC", "NFD", "NFKD"):
+            raise ValueError(f"Unknown normalization form {normalize!r}")
+        self.pattern = pattern
+        # Matching runs on the original text, so with case folding the pattern
+        # must ignore case too: r'[a-z]+' then matches "Hello" as a whole, as
+        # it did when the text was lowercased before matching
+        self.regex = re.compile(pattern, re.IGNORECASE if casefold else 0)
+        self.casefold = casefold
+        self.normalize = normalize
+        if stop_words is not None:
+            stop_words = frozenset(word.casefold() if casefold else word for word in stop_words)
+        self.stop_words = stop_words or None
+
+    def tokens(self, text):
+        """Yield the tokens of `text` in order."""
+        if self.normalize is not None and not unicodedata.is_normalized(self.normalize, text):
+            text = unicodedata.normalize(self.normalize, text)
+        matches = self.regex.finditer(text)
+        stop_words = self.stop_words
+        if self.casefold:
+            if stop_words is None:
+                for match in matches:
+                    yield match.group().casefold()
+            else:
+                for match in matches:
+                    token = match.group().casefold()
+                    if token not in stop_words:
+                        yield token
+        elif stop_words is None:
+            for match in matches:
+                yield match.group()
+        else:
+            for match in matches:
+                token = match.group()
+                if token not in stop_words:
+                    yield token
+
+    __call__ = tokens
+
+    def config(self):
+        """
+        The settings that decide which tokens are produced, as a JSON-serializable dict.
+
+        Two tokenizers with equal configs count any text the same way; the
+        stop words are recorded as a digest of the sorted list.
+        """
+        stop_words = None
+        if self.stop_words is not None:
+            stop_words = hashlib.sha256("\n".join(sorted(self.stop_words)).encode("utf-8")).hexdigest()
+        return {
+            "pattern": self.pattern,
+            "casefold": self.casefold,
+            "normalize": self.normalize,
+            "stop_words": stop_words,
+        }
+
+    def count(self, text, hash_table):
+        """
+        Increase the count of every token of `text` in `hash_table`.
+        :return: Number of tokens counted.
+        """
+        n = 0
+        increase = hash_table.increase
+        for token in self.tokens(text):
+            increase(token)
+            n += 1
+        return n
@@ -0,0 +1,90 @@
+import argparse
+import re
+import sys
+import time
+import tracemalloc
+
+from hash import HashTable
+from tokenizer import DEFAULT_PATTERN, ENGLISH_STOP_WORDS, Tokenizer, read_text
+
+
+def findall_tokens(text):
+    """The original process_text path: lowercase copy of the text, then a list of every token."""
+    return re.findall(r'\b\w+\b', text.lower())
+
+
+TOKENIZERS = {
+    "findall": findall_tokens,
+    "finditer": Tokenizer(),
+    "finditer-nfc": Tokenizer(normalize="NFC"),
+    "finditer-stop": Tokenizer(stop_words=ENGLISH_STOP_WORDS),
+}
+
+
+# Patterns whose tokens must match the original path; the last two are case-sensitive
+CHECK_PATTERNS = (DEFAULT_PATTERN, r"[a-z]+", r"[a-z]+(?:'[a-z]+)?")
+
+
+def check(text):
+    """
+    Compare Tokenizer with the original lowercase-then-findall path on `text`.
+    :return: The patterns whose tokens differ.
+    """
+    return [pattern for pattern in CHECK_PATTERNS
+            if list(Tokenizer(pattern).tokens(text)) != re.findall(pattern, text.lower())]
+
+
+def consume(tokens, table=None):
+    n = 0
+    if table is None:
+        for _ in tokens:
+            n += 1
+    else:
+        increase = table.increase
+        for token in tokens:
+            increase(token)
+            n += 1
+    return n
+
+
+def run(name, text, count=False):
+    """
+    Tokenize `text` (and count into a HashTable if `count` is set).
+    :return: (seconds, number of tokens)
+    """
+    table = HashTable(m=4096) if count else None
+    start = time.perf_counter()
+    n = consume(TOKENIZERS[name](text), table)
+    return time.perf_counter() - start, n
+
+
+def peak_memory(name, text):
+    """Peak bytes allocated while tokenizing `text`, on top of the text itself."""
+    tracemalloc.start()
+    consume(TOKENIZERS[name](text))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the tokenizer with the original findall path.")
+    parser.add_argument("--corpus", default="alice_in_wonderland.txt")
+    parser.add_argument("--scale", type=int, default=1000, help="number of copies of the corpus to tokenize")
+    parser.add_argument("--tokenizers", nargs="+", default=list(TOKENIZERS), choices=list(TOKENIZERS))
+    parser.add_argument("--count", action="store_true", help="also count the tokens into a HashTable")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    args = parser.parse_args()
+
+    corpus, encoding = read_text(args.corpus)
+    mismatched = check(corpus)
+    if mismatched:
+        sys.exit(f"FAIL: Tokenizer differs from the original path for {', '.join(mismatched)}")
+    text = corpus * args.scale
+    mb = len(text.encode("utf-8")) / 2 ** 20
+    print(f"{args.corpus} ({encoding}) x {args.scale}: {mb:.1f} MB")
+    print(f"{'tokenizer':<14} {'tokens':>10} {'seconds':>8} {'MB/s':>8} {'tokens/s':>11} {'peak MB':>8}")
+    for name in args.tokenizers:
+        seconds, n = run(name, text, count=args.count)
+        memory = f"{peak_memory(name, text) / 2 ** 20:>8.1f}" if not args.no_memory else f"{'-':>8}"
+        print(f"{name:<14} {n:>10} {seconds:>8.2f} {mb / seconds:>8.1f} {n / seconds:>11.0f} {memory}")
@@ -0,0 +1,261 @@
+import argparse
+import csv
+import glob
+import itertools
+import json
+import math
+import multiprocessing
+import re
+import sys
+import time
+
+from hash import HashTable, process_text, save_snapshot
+from incremental import IncrementalCounter
+from sorted_export import sort_key, sorted_pairs
+from tokenizer import DEFAULT_PATTERN, ENGLISH_STOP_WORDS, Tokenizer, read_text
+
+_WHITESPACE = re.compile(r'\s')
+
+
+def auto_table_size(n_bytes):
+    """
+    Estimate a table size for `n_bytes` of English-like text.
+
+    Assumes about six bytes per token and Heaps' law for the vocabulary
+    (V ~ 40 * sqrt(tokens)), and aims for a load factor of about 1.
+    """
+    tokens = max(1, n_bytes // 6)
+    return max(31, int(40 * math.sqrt(tokens)))
+
+
+def split_text(text, parts):
+    """
+    Split text into about `parts` chunks, cutting only at whitespace so no word is split.
+    """
+    size = max(1, len(text) // parts)
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(len(text), start + size)
+        match = _WHITESPACE.search(text, end)
+        end = match.start() if match else len(text)
+        chunks.append(text[start:end])
+        start = end
+    return chunks
+
+
+def read_input(path, encoding=None):
+    """Read a file, or standard input for "-"; the encoding of files is detected when `encoding` is None."""
+    if path == "-":
+        return sys.stdin.read()
+    return read_text(path, encoding)[0]
+
+
+def count_job(job):
+    """
+    Count one file or text chunk into its own table.
+    :return: (list of (word, count) pairs, number of tokens, number of bytes)
+    """
+    source, tokenizer, m, encoding = job
+    text = source[1] if source[0] == "text" else read_input(source[1], encoding)
+    table = HashTable(m=m)
+    tokens = process_text(text, table, tokenizer=tokenizer)
+    return table.list_all_keys(), tokens, len(text.encode("utf-8", errors="replace"))
+
+
+def count(paths, tokenizer=None, workers=1, m=None, encoding=None):
+    """
+    Count the words of every input into one HashTable.
+
+    Inputs are spread over `workers` processes; with a single input and
+    several workers, the text is split into chunks first. Each worker counts
+    into its own table and the parent merges the partial counts.
+    Byte counts are of the text re-encoded as UTF-8.
+    :param paths: Input paths; "-" reads standard input.
+    :param tokenizer: tokenizer.Tokenizer to split the text with (default is Tokenizer()).
+    :param m: Table size, or None to size the table from the input size.
+    :return: (table, number of tokens, number of bytes)
+    """
+    if workers > 1 and len(paths) == 1:
+        text = read_input(paths[0], encoding)
+        sources = [("text", chunk) for chunk in split_text(text, workers)]
+        n_bytes = len(text.encode("utf-8", errors="replace"))
+    else:
+        sources = [("text", read_input(p, encoding)) if p == "-" else ("path", p) for p in paths]
+        n_bytes = None
+
+    if m is None:
+        if n_bytes is None:
+            n_bytes = sum(len(s[1]) if s[0] == "text" else _file_size(s[1]) for s in sources)
+        m = auto_table_size(n_bytes)
+
+    table = HashTable(m=m)
+    if tokenizer is None:
+        tokenizer = Tokenizer()
+    jobs = [(source, tokenizer, m, encoding) for source in sources]
+    if workers > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(min(workers, len(jobs))) as pool:
+            results = pool.map(count_job, jobs)
+    else:
+        results = map(count_job, jobs)
+
+    tokens = total_bytes = 0
+    for pairs, job_tokens, job_bytes in results:
+        for word, value in pairs:
+            table.increase(word, value)
+        tokens += job_tokens
+        total_bytes += job_bytes
+    return table, tokens, total_bytes
+
+
+def _file_size(path):
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        return f.tell()
+
+
+def write_output(table, fmt, order, out, run_size=1_000_000):
+    """
+    Write the counts to the text stream `out` as sorted text, CSV or JSON lines.
+
+    When the table holds at most `run_size` pairs they are sorted in memory
+    with sorted(); larger tables go through sorted_export.sorted_pairs,
+    which holds at most `run_size` of them in memory besides the table.
+    """
+    items = table.items()
+    head = list(itertools.islice(items, run_size + 1))
+    if len(head) <= run_size:
+        pairs = sorted(head, key=sort_key(order))
+    else:
+        pairs = sorted_pairs(itertools.chain(head, items), by=order, run_size=run_size)
+    if fmt == "text":
+        for word, value in pairs:
+            out.write(f"{word}: {value}\n")
+    elif fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(["word", "count"])
+        writer.writerows(pairs)
+    elif fmt == "jsonl":
+        for word, value in pairs:
+            out.write(json.dumps({"word": word, "count": value}, ensure_ascii=False) + "\n")
+    else:
+        raise ValueError(f"Unknown output format {fmt!r}")
+
+
+def expand_inputs(patterns):
+    """Expand glob patterns into a sorted list of paths; "-" stands for standard input."""
+    paths = []
+    for pattern in patterns:
+        if pattern == "-":
+            paths.append(pattern)
+            continue
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No input matches {pattern!r}")
+        paths.extend(matches)
+    return paths
+
+
+def load_stop_words(source):
+    """Stop words from a file of one word per line, the built-in English list for "english", or None."""
+    if source is None:
+        return None
+    if source == "english":
+        return ENGLISH_STOP_WORDS
+    text, _ = read_text(source)
+    return {line.strip() for line in text.splitlines() if line.strip()}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Count word frequencies with the chained HashTable.")
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="input files or glob patterns (default: standard input)")
+    parser.add_argument("--pattern", default=DEFAULT_PATTERN, help="tokenizer regex (default: %(default)s)")
+    parser.add_argument("--no-casefold", dest="casefold", action="store_false",
+                        help="keep the original case instead of case folding")
+    parser.add_argument("--normalize", choices=["NFC", "NFKC", "NFD", "NFKD"],
+                        help="Unicode normalization form applied before tokenizing")
+    parser.add_argument("--stop-words", metavar="FILE",
+                        help="file of words to skip, one per line, or 'english' for the built-in list")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("-m", "--table-size", default="auto",
+                        help="number of hash table slots, or 'auto' to size from the input")
+    parser.add_argument("--encoding", default="auto", help="input encoding, or 'auto' to detect it per file")
+    parser.add_argument("-f", "--format", choices=["text", "csv", "jsonl", "snapshot"], default="text")
+    parser.add_argument("--sort", choices=["count", "key"], default="count",
+                        help="order of text/csv/jsonl output")
+    parser.add_argument("--run-size", type=int, default=1_000_000,
+                        help="words sorted in memory at a time before spilling to disk")
+    parser.add_argument("-o", "--output", help="output file (default: standard output)")
+    parser.add_argument("--state", metavar="DIR",
+                        help="count incrementally: only bytes appended since the last run with this state")
+    parser.add_argument("--final", action="store_true",
+                        help="with --state, also count a trailing word not yet followed by whitespace")
+    parser.add_argument("--compact", action="store_true", help="with --state, fold the delta snapshots into the base")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print throughput statistics")
+    args = parser.parse_args(argv)
+    if args.format == "snapshot" and not args.output:
+        parser.error("--format snapshot needs --output")
+    if args.state and "-" in args.inputs:
+        parser.error("--state needs input files, not standard input")
+    if args.state and args.workers != 1:
+        parser.error("--state counts in a single process; --workers can't be used with it")
+    if args.table_size != "auto":
+        try:
+            args.table_size = int(args.table_size)
+        except ValueError:
+            parser.error("--table-size must be an integer or 'auto'")
+        if args.table_size < 1:
+            parser.error("--table-size must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tokenizer = Tokenizer(args.pattern, casefold=args.casefold, normalize=args.normalize,
+                          stop_words=load_stop_words(args.stop_words))
+    paths = expand_inputs(args.inputs)
+    m = None if args.table_size == "auto" else args.table_size
+    start = time.perf_counter()
+    if args.state:
+        if m is None:
+            m = auto_table_size(sum(_file_size(path) for path in paths))
+        counter = IncrementalCounter(args.state, tokenizer=tokenizer, m=m,
+                                     encoding=None if args.encoding == "auto" else args.encoding)
+        tokens, n_bytes = counter.update(paths, final=args.final)
+        if args.compact:
+            counter.compact()
+        table = counter.table()
+    else:
+        table, tokens, n_bytes = count(
+            paths,
+            tokenizer=tokenizer,
+            workers=args.workers,
+            m=m,
+            encoding=None if args.encoding == "auto" else args.encoding,
+        )
+    counted = time.perf_counter() - start
+
+    if args.format == "snapshot":
+        save_snapshot(table, args.output)
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            write_output(table, args.format, args.sort, out, args.run_size)
+    else:
+        write_output(table, args.format, args.sort, sys.stdout, args.run_size)
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        seconds = max(counted, 1e-9)
+        print(
+            f"{n_bytes / 2 ** 20:.2f} MB, {tokens} tokens, {len(table.list_all_keys())} distinct words, "
+            f"m={table.m}; counted in {counted:.3f} s ({n_bytes / 2 ** 20 / seconds:.2f} MB/s, "
+            f"{tokens / seconds:.0f} tokens/s), {elapsed:.3f} s total",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
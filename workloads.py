@@ -0,0 +1,38 @@
+import bisect
+import itertools
+import random
+
+
+def random_keys(n, seed=0):
+    """
+    Return n distinct integer keys in random order.
+    :param n: Number of keys.
+    :param seed: Seed for the random number generator.
+    """
+    rng = random.Random(seed)
+    keys = list(range(n))
+    rng.shuffle(keys)
+    return keys
+
+
+def sorted_keys(n):
+    """Return the keys 0..n-1 in ascending order (the worst case for an unbalanced tree)."""
+    return list(range(n))
+
+
+def zipf_keys(n, count, s=1.1, seed=0):
+    """
+    Draw `count` keys from 0..n-1 following a Zipf distribution.
+
+    Key k is drawn with probability proportional to 1 / (k + 1) ** s, so a few
+    small keys make up most of the stream.
+    :param n: Size of the key universe.
+    :param count: Number of keys to draw.
+    :param s: Skew exponent; larger values concentrate the draws on fewer keys.
+    :param seed: Seed for the random number generator.
+    """
+    rng = random.Random(seed)
+    cumulative = list(itertools.accumulate(1.0 / (k + 1) ** s for k in range(n)))
+    total = cumulative[-1]
+    return [min(bisect.bisect_left(cumulative, rng.random() * total), n - 1)
+            for _ in range(count)]